@@ -18,16 +18,37 @@ from collections.abc import Callable
 from typing import Any
 
 from camel.messages import BaseMessage
-from camel.models import ModelFactory
+from camel.models import BaseModelBackend, ModelFactory
 from camel.toolkits import FunctionTool, RegisteredAgentToolkit
 from camel.types import ModelPlatformType
 
+from app.agent.hedged_model import HedgedModelBackend
 from app.agent.listen_chat_agent import ListenChatAgent, logger
+from app.agent.model_router import ModelRoute, RoutedModelBackend
 from app.model.chat import AgentModelConfig, Chat
 from app.service.task import ActionCreateAgentData, Agents, get_task_lock
 from app.utils.event_loop_utils import _schedule_async_task
 
 
+def _create_model(
+    config: AgentModelConfig,
+    effective_config: dict[str, Any],
+    model_config: dict[str, Any],
+) -> BaseModelBackend:
+    """Create a further backend for an agent, e.g. a fallback provider,
+    taking unset fields from the agent's own model"""
+    return ModelFactory.create(
+        model_platform=config.model_platform
+        or effective_config["model_platform"],
+        model_type=config.model_type or effective_config["model_type"],
+        api_key=config.api_key or effective_config["api_key"],
+        url=config.api_url or effective_config["api_url"],
+        model_config_dict={**model_config, **(config.extra_params or {})}
+        or None,
+        timeout=600,
+    )
+
+
 def agent_model(
     agent_name: str,
     system_message: str | BaseMessage,
@@ -59,7 +80,9 @@ def agent_model(
     )
 
     # Determine model configuration - use custom config if provided,
-    # otherwise use task defaults
+    # then the role's override, otherwise use task defaults
+    if custom_model_config is None:
+        custom_model_config = options.role_model_config(agent_name)
     config_attrs = ["model_platform", "model_type", "api_key", "api_url"]
     effective_config = {}
 
@@ -144,6 +167,25 @@ def agent_model(
         timeout=600,  # 10 minutes
         **init_params,
     )
+    if options.model_routes:
+        model = RoutedModelBackend(
+            [ModelRoute(model)]
+            + [
+                ModelRoute(
+                    _create_model(route, effective_config, model_config),
+                    route.weight,
+                )
+                for route in options.model_routes
+            ]
+        )
+    if options.hedge_llm_calls:
+        fallback_config = options.hedge_fallback_model
+        fallback = (
+            _create_model(fallback_config, effective_config, model_config)
+            if fallback_config and fallback_config.has_custom_config()
+            else None
+        )
+        model = HedgedModelBackend(model, fallback)
 
     return ListenChatAgent(
         options.project_id,
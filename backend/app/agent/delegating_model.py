@@ -0,0 +1,60 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+"""
+Base of the model backends that wrap other backends
+"""
+
+from typing import Any
+
+from camel.models import BaseModelBackend
+from camel.utils import BaseTokenCounter
+
+
+class DelegatingModelBackend(BaseModelBackend):
+    """Model backend wrapping others, which agents see as its primary.
+
+    The primary's model type and config describe the wrapper, and its
+    token counter, token limit, streaming flag and provider-specific
+    attributes, e.g. clients, are read from it.
+
+    Args:
+        primary: The backend describing the wrapper.
+    """
+
+    def __init__(self, primary: BaseModelBackend):
+        super().__init__(
+            model_type=primary.model_type,
+            model_config_dict=primary.model_config_dict,
+            url=primary._url,
+            timeout=primary._timeout,
+            max_retries=primary._max_retries,
+        )
+        self.primary = primary
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "primary":
+            raise AttributeError(name)
+        return getattr(self.primary, name)
+
+    @property
+    def token_counter(self) -> BaseTokenCounter:
+        return self.primary.token_counter
+
+    @property
+    def token_limit(self) -> int:
+        return self.primary.token_limit
+
+    @property
+    def stream(self) -> bool:
+        return self.primary.stream
@@ -0,0 +1,234 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+"""
+Hedged model calls: a call running past its model's usual latency is
+duplicated, optionally on a fallback model, and the slower copy cancelled
+"""
+
+import asyncio
+import inspect
+import logging
+import math
+import threading
+import time
+from collections import deque
+from typing import Any
+
+from camel.models import BaseModelBackend
+from pydantic import BaseModel
+
+from app.agent.delegating_model import DelegatingModelBackend
+
+logger = logging.getLogger("hedged_model")
+
+
+class HedgeConfig(BaseModel):
+    enabled: bool = True
+    # Latency percentile after which a call is hedged
+    percentile: float = 0.95
+    # Completed calls needed before a model's latency is trusted
+    min_samples: int = 20
+    # Bounds of the wait before hedging, whatever the percentile says
+    min_delay_seconds: float = 2.0
+    max_delay_seconds: float = 120.0
+
+
+class LatencyTracker:
+    """Sliding window of recent call latencies per model"""
+
+    def __init__(self, window: int = 200):
+        self._window = window
+        self._samples: dict[str, deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, model: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.setdefault(
+                model, deque(maxlen=self._window)
+            )
+            samples.append(seconds)
+
+    def percentile(
+        self, model: str, q: float, min_samples: int = 1
+    ) -> float | None:
+        """Get a latency percentile, or None with too few samples"""
+        with self._lock:
+            samples = sorted(self._samples.get(model, ()))
+        if not samples or len(samples) < min_samples:
+            return None
+        index = max(0, math.ceil(q * len(samples)) - 1)
+        return samples[index]
+
+
+class HedgeBudget:
+    """Caps hedged calls at a share of all calls, so a slow provider does
+    not get double the load"""
+
+    def __init__(self, ratio: float = 0.1):
+        self.ratio = ratio
+        self.calls = 0
+        self.hedges = 0
+        self._lock = threading.Lock()
+
+    def record_call(self) -> None:
+        with self._lock:
+            self.calls += 1
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self.hedges + 1 > self.ratio * self.calls:
+                return False
+            self.hedges += 1
+            return True
+
+
+latency_tracker = LatencyTracker()
+hedge_budget = HedgeBudget()
+
+
+async def _discard(task: asyncio.Future) -> None:
+    """Cancel a losing call, closing its stream if it already returned one"""
+    if not task.done():
+        task.cancel()
+        return
+    if task.cancelled() or task.exception() is not None:
+        return
+    close = getattr(task.result(), "close", None)
+    if close is None:
+        return
+    try:
+        result = close()
+        if inspect.isawaitable(result):
+            await result
+    except Exception as e:
+        logger.debug(f"Failed to close losing stream: {e}")
+
+
+class HedgedModelBackend(DelegatingModelBackend):
+    """Model backend that hedges calls running past the model's usual
+    latency.
+
+    Async calls still running at the configured latency percentile of the
+    primary model are duplicated on the fallback model, or on the primary
+    model again without one. The first successful response wins and the
+    other call is cancelled. Hedges are bounded by a shared
+    :class:`HedgeBudget`. Sync calls are only timed, since a thread blocked
+    on a provider cannot be cancelled.
+
+    Args:
+        primary: The backend answering calls normally.
+        fallback: Optional backend used for the duplicate call.
+        config: When and how eagerly to hedge.
+        tracker: Latency history, shared across backends by default.
+        budget: Hedge budget, shared across backends by default.
+    """
+
+    def __init__(
+        self,
+        primary: BaseModelBackend,
+        fallback: BaseModelBackend | None = None,
+        config: HedgeConfig | None = None,
+        tracker: LatencyTracker | None = None,
+        budget: HedgeBudget | None = None,
+    ):
+        super().__init__(primary)
+        self.fallback = fallback
+        self.config = config or HedgeConfig()
+        self.tracker = tracker or latency_tracker
+        self.budget = budget or hedge_budget
+
+    def _hedge_delay(self) -> float | None:
+        if not self.config.enabled:
+            return None
+        latency = self.tracker.percentile(
+            str(self.primary.model_type),
+            self.config.percentile,
+            self.config.min_samples,
+        )
+        if latency is None:
+            return None
+        return min(
+            max(latency, self.config.min_delay_seconds),
+            self.config.max_delay_seconds,
+        )
+
+    def _run(self, messages, response_format=None, tools=None):
+        start = time.monotonic()
+        result = self.primary._run(messages, response_format, tools)
+        self.tracker.record(
+            str(self.primary.model_type), time.monotonic() - start
+        )
+        return result
+
+    async def _timed(
+        self,
+        backend: BaseModelBackend,
+        messages,
+        response_format,
+        tools,
+    ) -> Any:
+        start = time.monotonic()
+        try:
+            return await backend._arun(messages, response_format, tools)
+        finally:
+            # Cancelled calls are recorded too, as a lower bound, so the
+            # percentile does not drift down once slow calls get hedged
+            self.tracker.record(
+                str(backend.model_type), time.monotonic() - start
+            )
+
+    async def _arun(self, messages, response_format=None, tools=None):
+        self.budget.record_call()
+        delay = self._hedge_delay()
+        primary = asyncio.ensure_future(
+            self._timed(self.primary, messages, response_format, tools)
+        )
+        if delay is None:
+            return await primary
+
+        hedge: asyncio.Future | None = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done or not self.budget.try_spend():
+                return await primary
+
+            backend = self.fallback or self.primary
+            logger.info(
+                "Hedging slow model call",
+                extra={
+                    "model": str(self.primary.model_type),
+                    "hedge_model": str(backend.model_type),
+                    "delay": round(delay, 2),
+                },
+            )
+            hedge = asyncio.ensure_future(
+                self._timed(backend, messages, response_format, tools)
+            )
+            pending = {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        winner = task
+                        loser = hedge if winner is primary else primary
+                        await _discard(loser)
+                        return winner.result()
+            # Both calls failed, report the primary's error
+            return primary.result()
+        finally:
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
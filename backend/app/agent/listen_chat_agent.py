@@ -15,7 +15,10 @@
 import asyncio
 import json
 import logging
+import time
+import uuid
 from collections.abc import Callable
+from contextlib import contextmanager
 from threading import Event
 from typing import Any
 
@@ -25,7 +28,7 @@ from camel.agents.chat_agent import (
     AsyncStreamingChatAgentResponse,
     StreamingChatAgentResponse,
 )
-from camel.memories import AgentMemory
+from camel.memories import AgentMemory, MemoryRecord
 from camel.messages import BaseMessage
 from camel.models import BaseModelBackend, ModelManager, ModelProcessingError
 from camel.responses import ChatAgentResponse
@@ -43,14 +46,48 @@ from app.service.task import (
     ActionDeactivateAgentData,
     ActionDeactivateToolkitData,
     get_task_lock,
+    get_task_lock_if_exists,
     set_process_task,
 )
+from app.utils.cancellation import (
+    CancellationToken,
+    TaskCancelledError,
+    current_token,
+    use_token,
+)
 from app.utils.event_loop_utils import _schedule_async_task
+from app.utils.metrics import record_llm_call
+from app.utils.model_usage import cached_prompt_tokens
+from app.utils.telemetry.spans import (
+    ATTR_AGENT_ID,
+    ATTR_AGENT_NAME,
+    ATTR_MODEL_TYPE,
+    SPAN_AGENT_STEP,
+    SPAN_LLM_CALL,
+    set_token_usage,
+    span,
+)
 
 # Logger for agent tracking
 logger = logging.getLogger("agent")
 
 
+def _needs_session_clone(toolkit: Any) -> bool:
+    r"""Whether a toolkit must be cloned for every new agent session."""
+    return hasattr(toolkit, "clone_for_new_session")
+
+
+def _snapshot_records(memory: AgentMemory) -> list[dict[str, Any]] | None:
+    r"""Shallow copy of the stored records of an in-memory chat history.
+
+    Stored record dicts are replaced, never changed in place, so sharing
+    them with the snapshot is safe. Returns None for other memories.
+    """
+    block = getattr(memory, "_chat_history_block", None)
+    records = getattr(getattr(block, "storage", None), "memory_list", None)
+    return list(records) if isinstance(records, list) else None
+
+
 class ListenChatAgent(ChatAgent):
     def __init__(
         self,
@@ -120,6 +157,47 @@ class ListenChatAgent(ChatAgent):
         self.agent_name = agent_name
 
     process_task_id: str = ""
+    _step_started: float = 0.0
+
+    @property
+    def cancel_token(self) -> CancellationToken | None:
+        """The token for work this agent starts now, if any. Steps keep it
+        for their tool calls and streamed chunks, see
+        :meth:`TaskLock.work_token`."""
+        task_lock = get_task_lock_if_exists(self.api_task_id)
+        if task_lock is None:
+            return None
+        return task_lock.work_token()
+
+    def _raise_if_cancelled(self) -> None:
+        """Stop a tool call whose step's token is already cancelled"""
+        token = current_token() or self.cancel_token
+        if token is not None:
+            token.raise_if_cancelled()
+
+    @contextmanager
+    def _stop_on_cancel(self, token: CancellationToken | None):
+        """Make the step loop stop at its next iteration once the step's
+        token is cancelled.
+
+        CAMEL checks ``stop_event`` between iterations. A private event is
+        swapped in for the step, because clones share the original one.
+        """
+        if token is None:
+            yield
+            return
+        token.raise_if_cancelled()
+        shared_event = self.stop_event
+        step_event = Event()
+        if shared_event is not None and shared_event.is_set():
+            step_event.set()
+        remove = token.add_callback(step_event.set)
+        self.stop_event = step_event
+        try:
+            yield
+        finally:
+            remove()
+            self.stop_event = shared_event
 
     def _send_agent_deactivate(self, message: str, tokens: int) -> None:
         """Send agent deactivation event to the frontend.
@@ -143,6 +221,69 @@ class ListenChatAgent(ChatAgent):
             )
         )
 
+    @property
+    def _usage_role(self) -> str:
+        return getattr(self.agent_name, "value", self.agent_name)
+
+    def _record_model_usage(self, response) -> None:
+        """Account the latency and tokens of the finished step to this
+        agent's role, for the project's per-role usage report"""
+        task_lock = get_task_lock_if_exists(self.api_task_id)
+        if task_lock is None or response is None:
+            return
+        task_lock.model_usage.record(
+            self._usage_role,
+            str(self.model_backend.model_type),
+            time.monotonic() - self._step_started,
+            response.info.get("usage") or response.info.get("token_usage"),
+        )
+
+    def _update_token_cache(
+        self, usage_dict: dict[str, Any], message_count: int
+    ) -> None:
+        # Called with the raw usage of every non-streamed model call, the
+        # only place the provider's prompt cache details are still present
+        super()._update_token_cache(usage_dict, message_count)
+        task_lock = get_task_lock_if_exists(self.api_task_id)
+        cached = cached_prompt_tokens(usage_dict)
+        if task_lock is not None and cached:
+            task_lock.model_usage.record_cache_hit(
+                self._usage_role, str(self.model_backend.model_type), cached
+            )
+
+    def _span_attributes(self) -> dict[str, Any]:
+        return {
+            ATTR_AGENT_NAME: self.agent_name,
+            ATTR_AGENT_ID: self.agent_id,
+            ATTR_MODEL_TYPE: str(self.model_backend.model_type),
+        }
+
+    def _get_model_response(self, *args, **kwargs):
+        started = time.monotonic()
+        model = str(self.model_backend.model_type)
+        with span(SPAN_LLM_CALL, self._span_attributes()) as call_span:
+            try:
+                response = super()._get_model_response(*args, **kwargs)
+            except Exception:
+                record_llm_call(model, time.monotonic() - started, None, True)
+                raise
+            set_token_usage(call_span, response.usage_dict)
+        record_llm_call(model, time.monotonic() - started, response.usage_dict)
+        return response
+
+    async def _aget_model_response(self, *args, **kwargs):
+        started = time.monotonic()
+        model = str(self.model_backend.model_type)
+        with span(SPAN_LLM_CALL, self._span_attributes()) as call_span:
+            try:
+                response = await super()._aget_model_response(*args, **kwargs)
+            except Exception:
+                record_llm_call(model, time.monotonic() - started, None, True)
+                raise
+            set_token_usage(call_span, response.usage_dict)
+        record_llm_call(model, time.monotonic() - started, response.usage_dict)
+        return response
+
     @staticmethod
     def _extract_tokens(response) -> int:
         """Extract total token count from a response chunk.
@@ -162,13 +303,14 @@ class ListenChatAgent(ChatAgent):
         )
         return usage_info.get("total_tokens", 0)
 
-    def _stream_chunks(self, response_gen):
+    def _stream_chunks(self, response_gen, token: CancellationToken | None):
         """Generator that wraps a streaming response.
 
         Sends chunks to frontend.
 
         Args:
             response_gen: The original streaming response generator
+            token: The step's cancellation token
 
         Yields:
             Each chunk from the original generator
@@ -180,23 +322,37 @@ class ListenChatAgent(ChatAgent):
         accumulated_content = ""
         last_chunk = None
 
+        chunks = iter(response_gen)
         try:
-            for chunk in response_gen:
+            while True:
+                # Tools run while the next chunk is produced
+                with use_token(token):
+                    chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                if token is not None and token.cancelled:
+                    if hasattr(response_gen, "close"):
+                        response_gen.close()
+                    raise TaskCancelledError(token.reason)
                 last_chunk = chunk
                 if chunk.msg and chunk.msg.content:
                     accumulated_content += chunk.msg.content
                 yield chunk
         finally:
             total_tokens = self._extract_tokens(last_chunk)
+            self._record_model_usage(last_chunk)
             self._send_agent_deactivate(accumulated_content, total_tokens)
 
-    async def _astream_chunks(self, response_gen):
+    async def _astream_chunks(
+        self, response_gen, token: CancellationToken | None
+    ):
         """Async generator that wraps a streaming response.
 
         Sends chunks to frontend.
 
         Args:
             response_gen: The original async streaming response generator
+            token: The step's cancellation token
 
         Yields:
             Each chunk from the original generator
@@ -204,8 +360,18 @@ class ListenChatAgent(ChatAgent):
         accumulated_content = ""
         last_chunk = None
 
+        chunks = aiter(response_gen)
         try:
-            async for chunk in response_gen:
+            while True:
+                # Tools run while the next chunk is produced
+                with use_token(token):
+                    chunk = await anext(chunks, None)
+                if chunk is None:
+                    break
+                if token is not None and token.cancelled:
+                    if hasattr(response_gen, "aclose"):
+                        await response_gen.aclose()
+                    raise TaskCancelledError(token.reason)
                 last_chunk = chunk
                 if chunk.msg and chunk.msg.content:
                     delta_content = chunk.msg.content
@@ -213,6 +379,7 @@ class ListenChatAgent(ChatAgent):
                 yield chunk
         finally:
             total_tokens = self._extract_tokens(last_chunk)
+            self._record_model_usage(last_chunk)
             self._send_agent_deactivate(accumulated_content, total_tokens)
 
     def step(
@@ -248,8 +415,23 @@ class ListenChatAgent(ChatAgent):
         logger.info(
             f"Agent {self.agent_name} starting step with message: {msg}"
         )
+        token = self.cancel_token
+        self._step_started = time.monotonic()
         try:
-            res = super().step(input_message, response_format)
+            with (
+                span(SPAN_AGENT_STEP, self._span_attributes()) as step_span,
+                self._stop_on_cancel(token),
+                use_token(token),
+            ):
+                res = super().step(input_message, response_format)
+                if isinstance(res, ChatAgentResponse):
+                    set_token_usage(step_span, res.info.get("usage"))
+        except TaskCancelledError as e:
+            res = None
+            error_info = e
+            message = f"Cancelled: {e}"
+            logger.info(f"Agent {self.agent_name} step cancelled: {e}")
+            total_tokens = 0
         except ModelProcessingError as e:
             res = None
             error_info = e
@@ -278,7 +460,9 @@ class ListenChatAgent(ChatAgent):
         if res is not None:
             if isinstance(res, StreamingChatAgentResponse):
                 # Use reusable stream wrapper to send chunks to frontend
-                return StreamingChatAgentResponse(self._stream_chunks(res))
+                return StreamingChatAgentResponse(
+                    self._stream_chunks(res, token)
+                )
 
             message = res.msg.content if res.msg else ""
             usage_info = (
@@ -291,6 +475,7 @@ class ListenChatAgent(ChatAgent):
                 f"Agent {self.agent_name} completed step, "
                 f"tokens used: {total_tokens}"
             )
+            self._record_model_usage(res)
 
         assert message is not None
 
@@ -347,13 +532,32 @@ class ListenChatAgent(ChatAgent):
             f"Agent {self.agent_name} starting async step with message: {msg}"
         )
 
+        token = self.cancel_token
+        self._step_started = time.monotonic()
         try:
-            res = await super().astep(input_message, response_format)
+            with (
+                span(SPAN_AGENT_STEP, self._span_attributes()) as step_span,
+                use_token(token),
+            ):
+                if token is None:
+                    res = await super().astep(input_message, response_format)
+                else:
+                    res = await token.run(
+                        super().astep(input_message, response_format)
+                    )
+                if isinstance(res, ChatAgentResponse):
+                    set_token_usage(step_span, res.info.get("usage"))
             if isinstance(res, AsyncStreamingChatAgentResponse):
                 # Use reusable async stream wrapper to send chunks to frontend
                 return AsyncStreamingChatAgentResponse(
-                    self._astream_chunks(res)
+                    self._astream_chunks(res, token)
                 )
+        except TaskCancelledError as e:
+            res = None
+            error_info = e
+            message = f"Cancelled: {e}"
+            logger.info(f"Agent {self.agent_name} async step cancelled: {e}")
+            total_tokens = 0
         except ModelProcessingError as e:
             res = None
             error_info = e
@@ -394,6 +598,7 @@ class ListenChatAgent(ChatAgent):
                 f"Agent {self.agent_name} completed step, "
                 f"tokens used: {total_tokens}"
             )
+            self._record_model_usage(res)
 
         # Send deactivation for all non-streaming cases (success or error)
         # Streaming responses handle deactivation in _astream_chunks
@@ -442,6 +647,7 @@ class ListenChatAgent(ChatAgent):
 
         try:
             task_lock = get_task_lock(self.api_task_id)
+            self._raise_if_cancelled()
 
             toolkit_name = (
                 tool._toolkit_name
@@ -604,6 +810,7 @@ class ListenChatAgent(ChatAgent):
                 )
             )
         try:
+            self._raise_if_cancelled()
             # Set process_task context for all tool executions
             with set_process_task(self.process_task_id):
                 # Try different invocation paths in order of preference
@@ -696,6 +903,84 @@ class ListenChatAgent(ChatAgent):
             extra_content=tool_call_request.extra_content,
         )
 
+    @property
+    def memory(self) -> AgentMemory:
+        r"""Returns the agent memory.
+
+        Records inherited through :meth:`clone` are rebuilt and written
+        lazily, on the first access, so pooled clones that are reset before
+        use never pay for the copy.
+        """
+        pending = self.__dict__.pop("_pending_memory_records", None)
+        if pending:
+            self._memory.write_records(
+                [MemoryRecord.from_dict(record) for record in pending]
+            )
+        return self._memory
+
+    @memory.setter
+    def memory(self, value: AgentMemory) -> None:
+        self.__dict__.pop("_pending_memory_records", None)
+        ChatAgent.memory.fset(self, value)
+
+    def _clone_tools(
+        self,
+    ) -> tuple[list[FunctionTool], list[RegisteredAgentToolkit]]:
+        r"""Clone tools, sharing everything that holds no session state.
+
+        Unlike ``ChatAgent._clone_tools`` this reuses the existing
+        :class:`FunctionTool` instances (and their already validated
+        schemas) for plain functions and for toolkits that cannot be
+        cloned. Only toolkits exposing ``clone_for_new_session`` get a
+        fresh instance.
+
+        Returns:
+            tuple[list[FunctionTool], list[RegisteredAgentToolkit]]: The
+                tools for the clone and the toolkits that need agent
+                registration.
+        """
+        cloned_tools: list[FunctionTool] = []
+        toolkits_to_register: list[RegisteredAgentToolkit] = []
+        cloned_toolkits: dict[int, Any] = {}
+
+        for tool in self._internal_tools.values():
+            toolkit = getattr(tool.func, "__self__", None)
+            if toolkit is None or not _needs_session_clone(toolkit):
+                cloned_tools.append(tool)
+                continue
+
+            toolkit_id = id(toolkit)
+            if toolkit_id not in cloned_toolkits:
+                try:
+                    new_toolkit = toolkit.clone_for_new_session(
+                        str(uuid.uuid4())[:8]
+                    )
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to clone toolkit "
+                        f"{toolkit.__class__.__name__}: {e}"
+                    )
+                    new_toolkit = toolkit
+                if new_toolkit is not toolkit and isinstance(
+                    new_toolkit, RegisteredAgentToolkit
+                ):
+                    toolkits_to_register.append(new_toolkit)
+                cloned_toolkits[toolkit_id] = new_toolkit
+
+            new_toolkit = cloned_toolkits[toolkit_id]
+            new_method = getattr(new_toolkit, tool.func.__name__, None)
+            if new_toolkit is toolkit or new_method is None:
+                cloned_tools.append(tool)
+                continue
+            cloned_tools.append(
+                FunctionTool(
+                    func=new_method,
+                    openai_tool_schema=tool.openai_tool_schema,
+                )
+            )
+
+        return cloned_tools, toolkits_to_register
+
     def clone(self, with_memory: bool = False) -> ChatAgent:
         """Please see super.clone()"""
         system_message = None if with_memory else self._original_system_message
@@ -714,7 +999,6 @@ class ListenChatAgent(ChatAgent):
                 self.memory.get_context_creator(), "token_limit", None
             ),
             output_language=self._output_language,
-            tools=cloned_tools,
             toolkits_to_register_agent=toolkits_to_register,
             external_tools=[
                 schema for schema in self._external_tool_schemas.values()
@@ -732,14 +1016,26 @@ class ListenChatAgent(ChatAgent):
             stream_accumulate=self.stream_accumulate,
         )
 
+        # Tools are attached after construction so the shared schemas are
+        # not re-validated for every clone
+        new_agent._internal_tools = {
+            tool.openai_tool_schema["function"]["name"]: tool
+            for tool in cloned_tools
+        }
         new_agent.process_task_id = self.process_task_id
 
-        # Copy memory if requested
+        # Snapshot memory if requested; records are rebuilt and written on
+        # first use. Memories not backed by an in-memory list are copied now.
         if with_memory:
-            # Get all records from the current memory
-            context_records = self.memory.retrieve()
-            # Write them to the new agent's memory
-            for context_record in context_records:
-                new_agent.memory.write_record(context_record.memory_record)
+            records = _snapshot_records(self.memory)
+            if records is not None:
+                new_agent._pending_memory_records = records
+            else:
+                new_agent.memory.write_records(
+                    [
+                        context_record.memory_record
+                        for context_record in self.memory.retrieve()
+                    ]
+                )
 
         return new_agent
@@ -0,0 +1,196 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+"""
+Model backend routing each call across several providers by observed
+latency, error rate and rate limits, failing over when one is down
+"""
+
+import logging
+import threading
+import time
+
+from camel.models import BaseModelBackend
+from openai import BadRequestError, RateLimitError, UnprocessableEntityError
+
+from app.agent.delegating_model import DelegatingModelBackend
+
+logger = logging.getLogger("model_router")
+
+# Errors caused by the request itself, which every provider would reject
+_REQUEST_ERRORS = (BadRequestError, UnprocessableEntityError)
+
+
+class RouteStats:
+    """Moving averages of one provider's latency and error rate"""
+
+    def __init__(self, alpha: float = 0.2):
+        self.alpha = alpha
+        self.latency: float | None = None
+        self.error_rate = 0.0
+        self.cooldown_until = 0.0
+        self._lock = threading.Lock()
+
+    def record_success(self, seconds: float) -> None:
+        with self._lock:
+            if self.latency is None:
+                self.latency = seconds
+            else:
+                self.latency += self.alpha * (seconds - self.latency)
+            self.error_rate *= 1 - self.alpha
+
+    def record_failure(self, cooldown_seconds: float) -> None:
+        with self._lock:
+            self.error_rate += self.alpha * (1 - self.error_rate)
+            self.cooldown_until = max(
+                self.cooldown_until, time.monotonic() + cooldown_seconds
+            )
+
+    @property
+    def cooling_down(self) -> bool:
+        return time.monotonic() < self.cooldown_until
+
+
+class ModelRoute:
+    """A provider endpoint the router may send calls to.
+
+    Args:
+        backend: The model backend of the provider.
+        weight: Preference for this route; higher weights win at equal
+            latency.
+    """
+
+    def __init__(self, backend: BaseModelBackend, weight: float = 1.0):
+        self.backend = backend
+        self.weight = max(weight, 1e-6)
+        self.stats = RouteStats()
+
+    @property
+    def name(self) -> str:
+        return f"{self.backend.model_type}@{self.backend._url or 'default'}"
+
+    def score(self, error_penalty: float) -> float:
+        # Unmeasured routes score best so every route gets measured
+        latency = self.stats.latency or 0.0
+        return (
+            latency * (1 + error_penalty * self.stats.error_rate) / self.weight
+        )
+
+
+def _retry_after(error: Exception) -> float | None:
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class RoutedModelBackend(DelegatingModelBackend):
+    """Model backend spreading calls over several providers.
+
+    Each call goes to the healthy route with the lowest latency, scaled up
+    by its recent error rate and down by its weight, and fails over to the
+    next route when it errors. Routes that failed, or were rate limited,
+    are skipped until their cooldown ends unless no other route is left.
+    Errors caused by the request itself are raised without failing over.
+
+    The first route's backend is the primary describing the router to
+    agents.
+
+    Args:
+        routes: Routes in order of preference for ties.
+        error_penalty: How strongly the error rate inflates a route's
+            latency.
+        cooldown_seconds: How long a failed route is avoided.
+    """
+
+    def __init__(
+        self,
+        routes: list[ModelRoute],
+        error_penalty: float = 4.0,
+        cooldown_seconds: float = 30.0,
+    ):
+        if not routes:
+            raise ValueError("RoutedModelBackend needs at least one route")
+        super().__init__(routes[0].backend)
+        self.routes = routes
+        self.error_penalty = error_penalty
+        self.cooldown_seconds = cooldown_seconds
+
+    def ranked_routes(self) -> list[ModelRoute]:
+        """Get the routes in the order the next call will try them"""
+        indexed = enumerate(self.routes)
+        return [
+            route
+            for _, route in sorted(
+                indexed,
+                key=lambda item: (
+                    item[1].stats.cooling_down,
+                    item[1].score(self.error_penalty),
+                    item[0],
+                ),
+            )
+        ]
+
+    def _record_failure(self, route: ModelRoute, error: Exception) -> None:
+        cooldown = self.cooldown_seconds
+        if isinstance(error, RateLimitError):
+            cooldown = _retry_after(error) or cooldown
+        route.stats.record_failure(cooldown)
+        logger.warning(
+            "Model route failed, failing over",
+            extra={
+                "route": route.name,
+                "error": f"{type(error).__name__}: {error}",
+                "cooldown": cooldown,
+            },
+        )
+
+    def _run(self, messages, response_format=None, tools=None):
+        last_error: Exception | None = None
+        for route in self.ranked_routes():
+            start = time.monotonic()
+            try:
+                result = route.backend._run(messages, response_format, tools)
+            except _REQUEST_ERRORS:
+                raise
+            except Exception as e:
+                self._record_failure(route, e)
+                last_error = e
+                continue
+            route.stats.record_success(time.monotonic() - start)
+            return result
+        if last_error is None:
+            raise RuntimeError("No model route was tried")
+        raise last_error
+
+    async def _arun(self, messages, response_format=None, tools=None):
+        last_error: Exception | None = None
+        for route in self.ranked_routes():
+            start = time.monotonic()
+            try:
+                result = await route.backend._arun(
+                    messages, response_format, tools
+                )
+            except _REQUEST_ERRORS:
+                raise
+            except Exception as e:
+                self._record_failure(route, e)
+                last_error = e
+                continue
+            route.stats.record_success(time.monotonic() - start)
+            return result
+        if last_error is None:
+            raise RuntimeError("No model route was tried")
+        raise last_error
@@ -0,0 +1,133 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import asyncio
+import hmac
+import logging
+import os
+import time
+
+from fastapi import APIRouter, Header
+from fastapi.responses import PlainTextResponse
+from pydantic import BaseModel, Field
+
+from app.component import code
+from app.exception.exception import NoPermissionException, UserException
+from app.model.chat import Status
+from app.service.task import task_locks
+from app.utils.sampling_profiler import SamplingProfiler
+
+logger = logging.getLogger("admin_controller")
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+# Admin endpoints are disabled unless this token is set
+ENV_ADMIN_TOKEN = "EIGENT_ADMIN_TOKEN"
+
+# Longest profile, also the cap when profiling until a project finishes
+MAX_PROFILE_SECONDS = 600
+
+_profiler: SamplingProfiler | None = None
+
+
+def _check_admin(token: str | None) -> None:
+    expected = os.environ.get(ENV_ADMIN_TOKEN)
+    if not expected:
+        raise NoPermissionException(
+            f"Admin endpoints are disabled, set {ENV_ADMIN_TOKEN}"
+        )
+    if not token or not hmac.compare_digest(token, expected):
+        raise NoPermissionException("Invalid admin token")
+
+
+def _project_running(project_id: str) -> bool:
+    task_lock = task_locks.get(project_id)
+    return task_lock is not None and task_lock.status != Status.done
+
+
+class ProfileRequest(BaseModel):
+    # Profile for this long, or at most this long with a project id
+    seconds: float = Field(default=30, gt=0, le=MAX_PROFILE_SECONDS)
+    # Profile until this project's current run finishes
+    project_id: str | None = None
+    # Seconds between samples
+    interval: float = Field(default=0.01, ge=0.001, le=1)
+    # Share of one core sampling may use
+    max_overhead: float = Field(default=0.05, gt=0, le=0.5)
+    # Also count threads blocked waiting for I/O or locks
+    include_idle: bool = False
+
+
+@router.post("/profile", name="profile backend")
+async def profile(
+    data: ProfileRequest, x_admin_token: str | None = Header(default=None)
+):
+    """Sample all threads' stacks and return them as folded stacks.
+
+    Runs for the requested seconds, or until the given project's run
+    finishes, or until stopped with ``DELETE /admin/profile``. The result
+    opens directly in speedscope or flamegraph.pl.
+    """
+    global _profiler
+    _check_admin(x_admin_token)
+    if _profiler is not None and _profiler.running:
+        raise UserException(code.error, "A profile is already running")
+    if data.project_id and not _project_running(data.project_id):
+        raise UserException(code.not_found, "Project is not running")
+
+    profiler = SamplingProfiler(
+        interval=data.interval,
+        max_overhead=data.max_overhead,
+        include_idle=data.include_idle,
+    )
+    _profiler = profiler
+    profiler.start()
+    logger.info(
+        "Profiling started",
+        extra={"seconds": data.seconds, "project_id": data.project_id},
+    )
+    deadline = time.monotonic() + data.seconds
+    try:
+        while profiler.running and time.monotonic() < deadline:
+            if data.project_id and not _project_running(data.project_id):
+                break
+            await asyncio.sleep(min(0.5, max(0, deadline - time.monotonic())))
+    finally:
+        await asyncio.to_thread(profiler.stop)
+
+    logger.info(
+        "Profiling finished",
+        extra={
+            "samples": profiler.samples,
+            "seconds": round(profiler.stopped_at - profiler.started_at, 3),
+        },
+    )
+    return PlainTextResponse(
+        profiler.folded(),
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="profile-{int(time.time())}.folded"'
+            )
+        },
+    )
+
+
+@router.delete("/profile", name="stop profile")
+async def stop_profile(x_admin_token: str | None = Header(default=None)):
+    """Stop the running profile early; its request then returns"""
+    _check_admin(x_admin_token)
+    if _profiler is None or not _profiler.running:
+        raise UserException(code.error, "No profile is running")
+    await asyncio.to_thread(_profiler.stop)
+    return {"samples": _profiler.samples}
@@ -42,6 +42,7 @@ from app.service.task import (
     ActionImproveData,
     ActionInstallMcpData,
     ActionRemoveTaskData,
+    ActionResumeCheckpointData,
     ActionSkipTaskData,
     ActionStopData,
     ActionSupplementData,
@@ -51,6 +52,14 @@ from app.service.task import (
     set_current_task_id,
     task_locks,
 )
+from app.utils.attachment_cache import attachment_cache
+from app.utils.checkpoint import checkpoint_store
+from app.utils.telemetry.spans import (
+    ATTR_BYTES_OUT,
+    ATTR_SSE_STEP,
+    SPAN_SSE_SEND,
+    start_span,
+)
 
 router = APIRouter()
 
@@ -99,6 +108,14 @@ async def _cleanup_task_lock_safe(task_lock, reason: str) -> bool:
         return False
 
 
+def _sse_step(event: str) -> str:
+    """Get the step of an event formatted by sse_json"""
+    prefix = 'data: {"step": "'
+    if not event.startswith(prefix):
+        return ""
+    return event[len(prefix) : event.find('"', len(prefix))]
+
+
 async def timeout_stream_wrapper(
     stream_generator,
     timeout_seconds: int = SSE_TIMEOUT_SECONDS,
@@ -123,7 +140,20 @@ async def timeout_stream_wrapper(
                     generator.__anext__(), timeout=remaining_timeout
                 )
                 last_data_time = time.time()
-                yield data
+                send_span = start_span(SPAN_SSE_SEND)
+                if send_span.is_recording():
+                    send_span.set_attributes(
+                        {
+                            ATTR_SSE_STEP: _sse_step(data),
+                            ATTR_BYTES_OUT: len(data.encode()),
+                        }
+                    )
+                # Ends once the client took the event, so the span
+                # covers backpressure from a slow consumer
+                try:
+                    yield data
+                finally:
+                    send_span.end()
             except TimeoutError:
                 chat_logger.warning(
                     "SSE timeout: No data received, closing connection",
@@ -163,19 +193,12 @@ async def timeout_stream_wrapper(
         raise
 
 
-@router.post("/chat", name="start chat")
-async def post(data: Chat, request: Request):
-    chat_logger.info(
-        "Starting new chat session",
-        extra={
-            "project_id": data.project_id,
-            "task_id": data.task_id,
-            "user": data.email,
-        },
-    )
-
-    task_lock = get_or_create_task_lock(data.project_id)
+def _setup_chat_environment(data: Chat) -> Path:
+    """Apply the chat's environment settings and create its log folder.
 
+    Returns:
+        The CAMEL log directory for this task
+    """
     # Set user-specific environment path for this thread
     set_user_env_path(data.env_path)
     # Load environment with validated path
@@ -218,6 +241,28 @@ async def post(data: Chat, request: Request):
 
     if data.is_cloud():
         os.environ["cloud_api_key"] = data.api_key
+    return camel_log
+
+
+@router.post("/chat", name="start chat")
+async def post(data: Chat, request: Request):
+    chat_logger.info(
+        "Starting new chat session",
+        extra={
+            "project_id": data.project_id,
+            "task_id": data.task_id,
+            "user": data.email,
+        },
+    )
+
+    task_lock = get_or_create_task_lock(data.project_id)
+    camel_log = _setup_chat_environment(data)
+    if data.attaches and data.preingest_attachments:
+        # Hashing large files would block the event loop, so scheduling
+        # runs on a thread; nothing waits for it
+        asyncio.get_running_loop().run_in_executor(
+            None, attachment_cache.prefetch, data.attaches
+        )
 
     # Set the initial current_task_id in task_lock
     set_current_task_id(data.project_id, data.task_id)
@@ -243,6 +288,39 @@ async def post(data: Chat, request: Request):
     )
 
 
+@router.post("/chat/{project_id}/resume", name="resume chat")
+async def resume(project_id: str, data: Chat, request: Request):
+    """Resume a project from its last checkpoint, re-running only the
+    subtasks that had not finished"""
+    checkpoint = await asyncio.to_thread(checkpoint_store.load, project_id)
+    if checkpoint is None:
+        raise UserException(code.error, "No checkpoint found for project")
+    existing = task_locks.get(project_id)
+    if existing is not None:
+        if existing.status != Status.done:
+            raise UserException(code.error, "Project is still running")
+        # A stopped run keeps its lock; the resumed run gets a fresh one
+        await delete_task_lock(project_id)
+
+    data.project_id = project_id
+    data.task_id = checkpoint["task"]["id"]
+    chat_logger.info(
+        "Resuming chat from checkpoint",
+        extra={"project_id": project_id, "task_id": data.task_id},
+    )
+
+    task_lock = get_or_create_task_lock(project_id)
+    _setup_chat_environment(data)
+    set_current_task_id(project_id, data.task_id)
+    await task_lock.put_queue(ActionResumeCheckpointData())
+    return StreamingResponse(
+        timeout_stream_wrapper(
+            step_solve(data, request, task_lock), task_lock=task_lock
+        ),
+        media_type="text/event-stream",
+    )
+
+
 @router.post("/chat/{id}", name="improve chat")
 def improve(id: str, data: SupplementChat):
     chat_logger.info(
@@ -368,6 +446,8 @@ def stop(id: str):
             f" task_lock.id: {task_lock.id},"
             f" task_lock.status: {task_lock.status}"
         )
+        # Interrupt in-flight work right away, the queue may be busy
+        task_lock.cancel_running_work("stop")
         chat_logger.info(
             "[STOP-BUTTON] Queueing"
             " ActionStopData(Action.stop)"
@@ -391,6 +471,20 @@ def stop(id: str):
     return Response(status_code=204)
 
 
+@router.get("/chat/{id}/model-usage", name="model usage by role")
+def model_usage(id: str):
+    """Model latency, tokens and cost of each agent role so far"""
+    task_lock = get_task_lock(id)
+    return task_lock.model_usage.report()
+
+
+@router.get("/chat/{id}/tool-stats", name="tool stats")
+def tool_stats(id: str):
+    """Latency, payload sizes and errors of each tool so far"""
+    task_lock = get_task_lock(id)
+    return task_lock.tool_stats.report()
+
+
 @router.post("/chat/{id}/human-reply")
 def human_reply(id: str, data: HumanReply):
     chat_logger.info(
@@ -459,6 +553,8 @@ def remove_task(project_id: str, task_id: str):
         f"Removing task {task_id} from workforce for project_id: {project_id}"
     )
     task_lock = get_task_lock(project_id)
+    # Interrupt the subtask right away if it is already running
+    task_lock.cancel_subtask(task_id, "removed")
 
     try:
         # Queue the remove task action
@@ -510,6 +606,9 @@ def skip_task(project_id: str):
         f" {task_lock.status}"
     )
 
+    # Interrupt in-flight work right away, the queue may be busy
+    task_lock.cancel_running_work("skip_task")
+
     try:
         # Queue the skip task action - this will
         # preserve context for multi-turn
@@ -0,0 +1,106 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import os
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.component import code
+from app.exception.exception import UserException
+from app.service.task import task_locks
+from app.utils.loop_watchdog import loop_watchdog
+from app.utils.metrics import registry
+from app.utils.telemetry.workforce_metrics import get_trace_buffer
+from app.utils.toolkit.hybrid_browser_toolkit import (
+    websocket_connection_pool,
+)
+
+router = APIRouter(tags=["Metrics"])
+
+
+def _task_locks():
+    return [({}, len(task_locks))]
+
+
+def _queue_depths():
+    return [
+        ({"project_id": project_id}, lock.queue.qsize())
+        for project_id, lock in list(task_locks.items())
+    ]
+
+
+def _subprocesses():
+    try:
+        import psutil
+    except ImportError:
+        return []
+    try:
+        children = psutil.Process(os.getpid()).children(recursive=True)
+    except psutil.Error:
+        return []
+    return [({}, len(children))]
+
+
+def _browser_sessions():
+    return [({}, len(websocket_connection_pool._connections))]
+
+
+def _loop_lag():
+    if not loop_watchdog.running:
+        return []
+    return [({}, loop_watchdog.lag)]
+
+
+registry.gauge("eigent_task_locks", "Live project task locks", _task_locks)
+registry.gauge(
+    "eigent_task_queue_depth",
+    "Actions waiting in a project's queue",
+    _queue_depths,
+)
+registry.gauge(
+    "eigent_subprocesses",
+    "Processes started by the backend that are still running",
+    _subprocesses,
+)
+registry.gauge(
+    "eigent_browser_sessions",
+    "Open browser toolkit WebSocket sessions",
+    _browser_sessions,
+)
+registry.gauge(
+    "eigent_event_loop_lag_seconds",
+    "Lag of the latest event loop watchdog heartbeat",
+    _loop_lag,
+)
+
+
+@router.get("/metrics", name="runtime metrics")
+def metrics():
+    """Runtime metrics in the Prometheus text exposition format"""
+    return PlainTextResponse(
+        registry.render(), media_type="text/plain; version=0.0.4"
+    )
+
+
+@router.get("/traces", name="buffered trace spans")
+def traces(trace_id: str | None = None, limit: int = 500):
+    """Latest finished spans kept in memory, optionally of one trace"""
+    buffer = get_trace_buffer()
+    if buffer is None:
+        raise UserException(
+            code.error,
+            "Trace buffer is disabled, set EIGENT_TRACE_BUFFER_SIZE",
+        )
+    return buffer.spans(trace_id, limit)
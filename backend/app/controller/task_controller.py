@@ -114,6 +114,7 @@ def add_agent(id: str, data: NewAgent):
 def stop_all():
     logger.warning("Stopping all tasks", extra={"task_count": len(task_locks)})
     for task_lock in task_locks.values():
+        task_lock.cancel_running_work("stop")
         asyncio.run(task_lock.put_queue(ActionStopData()))
     logger.info("All tasks stopped", extra={"task_count": len(task_locks)})
     return Response(status_code=204)
@@ -22,6 +22,7 @@ from camel.types import ModelType, RoleType
 from pydantic import BaseModel, Field, field_validator
 
 from app.model.enums import DEFAULT_SUMMARY_PROMPT, Status  # noqa: F401
+from app.utils.metrics import sse_bytes, sse_events
 
 logger = logging.getLogger("chat_model")
 
@@ -49,6 +50,21 @@ PLATFORM_MAPPING = {
     "ModelArk": "openai-compatible-model",
 }
 
+# Agents making short utility calls, such as classifying the question,
+# naming the task and assigning subtasks, rather than doing the work
+UTILITY_AGENTS = {
+    "question_confirm_agent",
+    "task_summary_agent",
+    "coordinator_agent",
+}
+
+# Small, fast model of each platform used for utility agents on request
+FAST_MODEL_DEFAULTS = {
+    "openai": "gpt-4.1-mini",
+    "anthropic": "claude-3-5-haiku-latest",
+    "gemini": "gemini-2.5-flash",
+}
+
 
 class Chat(BaseModel):
     task_id: str
@@ -76,6 +92,25 @@ class Chat(BaseModel):
     # User-specific search engine configurations
     # (e.g., GOOGLE_API_KEY, SEARCH_ENGINE_ID)
     search_config: dict[str, str] | None = None
+    # Start subtasks while decomposition is still streaming; the confirmed
+    # plan is reconciled with the running ones on start
+    auto_start_subtasks: bool = False
+    # Reuse results of identical subtasks from earlier runs
+    memoize_subtasks: bool = False
+    # Duplicate model calls running past their usual latency
+    hedge_llm_calls: bool = False
+    # Model answering the duplicate call instead of the agent's own model
+    hedge_fallback_model: "AgentModelConfig | None" = None
+    # Further providers the task's model calls are routed across
+    model_routes: list["ModelRouteConfig"] = []
+    # Model overrides keyed by agent name, e.g. "coordinator_agent"
+    role_models: dict[str, "AgentModelConfig"] = {}
+    # Run utility agents on the platform's fast model unless overridden
+    fast_utility_models: bool = False
+    # Convert attachments in the background as soon as the chat starts
+    preingest_attachments: bool = True
+    # Most subtasks each worker runs at once, unlimited when unset
+    max_concurrent_tasks_per_worker: int | None = Field(default=None, ge=1)
 
     @field_validator("model_platform")
     @classmethod
@@ -107,6 +142,16 @@ class Chat(BaseModel):
             else {}
         )
 
+    def role_model_config(self, agent_name: str) -> "AgentModelConfig | None":
+        """Get the model override for an agent role, if any"""
+        if agent_name in self.role_models:
+            return self.role_models[agent_name]
+        if self.fast_utility_models and agent_name in UTILITY_AGENTS:
+            fast_model = FAST_MODEL_DEFAULTS.get(self.model_platform.lower())
+            if fast_model and fast_model != self.model_type:
+                return AgentModelConfig(model_type=fast_model)
+        return None
+
     def is_cloud(self):
         return self.api_url is not None and "44.247.171.124" in self.api_url
 
@@ -171,6 +216,14 @@ class AgentModelConfig(BaseModel):
         )
 
 
+class ModelRouteConfig(AgentModelConfig):
+    """A further provider for routing model calls, with unset fields taken
+    from the agent's own model."""
+
+    # Preference for this provider at equal latency
+    weight: float = 1.0
+
+
 class NewAgent(BaseModel):
     name: str
     description: str
@@ -195,4 +248,7 @@ class RemoveTaskRequest(BaseModel):
 
 def sse_json(step: str, data):
     res_format = {"step": step, "data": data}
-    return f"data: {json.dumps(res_format, ensure_ascii=False)}\n\n"
+    event = f"data: {json.dumps(res_format, ensure_ascii=False)}\n\n"
+    sse_events.inc(step=step)
+    sse_bytes.inc(len(event.encode()), step=step)
+    return event
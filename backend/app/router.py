@@ -22,8 +22,10 @@ import logging
 from fastapi import FastAPI
 
 from app.controller import (
+    admin_controller,
     chat_controller,
     health_controller,
+    metrics_controller,
     model_controller,
     task_controller,
     tool_controller,
@@ -46,6 +48,11 @@ def register_routers(app: FastAPI, prefix: str = "") -> None:
         prefix: Optional global prefix for all routes (e.g., "/api")
     """
     routers_config = [
+        {
+            "router": admin_controller.router,
+            "tags": ["Admin"],
+            "description": "Token-protected diagnostics such as profiling",
+        },
         {
             "router": health_controller.router,
             "tags": ["Health"],
@@ -56,6 +63,11 @@ def register_routers(app: FastAPI, prefix: str = "") -> None:
             "tags": ["chat"],
             "description": "Chat session management, improvements, and human interactions",
         },
+        {
+            "router": metrics_controller.router,
+            "tags": ["Metrics"],
+            "description": "Prometheus-format runtime metrics",
+        },
         {
             "router": model_controller.router,
             "tags": ["model"],
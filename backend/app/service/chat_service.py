@@ -39,6 +39,7 @@ from app.agent.factory import (
     task_summary_agent,
 )
 from app.agent.listen_chat_agent import ListenChatAgent
+from app.agent.prompt import ENVIRONMENT_PROMPT
 from app.agent.tools import get_mcp_tools, get_toolkits
 from app.model.chat import Chat, NewAgent, Status, TaskContent, sse_json
 from app.service.task import (
@@ -52,10 +53,18 @@ from app.service.task import (
     TaskLock,
     delete_task_lock,
     set_current_task_id,
+    task_tree,
 )
+from app.utils.assignment_rules import (
+    ENV_ASSIGNMENT_EMBEDDING_MODEL,
+    local_embedding_similarity,
+)
+from app.utils.checkpoint import checkpoint_store
+from app.utils.dependency_context import agent_summarizer
 from app.utils.event_loop_utils import set_main_event_loop
 from app.utils.file_utils import get_working_directory
 from app.utils.server.sync_step import sync_step
+from app.utils.subtask_memo import subtask_memo_store
 from app.utils.telemetry.workforce_metrics import WorkforceMetricsCallback
 from app.utils.toolkit.human_toolkit import HumanToolkit
 from app.utils.toolkit.note_taking_toolkit import NoteTakingToolkit
@@ -426,7 +435,9 @@ async def step_solve(options: Chat, request: Request, task_lock: TaskLock):
             continue
 
         try:
-            if item.action == Action.improve or start_event_loop:
+            if item.action == Action.improve or (
+                start_event_loop and item.action != Action.resume_checkpoint
+            ):
                 logger.info("=" * 80)
                 logger.info(
                     "[NEW-QUESTION] Action.improve "
@@ -456,10 +467,6 @@ async def step_solve(options: Chat, request: Request, task_lock: TaskLock):
                     f"camel_task={ct_state}"
                 )
                 logger.info("=" * 80)
-                # from viztracer import VizTracer
-
-                # tracer = VizTracer()
-                # tracer.start()
                 if start_event_loop is True:
                     question = options.question
                     logger.info(
@@ -731,11 +738,17 @@ async def step_solve(options: Chat, request: Request, task_lock: TaskLock):
                                 context_for_coordinator,
                                 on_stream_batch,
                                 on_stream_text,
+                                (
+                                    event_loop
+                                    if options.auto_start_subtasks
+                                    else None
+                                ),
                             )
 
                             if stream_state["subtasks"]:
                                 sub_tasks = stream_state["subtasks"]
                             state_holder["sub_tasks"] = sub_tasks
+                            task_tree.index([camel_task])
                             logger.info(
                                 "Task decomposed into "
                                 f"{len(sub_tasks)} subtasks"
@@ -827,6 +840,45 @@ async def step_solve(options: Chat, request: Request, task_lock: TaskLock):
                     bg_task = asyncio.create_task(run_decomposition())
                     task_lock.add_background_task(bg_task)
 
+            elif item.action == Action.resume_checkpoint:
+                start_event_loop = False
+                checkpoint = await asyncio.to_thread(
+                    checkpoint_store.load, options.project_id
+                )
+                if checkpoint is None:
+                    yield sse_json(
+                        "error",
+                        {"message": "No checkpoint found for this project"},
+                    )
+                    continue
+                logger.info(
+                    "[RESUME] Resuming project from checkpoint",
+                    extra={"project_id": options.project_id},
+                )
+                yield sse_json("confirmed", {"question": options.question})
+
+                if workforce is None:
+                    (workforce, mcp) = await construct_workforce(options)
+                    for new_agent in options.new_agents:
+                        workforce.add_single_agent_worker(
+                            format_agent_description(new_agent),
+                            await new_agent_model(new_agent, options),
+                        )
+                camel_task = workforce.restore_checkpoint(checkpoint)
+                task_tree.index([camel_task])
+                set_current_task_id(options.project_id, camel_task.id)
+                sub_tasks = list(workforce._pending_tasks)
+                task_lock.decompose_sub_tasks = sub_tasks
+                content_preview = camel_task.content[:80]
+                if len(camel_task.content) > 80:
+                    content_preview += "..."
+                summary_task_content = f"Task|{content_preview}"
+                task_lock.summary_task_content = summary_task_content
+                yield to_sub_tasks(camel_task, summary_task_content)
+
+                task_lock.status = Status.processing
+                task = asyncio.create_task(workforce.eigent_start(sub_tasks))
+                task_lock.add_background_task(task)
             elif item.action == Action.update_task:
                 assert camel_task is not None
                 update_tasks = {item.id: item for item in item.data.task}
@@ -851,7 +903,17 @@ async def step_solve(options: Chat, request: Request, task_lock: TaskLock):
                 summary_task_content_local = getattr(
                     task_lock, "summary_task_content", summary_task_content
                 )
-                yield to_sub_tasks(camel_task, summary_task_content_local)
+                # Send only what changed relative to the client's edit
+                yield sse_json(
+                    "sub_tasks_patch",
+                    {
+                        "summary_task": summary_task_content_local,
+                        "patch": sub_tasks_patch(
+                            [t.model_dump() for t in item.data.task],
+                            tree_sub_tasks(camel_task.subtasks),
+                        ),
+                    },
+                )
             elif item.action == Action.add_task:
                 # Check if this might be a misrouted second question
                 if camel_task is None and workforce is None:
@@ -960,6 +1022,7 @@ async def step_solve(options: Chat, request: Request, task_lock: TaskLock):
 
                     # Stop workforce completely
                     logger.info("[LIFECYCLE] 🛑 Stopping workforce")
+                    task_lock.cancel_running_work("skip_task")
                     if workforce._running:
                         # Import correct BaseWorkforce from camel
                         from camel.societies.workforce.workforce import (
@@ -1443,6 +1506,7 @@ async def step_solve(options: Chat, request: Request, task_lock: TaskLock):
                             else:
                                 new_summary_content = f"Follow-up Task|{tc}"
 
+                        task_tree.index([camel_task])
                         # Emit final subtasks once when
                         # decomposition is complete
                         final_payload = {
@@ -1662,7 +1726,24 @@ async def step_solve(options: Chat, request: Request, task_lock: TaskLock):
                     get_result = get_task_result_with_optional_summary
                     final_result: str = await get_result(camel_task, options)
 
+                if workforce is not None:
+                    await workforce.discard_checkpoint()
                 task_lock.status = Status.done
+                logger.info(
+                    "Model usage by role",
+                    extra={
+                        "project_id": options.project_id,
+                        "model_usage": task_lock.model_usage.report(),
+                    },
+                )
+                tool_stats = task_lock.tool_stats.report()
+                logger.info(
+                    "Tool stats",
+                    extra={
+                        "project_id": options.project_id,
+                        "tool_stats": tool_stats,
+                    },
+                )
 
                 task_lock.last_task_result = final_result
 
@@ -1687,6 +1768,7 @@ async def step_solve(options: Chat, request: Request, task_lock: TaskLock):
                     },
                 )
 
+                yield sse_json("tool_stats", tool_stats)
                 yield sse_json("end", final_result)
 
                 if workforce is not None:
@@ -1907,15 +1989,15 @@ def update_sub_tasks(
     if depth > 5:  # limit the depth of the recursion
         return []
 
-    i = 0
-    while i < len(sub_tasks):
-        item = sub_tasks[i]
+    kept = []
+    for item in sub_tasks:
         if item.id in update_tasks:
             item.content = update_tasks[item.id].content
             update_sub_tasks(item.subtasks, update_tasks, depth + 1)
-            i += 1
+            kept.append(item)
         else:
-            sub_tasks.pop(i)
+            task_tree.discard(item.id)
+    sub_tasks[:] = kept
     return sub_tasks
 
 
@@ -1925,17 +2007,99 @@ def add_sub_tasks(
     """Add new tasks (with empty id) to camel_task
     and return the list of added tasks."""
     added_tasks = []
+    if task_tree.get(camel_task.id) is not camel_task:
+        task_tree.index([camel_task])
+    next_index = len(camel_task.subtasks) + 1
     for item in update_tasks:
         if item.id == "":
+            # Removed siblings can leave the next positional id taken
+            while task_tree.child(
+                camel_task.id, f"{camel_task.id}.{next_index}"
+            ):
+                next_index += 1
             new_task = Task(
                 content=item.content,
-                id=f"{camel_task.id}.{len(camel_task.subtasks) + 1}",
+                id=f"{camel_task.id}.{next_index}",
             )
-            camel_task.add_subtask(new_task)
+            next_index += 1
+            task_tree.add(new_task, camel_task)
             added_tasks.append(new_task)
     return added_tasks
 
 
+def sub_tasks_patch(
+    old: list[dict], new: list[dict], path: str = ""
+) -> list[dict]:
+    """Build the JSON Patch (RFC 6902) turning one ``tree_sub_tasks``
+    payload into another.
+
+    Items are matched by id, so the patch only touches removed, added,
+    moved or edited subtasks instead of resending the whole tree.
+
+    Args:
+        old: Payload the client currently holds.
+        new: Payload it should end up with.
+        path: JSON pointer of the lists, used for nested subtasks.
+
+    Returns:
+        list[dict]: Patch operations, applied in order.
+    """
+    ops: list[dict] = []
+    new_ids = {item["id"] for item in new}
+    current = list(old)
+    for i in range(len(current) - 1, -1, -1):
+        if not current[i].get("id") or current[i]["id"] not in new_ids:
+            ops.append({"op": "remove", "path": f"{path}/{i}"})
+            del current[i]
+
+    for i, item in enumerate(new):
+        if i >= len(current) or current[i]["id"] != item["id"]:
+            j = next(
+                (
+                    k
+                    for k in range(i + 1, len(current))
+                    if current[k]["id"] == item["id"]
+                ),
+                None,
+            )
+            if j is None:
+                ops.append({"op": "add", "path": f"{path}/{i}", "value": item})
+                current.insert(i, item)
+                continue
+            ops.append(
+                {"op": "move", "from": f"{path}/{j}", "path": f"{path}/{i}"}
+            )
+            current.insert(i, current.pop(j))
+
+        previous = current[i]
+        for key in ("content", "state"):
+            if key in item and previous.get(key) != item[key]:
+                ops.append(
+                    {
+                        "op": "replace" if key in previous else "add",
+                        "path": f"{path}/{i}/{key}",
+                        "value": item[key],
+                    }
+                )
+        if "subtasks" in previous:
+            ops.extend(
+                sub_tasks_patch(
+                    previous["subtasks"],
+                    item.get("subtasks", []),
+                    f"{path}/{i}/subtasks",
+                )
+            )
+        elif item.get("subtasks"):
+            ops.append(
+                {
+                    "op": "add",
+                    "path": f"{path}/{i}/subtasks",
+                    "value": item["subtasks"],
+                }
+            )
+    return ops
+
+
 async def question_confirm(
     agent: ListenChatAgent, prompt: str, task_lock: TaskLock | None = None
 ) -> bool:
@@ -2117,6 +2281,16 @@ async def get_task_result_with_optional_summary(
     return result
 
 
+def environment_prompt(working_directory: str) -> str:
+    """Platform, working directory and date, appended to agent prompts"""
+    return ENVIRONMENT_PROMPT.format(
+        platform_system=platform.system(),
+        platform_machine=platform.machine(),
+        working_directory=working_directory,
+        today=datetime.date.today(),
+    )
+
+
 async def construct_workforce(
     options: Chat,
 ) -> tuple[Workforce, ListenChatAgent]:
@@ -2137,6 +2311,7 @@ async def construct_workforce(
     set_main_event_loop(asyncio.get_running_loop())
 
     working_directory = get_working_directory(options)
+    environment = environment_prompt(working_directory)
 
     # ========================================================================
     # Define agent creation functions
@@ -2165,32 +2340,10 @@ async def construct_workforce(
                 ],
             )
             for key, prompt in {
-                Agents.coordinator_agent: f"""
-You are a helpful coordinator.
-- You are now working in system {platform.system()} with architecture
-{platform.machine()} at working directory \
-`{working_directory}`. All local file operations \
-must occur here, but you can access files from any \
-place in the file system. For all file system \
-operations, you MUST use absolute paths to ensure \
-precision and avoid ambiguity.
-The current date is {datetime.date.today()}. \
-For any date-related tasks, you MUST use this as \
-the current date.
-            """,
-                Agents.task_agent: f"""
-You are a helpful task planner.
-- You are now working in system {platform.system()} with architecture
-{platform.machine()} at working directory \
-`{working_directory}`. All local file operations \
-must occur here, but you can access files from any \
-place in the file system. For all file system \
-operations, you MUST use absolute paths to ensure \
-precision and avoid ambiguity.
-The current date is {datetime.date.today()}. \
-For any date-related tasks, you MUST use this as \
-the current date.
-        """,
+                Agents.coordinator_agent: "You are a helpful coordinator.\n"
+                + environment,
+                Agents.task_agent: "You are a helpful task planner.\n"
+                + environment,
             }.items()
         ]
 
@@ -2198,19 +2351,7 @@ the current date.
         """Create new worker agent (sync, runs in thread pool)."""
         return agent_model(
             Agents.new_worker_agent,
-            f"""
-        You are a helpful assistant.
-- You are now working in system {platform.system()} with architecture
-{platform.machine()} at working directory \
-`{working_directory}`. All local file operations \
-must occur here, but you can access files from any \
-place in the file system. For all file system \
-operations, you MUST use absolute paths to ensure \
-precision and avoid ambiguity.
-The current date is {datetime.date.today()}. \
-For any date-related tasks, you MUST use this as \
-the current date.
-        """,
+            "You are a helpful assistant.\n" + environment,
             options,
             [
                 *HumanToolkit.get_can_use_tools(
@@ -2287,6 +2428,7 @@ the current date.
         project_id=options.project_id, task_id=options.task_id
     )
 
+    embedding_model = os.getenv(ENV_ASSIGNMENT_EMBEDDING_MODEL)
     workforce = Workforce(
         options.project_id,
         "A workforce",
@@ -2298,6 +2440,18 @@ the current date.
         use_structured_output_handler=False
         if model_platform_enum == ModelPlatformType.OPENAI
         else True,
+        checkpoint_store=checkpoint_store,
+        memo_store=subtask_memo_store if options.memoize_subtasks else None,
+        dependency_summarizer=agent_summarizer(
+            lambda: task_summary_agent(options)
+        ),
+        assignment_similarity=(
+            local_embedding_similarity(embedding_model)
+            if embedding_model
+            else None
+        ),
+        max_concurrent_tasks=options.max_concurrent_tasks_per_worker,
+        working_directory=working_directory,
     )
 
     # Register workforce metrics callback
@@ -2400,18 +2554,9 @@ async def new_agent_model(data: NewAgent | ActionNewAgent, options: Chat):
         f"Agent {data.name} created with {len(tools)} tools: {tool_names}"
     )
     # Enhanced system message with platform information
-    enhanced_description = f"""{data.description}
-- You are now working in system {platform.system()} with architecture
-{platform.machine()} at working directory \
-`{working_directory}`. All local file operations \
-must occur here, but you can access files from any \
-place in the file system. For all file system \
-operations, you MUST use absolute paths to ensure \
-precision and avoid ambiguity.
-The current date is {datetime.date.today()}. \
-For any date-related tasks, you MUST use this as \
-the current date.
-"""
+    enhanced_description = f"{data.description}\n" + environment_prompt(
+        working_directory
+    )
 
     # Pass per-agent custom model config if available
     custom_model_config = getattr(data, "custom_model_config", None)
@@ -33,6 +33,9 @@ from app.model.chat import (
     UpdateData,
 )
 from app.model.enums import Status
+from app.utils.cancellation import CancellationToken, current_token
+from app.utils.model_usage import ModelUsageTracker
+from app.utils.tool_stats import ToolStatsTracker
 
 logger = logging.getLogger("task_service")
 
@@ -69,6 +72,7 @@ class Action(str, Enum):
     remove_task = "remove_task"  # user -> backend
     skip_task = "skip_task"  # user -> backend
     timeout = "timeout"  # backend -> user (task timeout error)
+    resume_checkpoint = "resume_checkpoint"  # user -> backend
 
 
 class ActionImproveData(BaseModel):
@@ -89,8 +93,10 @@ class ActionUpdateTaskData(BaseModel):
 class ActionTaskStateData(BaseModel):
     action: Literal[Action.task_state] = Action.task_state
     data: dict[
-        Literal["task_id", "content", "state", "result", "failure_count"],
-        str | int,
+        Literal[
+            "task_id", "content", "state", "result", "failure_count", "cached"
+        ],
+        bool | str | int,
     ]
 
 
@@ -272,6 +278,10 @@ class ActionSkipTaskData(BaseModel):
     project_id: str
 
 
+class ActionResumeCheckpointData(BaseModel):
+    action: Literal[Action.resume_checkpoint] = Action.resume_checkpoint
+
+
 ActionData = (
     ActionImproveData
     | ActionStartData
@@ -301,6 +311,7 @@ ActionData = (
     | ActionSkipTaskData
     | ActionDecomposeTextData
     | ActionDecomposeProgressData
+    | ActionResumeCheckpointData
 )
 
 
@@ -344,6 +355,14 @@ class TaskLock:
     """Track if summary has been generated for this project"""
     current_task_id: str | None
     """Current task ID to be used in SSE responses"""
+    cancel_token: CancellationToken
+    """Cancelled to interrupt in-flight agent and tool work"""
+    subtask_tokens: dict[str, CancellationToken]
+    """Per-subtask children of cancel_token, keyed by subtask id"""
+    model_usage: ModelUsageTracker
+    """Model latency, tokens and cost per agent role"""
+    tool_stats: ToolStatsTracker
+    """Tool latency, payload sizes and errors per toolkit method and agent"""
 
     def __init__(
         self, id: str, queue: asyncio.Queue, human_input: dict
@@ -362,6 +381,10 @@ class TaskLock:
         self.last_task_summary = ""
         self.question_agent = None
         self.current_task_id = None
+        self.cancel_token = CancellationToken()
+        self.subtask_tokens = {}
+        self.model_usage = ModelUsageTracker()
+        self.tool_stats = ToolStatsTracker()
 
         logger.info(
             "Task lock initialized",
@@ -461,6 +484,49 @@ class TaskLock:
 
         logger.info("Task lock cleanup completed", extra={"task_id": self.id})
 
+    def cancel_running_work(self, reason: str) -> None:
+        """Interrupt in-flight agent and tool work.
+
+        The cancelled token is replaced, so work started afterwards, such
+        as the next question in a multi-turn chat, runs normally.
+        """
+        token, self.cancel_token = self.cancel_token, CancellationToken()
+        self.subtask_tokens.clear()
+        logger.info(
+            "Cancelling running work",
+            extra={"task_id": self.id, "reason": reason},
+        )
+        token.cancel(reason)
+
+    def subtask_token(self, subtask_id: str) -> CancellationToken:
+        """Get a token for one subtask, cancelled with the project"""
+        token = self.cancel_token.child()
+        self.subtask_tokens[subtask_id] = token
+        return token
+
+    def release_subtask_token(self, subtask_id: str) -> None:
+        token = self.subtask_tokens.pop(subtask_id, None)
+        if token is not None:
+            token.close()
+
+    def cancel_subtask(self, subtask_id: str, reason: str) -> bool:
+        """Interrupt a running subtask. Returns False if it is not running"""
+        token = self.subtask_tokens.get(subtask_id)
+        if token is None:
+            return False
+        token.cancel(reason)
+        return True
+
+    def work_token(self) -> CancellationToken:
+        """Get the token for work starting now: the one of the enclosing
+        subtask or agent step, else the project token.
+
+        Keep the returned token for the whole piece of work. The project
+        token is replaced on cancel, so asking again could return a fresh,
+        uncancelled one.
+        """
+        return current_token() or self.cancel_token
+
     def register_toolkit(self, toolkit: Any) -> None:
         """Register a toolkit for cleanup when task ends.
 
@@ -523,7 +589,98 @@ class TaskLock:
 task_locks = dict[str, TaskLock]()
 # Cleanup task for removing stale task locks
 _cleanup_task: asyncio.Task | None = None
-task_index: dict[str, weakref.ref[Task]] = {}
+
+
+class TaskTree:
+    r"""Id-keyed index over camel task trees.
+
+    Keeps a weak reference to every indexed task, its parent id and the
+    ordered children of each parent. Lookups, parent resolution and
+    sibling lookups are O(1) instead of a recursive walk of
+    :obj:`Task.subtasks`.
+    """
+
+    def __init__(self) -> None:
+        self._nodes: dict[str, weakref.ref[Task]] = {}
+        self._parents: dict[str, str | None] = {}
+        self._children: dict[str, dict[str, weakref.ref[Task]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, id: str) -> bool:
+        return id in self._nodes
+
+    def clear(self) -> None:
+        self._nodes.clear()
+        self._parents.clear()
+        self._children.clear()
+
+    def index(self, tasks: list[Task], parent: Task | None = None) -> None:
+        r"""Index tasks and all of their subtasks.
+
+        Args:
+            tasks (list[Task]): Tasks to index, in child order.
+            parent (Task | None): Parent of :obj:`tasks`. Defaults to
+                each task's own :obj:`parent`.
+        """
+        stack = [(task, parent or task.parent) for task in reversed(tasks)]
+        while stack:
+            task, task_parent = stack.pop()
+            ref = weakref.ref(task)
+            self._nodes[task.id] = ref
+            parent_id = task_parent.id if task_parent is not None else None
+            self._parents[task.id] = parent_id
+            if parent_id is not None:
+                self._children.setdefault(parent_id, {})[task.id] = ref
+            stack.extend((sub, task) for sub in reversed(task.subtasks))
+
+    def get(self, id: str) -> Task | None:
+        ref = self._nodes.get(id)
+        if ref is None:
+            return None
+        task = ref()
+        if task is None:
+            # Weak reference died, remove from index
+            self.discard(id)
+        return task
+
+    def parent(self, id: str) -> Task | None:
+        parent_id = self._parents.get(id)
+        return self.get(parent_id) if parent_id is not None else None
+
+    def child(self, parent_id: str, id: str) -> Task | None:
+        r"""Get the child :obj:`id` of :obj:`parent_id`, as stored in the
+        parent's subtask list."""
+        ref = self._children.get(parent_id, {}).get(id)
+        return ref() if ref is not None else None
+
+    def children(self, parent_id: str) -> list[Task]:
+        r"""Get the live children of :obj:`parent_id` in child order."""
+        refs = self._children.get(parent_id, {}).values()
+        return [task for task in (ref() for ref in refs) if task is not None]
+
+    def add(self, task: Task, parent: Task) -> None:
+        r"""Append :obj:`task` to :obj:`parent` and index it."""
+        parent.add_subtask(task)
+        self.index([task], parent)
+
+    def discard(self, id: str) -> None:
+        r"""Drop :obj:`id` and its indexed descendants from the index.
+
+        The task objects themselves are left untouched.
+        """
+        stack = [id]
+        while stack:
+            task_id = stack.pop()
+            self._nodes.pop(task_id, None)
+            parent_id = self._parents.pop(task_id, None)
+            if parent_id is not None:
+                self._children.get(parent_id, {}).pop(task_id, None)
+            stack.extend(self._children.pop(task_id, {}))
+
+
+task_tree = TaskTree()
 
 
 def get_task_lock(id: str) -> TaskLock:
@@ -608,27 +765,13 @@ async def delete_task_lock(id: str):
 
 
 def get_camel_task(id: str, tasks: list[Task]) -> None | Task:
-    if id in task_index:
-        task_ref = task_index[id]
-        task = task_ref()
-        if task is not None:
-            return task
-        else:
-            # Weak reference died, remove from index
-            del task_index[id]
+    task = task_tree.get(id)
+    if task is not None:
+        return task
 
-    # Fallback to search and rebuild index
-    for item in tasks:
-        # Add to index
-        task_index[item.id] = weakref.ref(item)
-
-        if item.id == id:
-            return item
-        else:
-            task = get_camel_task(id, item.subtasks)
-            if task is not None:
-                return task
-    return None
+    # Miss: index the given tasks, then look up again
+    task_tree.index(tasks)
+    return task_tree.get(id)
 
 
 async def _periodic_cleanup():
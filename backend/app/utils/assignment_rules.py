@@ -0,0 +1,291 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+"""
+Deterministic subtask-to-worker matching, so obvious assignments do not
+need a coordinator LLM call
+"""
+
+import functools
+import logging
+import math
+import re
+import threading
+from collections.abc import Callable
+
+from camel.embeddings import BaseEmbedding
+from camel.tasks.task import Task
+from pydantic import BaseModel
+
+logger = logging.getLogger("assignment_rules")
+
+# Similarity in [0, 1] between a subtask and a worker description
+SimilarityFn = Callable[[str, str], float]
+
+# Local Sentence Transformers model adding embedding similarity to the
+# assignment score, e.g. "all-MiniLM-L6-v2"; unset scores by keywords only
+ENV_ASSIGNMENT_EMBEDDING_MODEL = "EIGENT_ASSIGNMENT_EMBEDDING_MODEL"
+
+_WORD_PATTERN = re.compile(r"[a-z][a-z0-9]+")
+
+# Words too common in subtask and worker descriptions to tell roles apart
+_STOP_WORDS = frozenset(
+    "the and for with that this from into its can are all any use using "
+    "based agent task tasks given solve provide relevant information".split()
+)
+
+# Keywords that point a subtask at one of the built-in worker roles
+ROLE_KEYWORDS: dict[str, frozenset[str]] = {
+    "developer": frozenset(
+        "code coding script python javascript terminal shell install "
+        "deploy debug implement program compile execute function "
+        "repository git npm".split()
+    ),
+    "browser": frozenset(
+        "search web website webpage browse browser url online google news "
+        "internet lookup scrape".split()
+    ),
+    "document": frozenset(
+        "document report markdown docx pdf excel spreadsheet slides pptx "
+        "presentation csv json yaml html write".split()
+    ),
+    "multi_modal": frozenset(
+        "image images audio video videos transcribe transcription speech "
+        "photo picture draw".split()
+    ),
+}
+
+# Appended to the decomposition prompt so the coordinator's plan carries
+# the worker and dependencies of each subtask, see read_annotation
+DECOMPOSE_ANNOTATION_PROMPT = """
+**Annotations**: end the content of every <task> with one line
+`[worker: <name>; after: <numbers>]`. <name> is a word from the name of the
+worker that should do the subtask. <numbers> are the positions, counting
+from 1, of the earlier subtasks whose results it needs, or `none`.
+Example: <task>Compile the summaries into a markdown report.
+[worker: document; after: 1, 2]</task>
+"""
+
+_ANNOTATION_PATTERN = re.compile(
+    r"\[\s*worker:\s*([^;\]]*?)\s*;\s*after:\s*([^\]]*?)\s*\]\s*\Z",
+    re.IGNORECASE,
+)
+
+# An annotation anywhere in the raw decomposition text
+_STREAMED_ANNOTATION_PATTERN = re.compile(
+    r"\[\s*worker:[^\]]*\]", re.IGNORECASE
+)
+
+
+class AssignmentRuleConfig(BaseModel):
+    enabled: bool = True
+    # Lowest winning score assigned without the coordinator
+    min_score: float = 2.0
+    # Lowest lead of the best worker over the runner-up
+    min_margin: float = 1.5
+    # Weight of the optional similarity function in the score
+    similarity_weight: float = 3.0
+
+
+def _words(text: str) -> set[str]:
+    return {
+        word
+        for word in _WORD_PATTERN.findall(text.lower())
+        if word not in _STOP_WORDS
+    }
+
+
+def _normalize(name: str) -> str:
+    return name.strip().lower().replace("-", "_").replace(" ", "_")
+
+
+def worker_role(description: str) -> str | None:
+    """Get the built-in role named in a worker description's title, e.g.
+    "developer" for "Developer Agent: ..." """
+    title = _normalize(description.split(":", 1)[0])
+    for role in ROLE_KEYWORDS:
+        if role in title:
+            return role
+    return None
+
+
+def _role_hint(task: Task) -> str | None:
+    hint = (task.additional_info or {}).get("role_hint")
+    if not isinstance(hint, str) or not hint.strip():
+        return None
+    return _normalize(hint)
+
+
+def read_annotation(task: Task, parent_id: str) -> None:
+    """Move the annotation asked for by DECOMPOSE_ANNOTATION_PROMPT from
+    the end of a subtask's content into its additional info.
+
+    Args:
+        task: A subtask from the decomposition of the parent task.
+        parent_id: Id of the decomposed task, subtask ``n`` of which has
+            id ``f"{parent_id}.{n}"``.
+    """
+    match = _ANNOTATION_PATTERN.search(task.content)
+    if match is None:
+        return
+    task.content = task.content[: match.start()].rstrip()
+    info = dict(task.additional_info or {})
+    worker = match.group(1).strip()
+    if worker and worker.lower() != "none":
+        info["role_hint"] = worker
+    info["dependencies"] = [
+        f"{parent_id}.{position}"
+        for position in re.findall(r"\d+", match.group(2))
+    ]
+    task.additional_info = info
+
+
+def strip_annotations(text: str) -> str:
+    """Remove the annotations asked for by DECOMPOSE_ANNOTATION_PROMPT
+    from raw decomposition text, for streaming it to the user.
+
+    A trailing ``[`` that may still become an annotation is held back, so
+    the result for a longer prefix of the stream always extends the
+    result for a shorter one.
+    """
+    text = _STREAMED_ANNOTATION_PATTERN.sub("", text)
+    start = text.rfind("[")
+    if start != -1 and "]" not in text[start:]:
+        opening = text[start + 1 :].lstrip().lower()
+        if "worker:".startswith(opening) or opening.startswith("worker:"):
+            return text[:start]
+    return text
+
+
+def match_worker(
+    task: Task,
+    workers: dict[str, str],
+    config: AssignmentRuleConfig,
+    similarity: SimilarityFn | None = None,
+) -> str | None:
+    """Pick a worker for a subtask when the match is unambiguous.
+
+    A ``role_hint`` in the task's additional info naming exactly one
+    worker wins outright. Otherwise each worker scores one point per role
+    keyword and half a point per description word found in the subtask,
+    plus the weighted similarity when a similarity function is given.
+
+    Args:
+        task: The subtask to assign.
+        workers: Worker descriptions keyed by node id.
+        config: Thresholds the winning score must clear.
+        similarity: Optional similarity between subtask content and a
+            worker description, e.g. from a local embedding model.
+
+    Returns:
+        The node id of the matched worker, or None if the coordinator
+        should decide.
+    """
+    if not workers:
+        return None
+
+    hint = _role_hint(task)
+    if hint:
+        hinted = [
+            node_id
+            for node_id, description in workers.items()
+            if hint in _normalize(description.split(":", 1)[0])
+        ]
+        if len(hinted) == 1:
+            return hinted[0]
+
+    content_words = _words(task.content)
+    scores: dict[str, float] = {}
+    for node_id, description in workers.items():
+        role = worker_role(description)
+        score = 0.0
+        if role:
+            score += len(content_words & ROLE_KEYWORDS[role])
+        score += 0.5 * len(content_words & _words(description))
+        if similarity is not None:
+            score += config.similarity_weight * similarity(
+                task.content, description
+            )
+        scores[node_id] = score
+
+    ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+    best_id, best = ranked[0]
+    runner_up = ranked[1][1] if len(ranked) > 1 else 0.0
+    if best < config.min_score or best - runner_up < config.min_margin:
+        return None
+    return best_id
+
+
+def embedding_similarity(
+    create_embedding: Callable[[], BaseEmbedding[str]],
+) -> SimilarityFn:
+    """Build a cosine similarity function over a local embedding model.
+
+    The model is created on first use. Texts are embedded once and reused
+    across subtasks and workers. If the model cannot be created the
+    similarity is 0, leaving the keyword scores to decide.
+
+    Args:
+        create_embedding: Creates a CAMEL embedding, e.g. a
+            ``SentenceTransformerEncoder``.
+
+    Returns:
+        A function scoring a subtask against a worker description.
+    """
+    lock = threading.Lock()
+    state: dict = {}
+    cache: dict[str, list[float]] = {}
+
+    def vector(text: str) -> list[float] | None:
+        with lock:
+            if "embedding" not in state:
+                try:
+                    state["embedding"] = create_embedding()
+                except Exception as e:
+                    logger.warning(
+                        f"Assignment embedding model unavailable: {e}"
+                    )
+                    state["embedding"] = None
+            embedding = state["embedding"]
+            if embedding is None:
+                return None
+            if text not in cache:
+                cache[text] = embedding.embed(text)
+            return cache[text]
+
+    def similarity(content: str, description: str) -> float:
+        a = vector(content)
+        b = vector(description)
+        if a is None or b is None:
+            return 0.0
+        norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(
+            sum(y * y for y in b)
+        )
+        if not norm:
+            return 0.0
+        return max(0.0, sum(x * y for x, y in zip(a, b)) / norm)
+
+    return similarity
+
+
+@functools.cache
+def _sentence_encoder(model_name: str) -> BaseEmbedding[str]:
+    from camel.embeddings import SentenceTransformerEncoder
+
+    return SentenceTransformerEncoder(model_name=model_name)
+
+
+def local_embedding_similarity(model_name: str) -> SimilarityFn:
+    """Build a similarity function over a local Sentence Transformers
+    model, which is loaded once per process and shared by workforces."""
+    return embedding_similarity(lambda: _sentence_encoder(model_name))
@@ -0,0 +1,220 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+"""
+Background conversion of chat attachments, cached by content hash so the
+reading toolkits do not convert them on the task's critical path
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+logger = logging.getLogger("attachment_cache")
+
+# Conversions cached per file, named after the tool that reads them
+MARKDOWN = "markdown"
+EXCEL = "excel"
+
+# Formats MarkItDown converts without a model call; images and audio
+# need one, so they are left to the multi-modal tools
+MARKDOWN_SUFFIXES = frozenset(
+    ".pdf .doc .docx .xls .xlsx .ppt .pptx .epub .html .htm .csv .json "
+    ".xml .zip .txt".split()
+)
+EXCEL_SUFFIXES = frozenset(".xls .xlsx .csv".split())
+
+Converter = Callable[[str], str]
+
+
+def convert_markdown(path: str) -> str:
+    from camel.loaders.markitdown import MarkItDownLoader
+
+    return MarkItDownLoader().convert_file(path)
+
+
+_excel_reader = None
+
+
+def extract_excel(path: str) -> str:
+    global _excel_reader
+    from camel.toolkits import ExcelToolkit
+
+    if _excel_reader is None:
+        _excel_reader = ExcelToolkit(working_directory=tempfile.gettempdir())
+    return _excel_reader.extract_excel_content(path)
+
+
+CONVERTERS: dict[str, tuple[frozenset[str], Converter]] = {
+    MARKDOWN: (MARKDOWN_SUFFIXES, convert_markdown),
+    EXCEL: (EXCEL_SUFFIXES, extract_excel),
+}
+
+
+class AttachmentCache:
+    """Converted file contents keyed by conversion and content hash.
+
+    Conversions run on a small thread pool. Reading a file whose
+    conversion is still running waits for it instead of starting another;
+    one still queued is taken over by the reader. Failed conversions are
+    not cached, so the reader retries them and sees the error itself.
+    Only prefetched files are read through the cache; others are
+    converted directly, without hashing them.
+    """
+
+    def __init__(self, max_workers: int = 2, max_entries: int = 64):
+        self.max_workers = max_workers
+        self.max_entries = max_entries
+        self._executor: ThreadPoolExecutor | None = None
+        self._entries: OrderedDict[tuple[str, str], Future[str]] = (
+            OrderedDict()
+        )
+        # Size, mtime and content hash of the prefetched files by path
+        self._digests: OrderedDict[str, tuple[int, int, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def digest(self, path: str) -> str:
+        """Hash a file's content, rehashing only when it changed on disk"""
+        resolved = str(Path(path).resolve())
+        stat = os.stat(resolved)
+        size, mtime = stat.st_size, stat.st_mtime_ns
+        with self._lock:
+            cached = self._digests.get(resolved)
+        if cached is not None and cached[:2] == (size, mtime):
+            digest = cached[2]
+        else:
+            sha = hashlib.sha256()
+            with open(resolved, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    sha.update(chunk)
+            digest = sha.hexdigest()
+        with self._lock:
+            self._digests[resolved] = (size, mtime, digest)
+            self._digests.move_to_end(resolved)
+            while len(self._digests) > self.max_entries:
+                self._digests.popitem(last=False)
+        return digest
+
+    def _prefetched(self, path: str) -> bool:
+        resolved = str(Path(path).resolve())
+        with self._lock:
+            return resolved in self._digests
+
+    def _store(self, key: tuple[str, str], future: Future[str]) -> None:
+        self._entries[key] = future
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def prefetch(self, paths: Iterable[str]) -> int:
+        """Start converting files in the background.
+
+        Each file is converted by every converter supporting its suffix.
+
+        Returns:
+            The number of conversions scheduled.
+        """
+        scheduled = 0
+        for path in paths:
+            suffix = Path(path).suffix.lower()
+            kinds = [
+                kind
+                for kind, (suffixes, _) in CONVERTERS.items()
+                if suffix in suffixes
+            ]
+            if not kinds or not os.path.isfile(path):
+                continue
+            try:
+                digest = self.digest(path)
+            except OSError as e:
+                logger.warning(f"Cannot hash attachment {path}: {e}")
+                continue
+            for kind in kinds:
+                key = (kind, digest)
+                with self._lock:
+                    if key in self._entries:
+                        continue
+                    if self._executor is None:
+                        self._executor = ThreadPoolExecutor(
+                            max_workers=self.max_workers,
+                            thread_name_prefix="attachment",
+                        )
+                    self._store(
+                        key,
+                        self._executor.submit(CONVERTERS[kind][1], path),
+                    )
+                scheduled += 1
+        if scheduled:
+            logger.info(
+                "Pre-ingesting attachments",
+                extra={"conversions": scheduled},
+            )
+        return scheduled
+
+    def read(self, path: str, kind: str, convert: Converter) -> str:
+        """Get a file's converted content, converting it now on a miss or
+        when the file was not prefetched"""
+        if not self._prefetched(path):
+            return convert(path)
+        try:
+            key = (kind, self.digest(path))
+        except OSError:
+            return convert(path)
+        with self._lock:
+            future = self._entries.get(key)
+            if future is not None and future.cancel():
+                del self._entries[key]
+                future = None
+        if future is not None:
+            try:
+                result = future.result()
+                logger.debug(f"Attachment cache hit: {path}")
+                return result
+            except Exception:
+                with self._lock:
+                    if self._entries.get(key) is future:
+                        del self._entries[key]
+        result = convert(path)
+        done: Future[str] = Future()
+        done.set_result(result)
+        with self._lock:
+            self._store(key, done)
+        return result
+
+
+attachment_cache = AttachmentCache()
+
+
+def read_markdown_files(paths: list[str]) -> dict[str, str]:
+    """Convert files to Markdown through the attachment cache, in parallel.
+
+    Failures are reported per file as an error string, like MarkItDown's
+    own batch conversion.
+    """
+
+    def read(path: str) -> str:
+        try:
+            return attachment_cache.read(path, MARKDOWN, convert_markdown)
+        except Exception as e:
+            return f"Error: {e}"
+
+    if len(paths) <= 1:
+        return {path: read(path) for path in paths}
+    with ThreadPoolExecutor(max_workers=min(len(paths), 4)) as executor:
+        return dict(zip(paths, executor.map(read, paths)))
@@ -0,0 +1,165 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+"""
+Cooperative cancellation shared by the agents, workers and toolkits of a
+project, so stopping it interrupts in-flight model calls and tools
+"""
+
+import asyncio
+import logging
+import threading
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TypeVar
+
+logger = logging.getLogger("cancellation")
+
+T = TypeVar("T")
+
+
+class TaskCancelledError(Exception):
+    """Raised when work is abandoned because its token was cancelled"""
+
+
+class CancellationToken:
+    """Thread-safe cancellation signal.
+
+    Callbacks registered with :meth:`add_callback` run once, on the thread
+    that calls :meth:`cancel`, so they must be quick and thread-safe, e.g.
+    killing a process or scheduling a task cancel on its event loop.
+    """
+
+    def __init__(self, parent: "CancellationToken | None" = None):
+        self.reason: str | None = None
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: list[Callable[[], None]] = []
+        self._detach: Callable[[], None] | None = None
+        if parent is not None:
+            self._detach = parent.add_callback(
+                lambda: self.cancel(parent.reason or "cancelled")
+            )
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        """Cancel the token and run its callbacks, once"""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        logger.info(
+            "Cancellation requested",
+            extra={"reason": reason, "callbacks": len(callbacks)},
+        )
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.warning(
+                    f"Cancellation callback failed: {type(e).__name__}: {e}"
+                )
+
+    def add_callback(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Run a callback on cancellation, or now if already cancelled.
+
+        Returns:
+            A function that unregisters the callback.
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+
+                def remove() -> None:
+                    with self._lock:
+                        if callback in self._callbacks:
+                            self._callbacks.remove(callback)
+
+                return remove
+        callback()
+        return lambda: None
+
+    def child(self) -> "CancellationToken":
+        """Create a token cancelled together with this one.
+
+        Call :meth:`close` on the child when its work is done so the parent
+        does not keep it alive.
+        """
+        return CancellationToken(parent=self)
+
+    def close(self) -> None:
+        """Detach a child token from its parent"""
+        if self._detach is not None:
+            self._detach()
+            self._detach = None
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise TaskCancelledError(self.reason)
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until cancelled or the timeout elapses"""
+        return self._event.wait(timeout)
+
+    async def run(self, awaitable: Awaitable[T]) -> T:
+        """Await a coroutine, cancelling it as soon as the token is.
+
+        Raises:
+            TaskCancelledError: If the token was cancelled before or while
+                the coroutine ran.
+        """
+        if self.cancelled:
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+            raise TaskCancelledError(self.reason)
+        loop = asyncio.get_running_loop()
+        task = asyncio.ensure_future(awaitable)
+        remove = self.add_callback(
+            lambda: loop.call_soon_threadsafe(task.cancel)
+        )
+        try:
+            return await task
+        except asyncio.CancelledError:
+            if self.cancelled:
+                raise TaskCancelledError(self.reason) from None
+            raise
+        finally:
+            remove()
+
+
+# Token of the work running in the current context, see use_token
+_current_token = ContextVar["CancellationToken | None"](
+    "cancel_token", default=None
+)
+
+
+@contextmanager
+def use_token(token: CancellationToken | None) -> Iterator[None]:
+    """Make a token the one governing work started in this context, such
+    as the tool calls of an agent step"""
+    origin = _current_token.set(token)
+    try:
+        yield
+    finally:
+        _current_token.reset(origin)
+
+
+def current_token() -> CancellationToken | None:
+    """Get the token set by the enclosing :func:`use_token`, if any"""
+    return _current_token.get()
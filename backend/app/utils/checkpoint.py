@@ -0,0 +1,115 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+"""
+Durable workforce checkpoints, so a restarted backend can resume a project
+without re-running the subtasks that already finished
+"""
+
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any
+
+from camel.tasks.task import Task, TaskState
+
+from app.utils.sqlite_store import SQLiteStore
+
+logger = logging.getLogger("checkpoint")
+
+DEFAULT_CHECKPOINT_PATH = Path.home() / ".eigent" / "checkpoints.db"
+
+
+def task_to_dict(task: Task, depth: int = 0) -> dict[str, Any]:
+    """Serialize a task and its subtask tree to plain JSON types"""
+    return {
+        "id": task.id,
+        "content": task.content,
+        "state": TaskState(task.state).value,
+        "result": task.result,
+        "failure_count": task.failure_count,
+        "additional_info": task.additional_info,
+        "subtasks": [task_to_dict(sub, depth + 1) for sub in task.subtasks]
+        if depth < 5
+        else [],
+    }
+
+
+def task_from_dict(data: dict[str, Any]) -> Task:
+    """Rebuild a task tree serialized by :func:`task_to_dict`"""
+    task = Task(
+        id=data["id"],
+        content=data["content"],
+        state=TaskState(data["state"]),
+        result=data.get("result"),
+        failure_count=data.get("failure_count", 0),
+        additional_info=data.get("additional_info"),
+    )
+    for sub in data.get("subtasks", []):
+        task.add_subtask(task_from_dict(sub))
+    return task
+
+
+class CheckpointStore(SQLiteStore):
+    """SQLite store keeping the latest workforce checkpoint per project"""
+
+    schema = (
+        "CREATE TABLE IF NOT EXISTS checkpoints ("
+        "project_id TEXT PRIMARY KEY, "
+        "task_id TEXT NOT NULL, "
+        "updated_at REAL NOT NULL, "
+        "data TEXT NOT NULL)"
+    )
+
+    def __init__(self, path: str | Path = DEFAULT_CHECKPOINT_PATH):
+        super().__init__(path)
+
+    def save(self, project_id: str, task_id: str, state: dict) -> None:
+        """Replace the project's checkpoint with the given state"""
+        data = json.dumps(state, default=str)
+        with self._transaction(create=True) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO checkpoints "
+                "(project_id, task_id, updated_at, data) "
+                "VALUES (?, ?, ?, ?)",
+                (project_id, task_id, time.time(), data),
+            )
+        logger.debug(
+            "Checkpoint saved",
+            extra={"project_id": project_id, "task_id": task_id},
+        )
+
+    def load(self, project_id: str) -> dict | None:
+        """Get the project's latest checkpoint, or None if there is none"""
+        if not self.path.exists():
+            return None
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT data FROM checkpoints WHERE project_id = ?",
+                (project_id,),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def delete(self, project_id: str) -> None:
+        """Drop the project's checkpoint, if any"""
+        if not self.path.exists():
+            return
+        with self._transaction() as conn:
+            conn.execute(
+                "DELETE FROM checkpoints WHERE project_id = ?", (project_id,)
+            )
+        logger.debug("Checkpoint deleted", extra={"project_id": project_id})
+
+
+checkpoint_store = CheckpointStore()
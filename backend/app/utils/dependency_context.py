@@ -0,0 +1,231 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+"""
+Budgeted dependency results for subtask prompts, so prompt size does not
+grow with plan depth
+"""
+
+import asyncio
+import hashlib
+import logging
+import math
+import re
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from camel.agents import ChatAgent
+from camel.tasks.task import Task
+from pydantic import BaseModel
+
+logger = logging.getLogger("dependency_context")
+
+# Summarizes a dependency result, given the dependency's content and result
+Summarizer = Callable[[str, str], Awaitable[str]]
+
+_CODE_BLOCK_PATTERN = re.compile(r"```[^\n]*\n(.*?)```", re.DOTALL)
+
+# Absolute file paths, which agents are told to use for every file
+_FILE_PATH_PATTERN = re.compile(
+    r"(?:~?/|[A-Za-z]:\\)[^\s`'\"<>|*?]+\.[A-Za-z0-9]{1,5}\b"
+)
+
+DEPENDENCY_SUMMARY_PROMPT = """\
+A later subtask depends on the result of this subtask:
+---
+{content}
+---
+Result:
+---
+{result}
+---
+Summarize the result in at most {max_words} words. Keep every fact, number,
+decision, URL and file path a later subtask may need, and drop everything
+else. Return only the summary."""
+
+
+class DependencyContextConfig(BaseModel):
+    enabled: bool = True
+    # Most estimated tokens of dependency results in one subtask prompt
+    token_budget: int = 4000
+    # Longest single result inlined as it is; longer ones are summarized
+    max_result_tokens: int = 1500
+    # Fewest tokens kept of a result once the budget is used up
+    min_result_tokens: int = 100
+    # Longest code block kept in a result over its limit; longer ones
+    # point to the file holding the code, when there is one
+    max_code_block_chars: int = 2000
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of English text and code"""
+    return math.ceil(len(text) / 4)
+
+
+def reference_files(result: str, config: DependencyContextConfig) -> str:
+    """Replace long code blocks in a result with a pointer to the file it
+    mentions that holds the code, which the subtask can read if it needs
+    it. Code found in no such file is kept."""
+    contents: dict[str, str | None] = {}
+
+    def read(path: str) -> str | None:
+        if path not in contents:
+            try:
+                contents[path] = (
+                    Path(path).expanduser().read_text(errors="replace")
+                )
+            except (OSError, ValueError):
+                contents[path] = None
+        return contents[path]
+
+    paths = list(dict.fromkeys(_FILE_PATH_PATTERN.findall(result)))
+
+    def replace(match: re.Match) -> str:
+        body = match.group(1)
+        if len(body) <= config.max_code_block_chars:
+            return match.group(0)
+        code = body.strip()
+        for path in paths:
+            text = read(path)
+            if text is not None and code in text:
+                return f"[{body.count(chr(10))} lines omitted, see {path}]"
+        return match.group(0)
+
+    return _CODE_BLOCK_PATTERN.sub(replace, result)
+
+
+def truncate(text: str, max_tokens: int) -> str:
+    """Keep the start and end of a text within a token estimate"""
+    max_chars = max_tokens * 4
+    if len(text) <= max_chars:
+        return text
+    half = max_chars // 2
+    omitted = len(text) - 2 * half
+    return (
+        f"{text[:half]}\n[... {omitted} characters omitted ...]\n"
+        f"{text[-half:]}"
+    )
+
+
+_summary_locks: dict[str, asyncio.Lock] = {}
+
+
+async def summarized_result(
+    dependency: Task, result: str, summarize: Summarizer
+) -> str:
+    """Summarize a dependency result once, caching the summary on the
+    dependency so later subtasks reuse it"""
+    digest = hashlib.sha256(result.encode()).hexdigest()
+    lock = _summary_locks.setdefault(digest, asyncio.Lock())
+    try:
+        async with lock:
+            info = dependency.additional_info or {}
+            cached = info.get("result_summary") or {}
+            if cached.get("result_hash") == digest:
+                return cached["summary"]
+            summary = await summarize(dependency.content, result)
+            if dependency.additional_info is None:
+                dependency.additional_info = {}
+            dependency.additional_info["result_summary"] = {
+                "result_hash": digest,
+                "summary": summary,
+            }
+            return summary
+    finally:
+        if not lock.locked() and _summary_locks.get(digest) is lock:
+            del _summary_locks[digest]
+
+
+async def build_dependency_info(
+    dependencies: list[Task],
+    config: DependencyContextConfig,
+    summarize: Summarizer | None = None,
+) -> str:
+    """Format dependency results for a subtask prompt within a budget.
+
+    Walking from the most recent dependency back, results fitting the
+    remaining budget are inlined. In larger ones, long code blocks written
+    to files become file references, then results still too large are
+    summarized when a summarizer is given, and whatever is left over the
+    limit is truncated.
+
+    Args:
+        dependencies: The subtask's dependencies, oldest first.
+        config: Budget of the dependency section.
+        summarize: Optional summarizer for oversized results.
+
+    Returns:
+        The dependency section in the format of the workforce prompt.
+    """
+    remaining = config.token_budget
+    results: dict[str, str] = {}
+    for dependency in reversed(dependencies):
+        result = str(dependency.result or "")
+        limit = max(
+            min(config.max_result_tokens, remaining), config.min_result_tokens
+        )
+        if estimate_tokens(result) > limit:
+            # Reads the files the result mentions
+            result = await asyncio.to_thread(reference_files, result, config)
+        if estimate_tokens(result) > limit and summarize is not None:
+            try:
+                result = await summarized_result(dependency, result, summarize)
+            except Exception as e:
+                logger.warning(
+                    f"Dependency summary failed, truncating instead: "
+                    f"{type(e).__name__}: {e}",
+                    extra={"task_id": dependency.id},
+                )
+        result = truncate(result, limit)
+        remaining = max(0, remaining - estimate_tokens(result))
+        results[dependency.id] = result
+
+    return "\n".join(
+        f"id: {dependency.id}, content: {dependency.content}. "
+        f"result: {results[dependency.id]}."
+        for dependency in dependencies
+    )
+
+
+def agent_summarizer(
+    create_agent: Callable[[], ChatAgent],
+    max_words: int = 200,
+    max_agents: int = 4,
+) -> Summarizer:
+    """Build a summarizer running on a small pool of agents created on
+    demand.
+
+    Up to max_agents summaries run at once, each on its own agent, which
+    is reset before use so summaries do not share context.
+    """
+    idle: list[ChatAgent] = []
+    slots = asyncio.Semaphore(max_agents)
+
+    async def summarize(content: str, result: str) -> str:
+        async with slots:
+            if idle:
+                agent = idle.pop()
+            else:
+                agent = await asyncio.to_thread(create_agent)
+            try:
+                agent.reset()
+                response = await agent.astep(
+                    DEPENDENCY_SUMMARY_PROMPT.format(
+                        content=content, result=result, max_words=max_words
+                    )
+                )
+                return response.msgs[0].content
+            finally:
+                idle.append(agent)
+
+    return summarize
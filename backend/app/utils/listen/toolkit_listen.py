@@ -17,18 +17,32 @@ import json
 import logging
 import queue
 import threading
+import time
 from collections.abc import Callable
 from datetime import datetime
 from functools import wraps
 from inspect import iscoroutinefunction, signature
 from typing import Any, TypeVar
 
+from opentelemetry.trace import Span, Status, StatusCode
+
 from app.service.task import (
     ActionActivateToolkitData,
     ActionDeactivateToolkitData,
     get_task_lock,
     process_task,
 )
+from app.utils.metrics import record_tool_call
+from app.utils.telemetry.spans import (
+    ATTR_AGENT_NAME,
+    ATTR_BYTES_IN,
+    ATTR_BYTES_OUT,
+    ATTR_TOOL_METHOD,
+    ATTR_TOOLKIT_NAME,
+    SPAN_TOOL_CALL,
+    span,
+)
+from app.utils.tool_stats import payload_size
 from app.utils.toolkit.abstract_toolkit import AbstractToolkit
 
 logger = logging.getLogger("toolkit_listen")
@@ -171,6 +185,49 @@ def _log_deactivate(
     )
 
 
+def _record_stats(
+    task_lock,
+    tool_span: Span,
+    toolkit: "AbstractToolkit",
+    toolkit_name: str,
+    func_name: str,
+    seconds: float,
+    args: tuple,
+    kwargs: dict,
+    res: Any,
+    error: Exception | None,
+) -> None:
+    """Record a finished call in the runtime metrics, the project's
+    per-tool statistics and its trace span."""
+    bytes_in = sum(payload_size(arg) for arg in args[1:]) + sum(
+        payload_size(value) for value in kwargs.values()
+    )
+    bytes_out = payload_size(str(error) if error is not None else res)
+    record_tool_call(toolkit_name, func_name, seconds, error is not None)
+    task_lock.tool_stats.record(
+        toolkit_name,
+        func_name,
+        toolkit.agent_name,
+        seconds,
+        bytes_in=bytes_in,
+        bytes_out=bytes_out,
+        error=error is not None,
+    )
+    if tool_span.is_recording():
+        tool_span.set_attributes(
+            {
+                ATTR_TOOLKIT_NAME: toolkit_name,
+                ATTR_TOOL_METHOD: func_name,
+                ATTR_AGENT_NAME: toolkit.agent_name,
+                ATTR_BYTES_IN: bytes_in,
+                ATTR_BYTES_OUT: bytes_out,
+            }
+        )
+        if error is not None:
+            tool_span.record_exception(error)
+            tool_span.set_status(Status(StatusCode.ERROR, str(error)))
+
+
 def _safe_put_queue(task_lock, data):
     """Safely put data to the queue, handling both sync and async contexts"""
     try:
@@ -307,10 +364,24 @@ def listen_toolkit(
 
                 error = None
                 res = None
-                try:
-                    res = await func(*args, **kwargs)
-                except Exception as e:
-                    error = e
+                started = time.monotonic()
+                with span(SPAN_TOOL_CALL) as tool_span:
+                    try:
+                        res = await func(*args, **kwargs)
+                    except Exception as e:
+                        error = e
+                _record_stats(
+                    task_lock,
+                    tool_span,
+                    toolkit,
+                    toolkit_name,
+                    func.__name__,
+                    time.monotonic() - started,
+                    args,
+                    kwargs,
+                    res,
+                    error,
+                )
 
                 res_msg = _format_result(res, error, return_msg)
                 _log_deactivate(
@@ -367,22 +438,37 @@ def listen_toolkit(
 
                 error = None
                 res = None
-                try:
-                    res = func(*args, **kwargs)
-                    # Safety check: if the result is a coroutine,
-                    # this is a programming error
-                    if asyncio.iscoroutine(res):
-                        error_msg = (
-                            f"Async function {func.__name__} "
-                            f"was incorrectly called in sync context. "
-                            f"This is a bug - the function should be marked "
-                            f"as async or should not return a coroutine."
-                        )
-                        logger.error(f"[listen_toolkit] {error_msg}")
-                        res.close()
-                        raise TypeError(error_msg)
-                except Exception as e:
-                    error = e
+                started = time.monotonic()
+                with span(SPAN_TOOL_CALL) as tool_span:
+                    try:
+                        res = func(*args, **kwargs)
+                        # Safety check: if the result is a coroutine,
+                        # this is a programming error
+                        if asyncio.iscoroutine(res):
+                            error_msg = (
+                                f"Async function {func.__name__} "
+                                f"was incorrectly called in sync context. "
+                                f"This is a bug - the function should be "
+                                f"marked as async or should not return a "
+                                f"coroutine."
+                            )
+                            logger.error(f"[listen_toolkit] {error_msg}")
+                            res.close()
+                            raise TypeError(error_msg)
+                    except Exception as e:
+                        error = e
+                _record_stats(
+                    task_lock,
+                    tool_span,
+                    toolkit,
+                    toolkit_name,
+                    func.__name__,
+                    time.monotonic() - started,
+                    args,
+                    kwargs,
+                    res,
+                    error,
+                )
 
                 res_msg = _format_result(res, error, return_msg)
                 _log_deactivate(
@@ -0,0 +1,229 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+"""
+Event loop lag watchdog that logs the stack of whatever is blocking the
+loop, so blocking calls show up before users report a frozen UI
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from types import FrameType
+
+from pydantic import BaseModel
+
+from app.utils.metrics import loop_block_duration, loop_blocks
+
+logger = logging.getLogger("loop_watchdog")
+
+# Lag in milliseconds that counts as a blocked loop, 0 disables the watchdog
+ENV_LOOP_LAG_THRESHOLD_MS = "EIGENT_LOOP_LAG_THRESHOLD_MS"
+DEFAULT_LOOP_LAG_THRESHOLD_MS = 250
+
+# Locals naming the project a blocked frame works for, checked from the
+# innermost frame outwards: (local name, attribute or None for the value)
+_PROJECT_LOCALS = (
+    ("project_id", None),
+    ("self", "api_task_id"),
+    ("options", "project_id"),
+    ("task_lock", "id"),
+)
+
+
+class BlockingCallError(RuntimeError):
+    """Raised in strict mode when the event loop was blocked"""
+
+
+class LoopBlock(BaseModel):
+    seconds: float
+    project_id: str | None = None
+    # Stack of the loop thread captured while it was blocked
+    stack: str
+
+
+def frame_project_id(frame: FrameType | None) -> str | None:
+    """Find the project a blocked stack works for from its frames' locals"""
+    while frame is not None:
+        frame_locals = frame.f_locals
+        for name, attr in _PROJECT_LOCALS:
+            value = frame_locals.get(name)
+            if attr is not None:
+                value = getattr(value, attr, None)
+            if isinstance(value, str) and value:
+                return value
+        frame = frame.f_back
+    return None
+
+
+class LoopWatchdog:
+    """Measures event loop lag with a heartbeat task.
+
+    A helper thread watches the heartbeat. When it stalls past
+    ``threshold`` seconds, the helper snapshots the loop thread's stack;
+    once the loop recovers, the block is logged with that stack and its
+    project, and counted in the metrics. Time the loop spends stopped,
+    e.g. between the phases of a test, is not lag.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.25,
+        interval: float = 0.05,
+        max_blocks: int = 100,
+    ):
+        self.threshold = threshold
+        self.interval = interval
+        # Lag of the latest heartbeat in seconds
+        self.lag = 0.0
+        self.blocks: deque[LoopBlock] = deque(maxlen=max_blocks)
+        self._beat = time.monotonic()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._heartbeat_task: asyncio.Task | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start watching the running event loop"""
+        if self.running:
+            return
+        loop = asyncio.get_running_loop()
+        self._loop = loop
+        self._loop_thread_id = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stop.clear()
+        self._heartbeat_task = loop.create_task(self._heartbeat())
+        self._thread = threading.Thread(
+            target=self._watch, name="loop-watchdog", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def raise_if_blocked(self) -> None:
+        """Raise with the recorded stacks if the loop was ever blocked"""
+        if not self.blocks:
+            return
+        details = "\n".join(
+            f"Blocked {block.seconds:.3f}s"
+            f" (project {block.project_id}):\n{block.stack}"
+            for block in self.blocks
+        )
+        raise BlockingCallError(
+            f"Event loop blocked {len(self.blocks)} time(s)\n{details}"
+        )
+
+    async def _heartbeat(self) -> None:
+        while True:
+            before = time.monotonic()
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self.lag = max(0.0, now - before - self.interval)
+            self._beat = now
+
+    def _watch(self) -> None:
+        stalled_beat: float | None = None
+        stack = ""
+        project_id = None
+        # Last time the loop was seen stopped, which restarts the clock
+        stopped_at = 0.0
+        while not self._stop.wait(self.interval / 2):
+            if self._loop is not None and not self._loop.is_running():
+                stopped_at = time.monotonic()
+                if stalled_beat is not None:
+                    # Blocked until the loop stopped
+                    self._record(
+                        LoopBlock(
+                            seconds=round(
+                                stopped_at - stalled_beat - self.interval, 3
+                            ),
+                            project_id=project_id,
+                            stack=stack,
+                        )
+                    )
+                    stalled_beat = None
+                continue
+            beat = max(self._beat, stopped_at)
+            if stalled_beat is None:
+                if time.monotonic() - beat < self.interval + self.threshold:
+                    continue
+                frame = sys._current_frames().get(self._loop_thread_id)
+                if frame is None:
+                    continue
+                stalled_beat = beat
+                stack = "".join(traceback.format_stack(frame))
+                project_id = frame_project_id(frame)
+                del frame
+            elif beat != stalled_beat:
+                self._record(
+                    LoopBlock(
+                        seconds=round(beat - stalled_beat - self.interval, 3),
+                        project_id=project_id,
+                        stack=stack,
+                    )
+                )
+                stalled_beat = None
+
+    def _record(self, block: LoopBlock) -> None:
+        self.blocks.append(block)
+        loop_blocks.inc()
+        loop_block_duration.observe(block.seconds)
+        logger.warning(
+            f"Event loop blocked for {block.seconds:.3f}s"
+            f" (project {block.project_id}):\n{block.stack}",
+            extra={
+                "project_id": block.project_id,
+                "seconds": block.seconds,
+            },
+        )
+
+
+loop_watchdog = LoopWatchdog()
+
+
+def start_loop_watchdog() -> bool:
+    """Start the shared watchdog on the running loop unless disabled.
+
+    Returns:
+        Whether the watchdog is running.
+    """
+    try:
+        threshold_ms = float(
+            os.getenv(ENV_LOOP_LAG_THRESHOLD_MS)
+            or DEFAULT_LOOP_LAG_THRESHOLD_MS
+        )
+    except ValueError:
+        logger.warning(f"Invalid {ENV_LOOP_LAG_THRESHOLD_MS}, using default")
+        threshold_ms = DEFAULT_LOOP_LAG_THRESHOLD_MS
+    if threshold_ms <= 0:
+        return False
+    loop_watchdog.threshold = threshold_ms / 1000
+    loop_watchdog.start()
+    return True
@@ -0,0 +1,265 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+"""
+In-process runtime metrics rendered in the Prometheus text exposition
+format, so the backend can be scraped without an external collector
+"""
+
+import math
+import threading
+from collections.abc import Callable, Iterable
+
+Labels = dict[str, str]
+LabelKey = tuple[tuple[str, str], ...]
+
+# Seconds, covering quick tool calls up to long model generations
+DEFAULT_BUCKETS = (
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0
+)  # fmt: skip
+
+
+def _key(labels: Labels) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(key: Iterable[tuple[str, str]]) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in key]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str):
+        self.name = name
+        self.help = help
+        self._lock = threading.Lock()
+
+    def header(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {self.help}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+
+    def render(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str):
+        super().__init__(name, help)
+        self._values: dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = _key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(_key(labels), 0.0)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return self.header() + [
+            f"{self.name}{_format_labels(key)} {_format_value(value)}"
+            for key, value in values
+        ]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: bucket counts, then sum and count
+        self._values: dict[LabelKey, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = _key(labels)
+        with self._lock:
+            counts, totals = self._values.setdefault(
+                key, ([0] * len(self.buckets), [0.0, 0.0])
+            )
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            totals[0] += value
+            totals[1] += 1
+
+    def count(self, **labels: str) -> int:
+        with self._lock:
+            entry = self._values.get(_key(labels))
+            return int(entry[1][1]) if entry else 0
+
+    def render(self) -> list[str]:
+        with self._lock:
+            values = sorted(
+                (key, (list(counts), list(totals)))
+                for key, (counts, totals) in self._values.items()
+            )
+        lines = self.header()
+        for key, (counts, (total, count)) in values:
+            for bound, bucket_count in zip(
+                (*self.buckets, math.inf), (*counts, int(count))
+            ):
+                labels = _format_labels((*key, ("le", _format_value(bound))))
+                lines.append(f"{self.name}_bucket{labels} {bucket_count}")
+            labels = _format_labels(key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {int(count)}")
+        return lines
+
+
+class Gauge(_Metric):
+    """Gauge read from a callback when the metrics are scraped"""
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        collect: Callable[[], Iterable[tuple[Labels, float]]],
+    ):
+        super().__init__(name, help)
+        self.collect = collect
+
+    def render(self) -> list[str]:
+        return self.header() + [
+            f"{self.name}{_format_labels(_key(labels))} {_format_value(value)}"
+            for labels, value in self.collect()
+        ]
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _add(self, metric: _Metric) -> None:
+        with self._lock:
+            self._metrics[metric.name] = metric
+
+    def counter(self, name: str, help: str) -> Counter:
+        metric = Counter(name, help)
+        self._add(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        metric = Histogram(name, help, buckets)
+        self._add(metric)
+        return metric
+
+    def gauge(
+        self,
+        name: str,
+        help: str,
+        collect: Callable[[], Iterable[tuple[Labels, float]]],
+    ) -> Gauge:
+        metric = Gauge(name, help, collect)
+        self._add(metric)
+        return metric
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: list[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+sse_events = registry.counter(
+    "eigent_sse_events_total", "SSE events sent, by step"
+)
+sse_bytes = registry.counter(
+    "eigent_sse_bytes_total", "Bytes of SSE events sent, by step"
+)
+llm_calls = registry.counter(
+    "eigent_llm_calls_total", "Model calls, by model and outcome"
+)
+llm_latency = registry.histogram(
+    "eigent_llm_call_duration_seconds", "Latency of model calls, by model"
+)
+llm_tokens = registry.counter(
+    "eigent_llm_tokens_total", "Tokens used by model calls, by model and kind"
+)
+tool_calls = registry.counter(
+    "eigent_tool_calls_total", "Tool calls, by toolkit, method and outcome"
+)
+tool_latency = registry.histogram(
+    "eigent_tool_call_duration_seconds",
+    "Latency of tool calls, by toolkit and method",
+)
+
+loop_blocks = registry.counter(
+    "eigent_event_loop_blocks_total",
+    "Callbacks that blocked the event loop past the lag threshold",
+)
+loop_block_duration = registry.histogram(
+    "eigent_event_loop_block_duration_seconds",
+    "How long callbacks blocked the event loop",
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+
+
+def record_llm_call(
+    model: str, seconds: float, usage: dict | None, error: bool = False
+) -> None:
+    """Record one model call's outcome, latency and token usage"""
+    llm_calls.inc(model=model, outcome="error" if error else "ok")
+    llm_latency.observe(seconds, model=model)
+    usage = usage or {}
+    for kind in ("prompt_tokens", "completion_tokens"):
+        if usage.get(kind):
+            llm_tokens.inc(usage[kind], model=model, kind=kind)
+
+
+def record_tool_call(
+    toolkit: str, method: str, seconds: float, error: bool = False
+) -> None:
+    """Record one tool call's outcome and latency"""
+    tool_calls.inc(
+        toolkit=toolkit, method=method, outcome="error" if error else "ok"
+    )
+    tool_latency.observe(seconds, toolkit=toolkit, method=method)
@@ -0,0 +1,136 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+"""
+Per-role model latency, token and cost accounting for a project
+"""
+
+import threading
+
+from pydantic import BaseModel
+
+# USD per million prompt and completion tokens, matched by model prefix
+MODEL_PRICES: dict[str, tuple[float, float]] = {
+    "gpt-4o-mini": (0.15, 0.6),
+    "gpt-4o": (2.5, 10.0),
+    "gpt-4.1-nano": (0.1, 0.4),
+    "gpt-4.1-mini": (0.4, 1.6),
+    "gpt-4.1": (2.0, 8.0),
+    "claude-3-5-haiku": (0.8, 4.0),
+    "claude-sonnet-4": (3.0, 15.0),
+    "claude-opus-4": (15.0, 75.0),
+    "gemini-2.5-flash": (0.3, 2.5),
+    "gemini-2.5-pro": (1.25, 10.0),
+}
+
+
+def model_price(model: str) -> tuple[float, float] | None:
+    """Get the price of a model, matching the longest known prefix"""
+    matches = [prefix for prefix in MODEL_PRICES if model.startswith(prefix)]
+    if not matches:
+        return None
+    return MODEL_PRICES[max(matches, key=len)]
+
+
+def cached_prompt_tokens(usage: dict) -> int:
+    """Get the prompt tokens a provider served from its prompt cache"""
+    details = usage.get("prompt_tokens_details") or {}
+    return (
+        details.get("cached_tokens")
+        # Anthropic
+        or usage.get("cache_read_input_tokens")
+        # DeepSeek
+        or usage.get("prompt_cache_hit_tokens")
+        or 0
+    )
+
+
+class RoleUsage(BaseModel):
+    model: str
+    calls: int = 0
+    seconds: float = 0.0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_prompt_tokens: int = 0
+
+    @property
+    def cost_usd(self) -> float | None:
+        price = model_price(self.model)
+        if price is None:
+            return None
+        return (
+            self.prompt_tokens * price[0] + self.completion_tokens * price[1]
+        ) / 1_000_000
+
+
+class ModelUsageTracker:
+    """Accumulates model calls per agent role, for reporting how much
+    time and money each role costs"""
+
+    def __init__(self) -> None:
+        self._roles: dict[str, RoleUsage] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        role: str,
+        model: str,
+        seconds: float,
+        usage: dict | None = None,
+    ) -> None:
+        usage = usage or {}
+        with self._lock:
+            entry = self._roles.setdefault(role, RoleUsage(model=model))
+            entry.calls += 1
+            entry.seconds += seconds
+            entry.prompt_tokens += usage.get("prompt_tokens") or 0
+            entry.completion_tokens += usage.get("completion_tokens") or 0
+
+    def record_cache_hit(self, role: str, model: str, tokens: int) -> None:
+        """Count prompt tokens of one model call served from cache"""
+        with self._lock:
+            entry = self._roles.setdefault(role, RoleUsage(model=model))
+            entry.cached_prompt_tokens += tokens
+
+    def report(self) -> dict[str, dict]:
+        """Summarize usage per role, slowest role first"""
+        with self._lock:
+            entries = list(self._roles.items())
+        entries.sort(key=lambda item: item[1].seconds, reverse=True)
+        return {
+            role: {
+                "model": usage.model,
+                "calls": usage.calls,
+                "seconds": round(usage.seconds, 3),
+                # None for a role whose only call is still running or failed
+                "avg_seconds": (
+                    round(usage.seconds / usage.calls, 3)
+                    if usage.calls
+                    else None
+                ),
+                "prompt_tokens": usage.prompt_tokens,
+                "completion_tokens": usage.completion_tokens,
+                "cached_prompt_tokens": usage.cached_prompt_tokens,
+                "cache_hit_rate": (
+                    round(usage.cached_prompt_tokens / usage.prompt_tokens, 3)
+                    if usage.prompt_tokens
+                    else None
+                ),
+                "cost_usd": (
+                    None
+                    if usage.cost_usd is None
+                    else round(usage.cost_usd, 6)
+                ),
+            }
+            for role, usage in entries
+        }
@@ -0,0 +1,127 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+"""
+Deterministic checks that accept a subtask result without asking the LLM
+to evaluate its quality
+"""
+
+import os
+import re
+from collections.abc import Callable
+
+from camel.tasks.task import Task, is_task_result_insufficient
+from pydantic import BaseModel
+
+# File names such as "report.md" or "data_2024.csv" mentioned in a subtask
+_FILE_NAME_PATTERN = re.compile(r"\b[\w\-]+\.[A-Za-z][A-Za-z0-9]{0,4}\b")
+
+# Extensions that look like file names but are usually domains or versions
+_NON_FILE_SUFFIXES = {"com", "org", "net", "io", "ai", "dev", "app"}
+
+
+class QualityPreCheckConfig(BaseModel):
+    enabled: bool = True
+    # Shortest result accepted without LLM analysis
+    min_result_length: int = 20
+    # Most failed tool calls accepted without LLM analysis
+    max_tool_errors: int = 0
+    # Quality score reported for results accepted by the pre-check
+    accepted_quality_score: int = 85
+    # Project directory expected files are looked up in
+    working_directory: str | None = None
+    # Directory levels below the working directory searched for files
+    max_file_search_depth: int = 2
+    # Most directory entries looked at before giving up on a file
+    max_file_search_entries: int = 2000
+
+
+QualityPreCheck = Callable[[Task, QualityPreCheckConfig], bool]
+
+
+def non_empty_result(task: Task, config: QualityPreCheckConfig) -> bool:
+    """Pass when the result has substance rather than a placeholder"""
+    result = str(task.result or "").strip()
+    return len(result) >= config.min_result_length and (
+        not is_task_result_insufficient(task)
+    )
+
+
+def no_tool_errors(task: Task, config: QualityPreCheckConfig) -> bool:
+    """Pass when the last attempt had few enough failed tool calls"""
+    info = task.additional_info or {}
+    attempts = info.get("worker_attempts") or []
+    if not attempts:
+        # Memoized results were accepted when they were first produced
+        return bool(info.get("memo_hit"))
+    return attempts[-1].get("tool_errors", 0) <= config.max_tool_errors
+
+
+def _find_files(
+    root: str, names: set[str], max_depth: int, max_entries: int
+) -> set[str]:
+    """Find the given file names breadth first, at most max_depth levels
+    below root and looking at no more than max_entries entries"""
+    found: set[str] = set()
+    level = [root]
+    seen = 0
+    for _ in range(max_depth + 1):
+        next_level = []
+        for directory in level:
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                seen += 1
+                if seen > max_entries:
+                    return found
+                if entry.name in names and entry.is_file():
+                    found.add(entry.name)
+                elif not entry.name.startswith(".") and entry.is_dir(
+                    follow_symlinks=False
+                ):
+                    next_level.append(entry.path)
+            if found == names:
+                return found
+        level = next_level
+    return found
+
+
+def expected_files_written(task: Task, config: QualityPreCheckConfig) -> bool:
+    """Pass when every file named in the subtask exists in the working
+    directory, within the configured search bounds"""
+    names = {
+        name
+        for name in _FILE_NAME_PATTERN.findall(task.content)
+        if name.rsplit(".", 1)[1].lower() not in _NON_FILE_SUFFIXES
+    }
+    if not names:
+        return True
+    working_directory = config.working_directory
+    if not working_directory or not os.path.isdir(working_directory):
+        return False
+    found = _find_files(
+        working_directory,
+        names,
+        config.max_file_search_depth,
+        config.max_file_search_entries,
+    )
+    return found == names
+
+
+DEFAULT_QUALITY_PRECHECKS: tuple[QualityPreCheck, ...] = (
+    non_empty_result,
+    no_tool_errors,
+    expected_files_written,
+)
@@ -0,0 +1,133 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+"""
+In-process sampling profiler producing folded stacks for flamegraphs,
+for profiling a running backend without restarting it
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+
+logger = logging.getLogger("sampling_profiler")
+
+# Leaf frames of threads that are blocked waiting rather than working
+_IDLE_FILES = ("selectors.py", "threading.py", "queue.py")
+
+# Stack key counting the samples dropped once max_stacks distinct
+# stacks were seen
+TRUNCATED = "[truncated]"
+
+
+def _label(frame: FrameType) -> str:
+    code = frame.f_code
+    return (
+        f"{code.co_name} "
+        f"({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+    )
+
+
+class SamplingProfiler:
+    """Samples the stacks of all threads from a background thread.
+
+    Overhead is bounded: sampling waits at least ``interval`` between
+    samples, and stretches that wait so sampling itself takes at most
+    ``max_overhead`` of one core.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.01,
+        max_overhead: float = 0.05,
+        max_depth: int = 128,
+        max_stacks: int = 20000,
+        include_idle: bool = False,
+    ):
+        self.interval = interval
+        self.max_overhead = max_overhead
+        self.max_depth = max_depth
+        self.max_stacks = max_stacks
+        self.include_idle = include_idle
+        self.samples = 0
+        self.started_at: float | None = None
+        self.stopped_at: float | None = None
+        self._stacks: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            raise RuntimeError("Profiler was already started")
+        self.started_at = time.monotonic()
+        self._thread = threading.Thread(
+            target=self._run, name="sampling-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        if self.stopped_at is None:
+            self.stopped_at = time.monotonic()
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.is_set():
+            began = time.perf_counter()
+            self._sample(own_id)
+            spent = time.perf_counter() - began
+            self._stop.wait(
+                max(self.interval, spent / self.max_overhead - spent)
+            )
+
+    def _sample(self, own_id: int) -> None:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_id:
+                continue
+            if not self.include_idle and frame.f_code.co_filename.endswith(
+                _IDLE_FILES
+            ):
+                continue
+            labels = []
+            current: FrameType | None = frame
+            while current is not None and len(labels) < self.max_depth:
+                labels.append(_label(current))
+                current = current.f_back
+            labels.append(names.get(thread_id, str(thread_id)))
+            stack = ";".join(reversed(labels))
+            with self._lock:
+                if stack not in self._stacks and len(self._stacks) >= (
+                    self.max_stacks
+                ):
+                    stack = TRUNCATED
+                self._stacks[stack] += 1
+        self.samples += 1
+
+    def folded(self) -> str:
+        """Render samples as folded stacks, one ``stack count`` per line,
+        the input format of flamegraph.pl and speedscope"""
+        with self._lock:
+            stacks = sorted(self._stacks.items())
+        return "".join(f"{stack} {count}\n" for stack, count in stacks)
@@ -12,6 +12,7 @@
 # limitations under the License.
 # ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
 
+import asyncio
 import datetime
 import logging
 
@@ -23,13 +24,29 @@ from camel.societies.workforce.single_agent_worker import (
 from camel.societies.workforce.utils import TaskResult
 from camel.tasks.task import Task, TaskState, is_task_result_insufficient
 from camel.utils.context_utils import ContextUtility
-from colorama import Fore
 
 from app.agent.listen_chat_agent import ListenChatAgent
+from app.service.task import get_task_lock_if_exists
+from app.utils.cancellation import TaskCancelledError, use_token
+from app.utils.dependency_context import (
+    DependencyContextConfig,
+    Summarizer,
+    build_dependency_info,
+)
+from app.utils.subtask_memo import SubtaskMemoStore, memo_key
 
 logger = logging.getLogger("single_agent_worker")
 
 
+def _is_tool_error(record) -> bool:
+    result = getattr(record, "result", None)
+    if isinstance(result, dict):
+        return "error" in result
+    return isinstance(result, str) and result.startswith(
+        "Tool execution failed"
+    )
+
+
 class SingleAgentWorker(BaseSingleAgentWorker):
     def __init__(
         self,
@@ -42,6 +59,10 @@ class SingleAgentWorker(BaseSingleAgentWorker):
         use_structured_output_handler: bool = True,
         context_utility: ContextUtility | None = None,
         enable_workflow_memory: bool = False,
+        memo_store: SubtaskMemoStore | None = None,
+        dependency_context: DependencyContextConfig | None = None,
+        dependency_summarizer: Summarizer | None = None,
+        working_directory: str | None = None,
     ) -> None:
         logger.info(
             "Initializing SingleAgentWorker",
@@ -51,6 +72,7 @@ class SingleAgentWorker(BaseSingleAgentWorker):
                 "use_agent_pool": use_agent_pool,
                 "pool_max_size": pool_max_size,
                 "enable_workflow_memory": enable_workflow_memory,
+                "memoize_results": memo_store is not None,
             },
         )
         super().__init__(
@@ -65,6 +87,30 @@ class SingleAgentWorker(BaseSingleAgentWorker):
             enable_workflow_memory=enable_workflow_memory,
         )
         self.worker = worker  # change type hint
+        self.memo_store = memo_store
+        self.dependency_context = (
+            dependency_context or DependencyContextConfig()
+        )
+        self.dependency_summarizer = dependency_summarizer
+        # Project directory the worker writes files to
+        self.working_directory = working_directory
+
+    def _memo_key(self, task: Task, dependencies: list[Task]) -> str:
+        model_type = getattr(self.worker.model_backend, "model_type", None)
+        return memo_key(
+            task.content,
+            (dep.result for dep in dependencies),
+            self.description,
+            str(getattr(model_type, "value", model_type)),
+            self.working_directory or "",
+        )
+
+    async def _dependency_info(self, dependencies: list[Task]) -> str:
+        if not dependencies or not self.dependency_context.enabled:
+            return self._get_dep_tasks_info(dependencies)
+        return await build_dependency_info(
+            dependencies, self.dependency_context, self.dependency_summarizer
+        )
 
     async def _process_task(
         self, task: Task, dependencies: list[Task]
@@ -75,7 +121,10 @@ class SingleAgentWorker(BaseSingleAgentWorker):
         This method asynchronously processes a given task, considering its
         dependencies, by sending a generated prompt to a worker agent.
         Uses an agent pool for efficiency when enabled, or falls back to
-        cloning when pool is disabled.
+        cloning when pool is disabled. When a memo store is set, a result
+        cached for an identical subtask is returned without running it.
+        The work is interrupted as soon as the subtask's cancellation
+        token is cancelled.
 
         Args:
             task (Task): The task to process, which includes necessary details
@@ -84,8 +133,51 @@ class SingleAgentWorker(BaseSingleAgentWorker):
 
         Returns:
             TaskState: `TaskState.DONE` if processed successfully, otherwise
-                `TaskState.FAILED`.
+                `TaskState.FAILED`. Cancelled subtasks are marked as such
+                in their additional info.
         """
+        task_lock = get_task_lock_if_exists(self.worker.api_task_id)
+        if task_lock is None:
+            return await self._run_task(task, dependencies)
+
+        token = task_lock.subtask_token(task.id)
+        try:
+            # The agent and its tools keep this token for the whole subtask
+            with use_token(token):
+                return await token.run(self._run_task(task, dependencies))
+        except TaskCancelledError:
+            logger.info(
+                "Task processing cancelled",
+                extra={"task_id": task.id, "reason": token.reason},
+            )
+            # The workforce fails cancelled subtasks without retrying them
+            task.result = f"Task cancelled: {token.reason}"
+            if task.additional_info is None:
+                task.additional_info = {}
+            task.additional_info["cancelled"] = True
+            return TaskState.FAILED
+        finally:
+            task_lock.release_subtask_token(task.id)
+
+    async def _run_task(
+        self, task: Task, dependencies: list[Task]
+    ) -> TaskState:
+        key = None
+        # Results are only reused within the project that wrote their files
+        if self.memo_store is not None and self.working_directory:
+            key = self._memo_key(task, dependencies)
+            cached_result = await asyncio.to_thread(self.memo_store.get, key)
+            if cached_result is not None:
+                logger.info(
+                    "Subtask result served from memo",
+                    extra={"task_id": task.id},
+                )
+                task.result = cached_result
+                if task.additional_info is None:
+                    task.additional_info = {}
+                task.additional_info["memo_hit"] = True
+                return TaskState.DONE
+
         # Get agent efficiently (from pool or by cloning)
         worker_agent = await self._get_worker_agent()
         worker_agent.process_task_id = task.id  # type: ignore  rewrite line
@@ -102,7 +194,7 @@ class SingleAgentWorker(BaseSingleAgentWorker):
         response_content = ""
         final_response = None
         try:
-            dependency_tasks_info = self._get_dep_tasks_info(dependencies)
+            dependency_tasks_info = await self._dependency_info(dependencies)
             prompt = PROCESS_TASK_PROMPT.format(
                 content=task.content,
                 parent_task_content=task.parent.content if task.parent else "",
@@ -260,6 +352,11 @@ class SingleAgentWorker(BaseSingleAgentWorker):
         response_for_info = (
             final_response if final_response is not None else response
         )
+        tool_calls = (
+            response_for_info.info.get("tool_calls", [])
+            if response_for_info and hasattr(response_for_info, "info")
+            else []
+        )
         worker_attempt_details = {
             "agent_id": getattr(
                 worker_agent, "agent_id", worker_agent.role_name
@@ -274,11 +371,10 @@ class SingleAgentWorker(BaseSingleAgentWorker):
             f"{getattr(self.worker, 'agent_id', self.worker.role_name)}) "
             f"to process task: {task.content}",
             "response_content": response_content[:50],
-            "tool_calls": str(
-                response_for_info.info.get("tool_calls", [])
-                if response_for_info and hasattr(response_for_info, "info")
-                else []
-            )[:50],
+            "tool_calls": str(tool_calls)[:50],
+            "tool_errors": sum(
+                1 for call in tool_calls if _is_tool_error(call)
+            ),
             "total_tokens": total_tokens,
         }
 
@@ -290,8 +386,6 @@ class SingleAgentWorker(BaseSingleAgentWorker):
         # Store the actual token usage for this specific task
         task.additional_info["token_usage"] = {"total_tokens": total_tokens}
 
-        print(f"======\n{Fore.GREEN}Response from {self}:{Fore.RESET}")
-
         logger.info(f"Response from {self}:")
 
         if not self.use_structured_output_handler:
@@ -300,19 +394,11 @@ class SingleAgentWorker(BaseSingleAgentWorker):
                 logger.error(
                     "Error in worker step execution: Invalid task result"
                 )
-                print(
-                    f"{Fore.RED}Error in worker step execution: Invalid task result{Fore.RESET}"
-                )
                 task_result = TaskResult(
                     content="Failed to generate valid task result.",
                     failed=True,
                 )
 
-        color = Fore.RED if task_result.failed else Fore.GREEN  # type: ignore[union-attr]
-        print(
-            f"\n{color}{task_result.content}{Fore.RESET}\n======",  # type: ignore[union-attr]
-        )
-
         if task_result.failed:  # type: ignore[union-attr]
             logger.error(f"{task_result.content}")  # type: ignore[union-attr]
         else:
@@ -328,4 +414,7 @@ class SingleAgentWorker(BaseSingleAgentWorker):
                 f"Task {task.id}: Content validation failed - task marked as failed"
             )
             return TaskState.FAILED
+
+        if key is not None:
+            await asyncio.to_thread(self.memo_store.put, key, task.result)
         return TaskState.DONE
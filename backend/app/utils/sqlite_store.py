@@ -0,0 +1,63 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+"""
+Base of the small SQLite stores kept under ~/.eigent
+"""
+
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+
+class SQLiteStore:
+    """SQLite file opened per call and serialized by a lock.
+
+    Subclasses set :attr:`schema`, which is created on first connect.
+    """
+
+    # CREATE TABLE statement run before the first query
+    schema: str = ""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path)
+        if not self._initialized:
+            conn.execute(self.schema)
+            self._initialized = True
+        return conn
+
+    @contextmanager
+    def _transaction(
+        self, create: bool = False
+    ) -> Iterator[sqlite3.Connection]:
+        """Hold the lock and a connection for one committed transaction.
+
+        Args:
+            create: Create the parent directory first, for writes.
+        """
+        with self._lock:
+            if create:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = self._connect()
+            try:
+                with conn:
+                    yield conn
+            finally:
+                conn.close()
@@ -0,0 +1,228 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+"""
+Logging pipeline that writes records from a background thread, so slow log
+I/O does not stall the event loop or tool threads
+"""
+
+import atexit
+import copy
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
+
+# "text" (default) for the plain format, "json" for one JSON object per
+# record
+ENV_LOG_FORMAT = "EIGENT_LOG_FORMAT"
+ENV_LOG_LEVEL = "EIGENT_LOG_LEVEL"
+# Keep one in N records below WARNING per logger, e.g. "task_service=10"
+ENV_LOG_SAMPLING = "EIGENT_LOG_SAMPLING"
+
+# Loggers uvicorn sets up with their own synchronous handlers
+_CAPTURED_LOGGERS = ("uvicorn", "uvicorn.error", "uvicorn.access")
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# LogRecord attributes that are not ``extra`` fields
+_RECORD_ATTRS = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", None, None))
+) | {"message", "asctime", "taskName"}
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats a record and its ``extra`` fields as one JSON object"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, UTC).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = record.stack_info
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps one in N records below WARNING from the configured loggers
+    and their children, marking kept records with ``sampled=N``"""
+
+    def __init__(self, rates: dict[str, int]):
+        super().__init__()
+        self.rates = rates
+        self._seen: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _rate(self, name: str) -> int:
+        while name:
+            if name in self.rates:
+                return self.rates[name]
+            name = name.rpartition(".")[0]
+        return 1
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self._rate(record.name)
+        if rate <= 1:
+            return True
+        with self._lock:
+            seen = self._seen.get(record.name, 0)
+            self._seen[record.name] = seen + 1
+        if seen % rate:
+            return False
+        record.sampled = rate
+        return True
+
+
+class RateLimitFilter(logging.Filter):
+    """Lets at most ``burst`` records below WARNING per ``window`` seconds
+    through from each call site. The first record after a window with
+    drops carries ``suppressed``, the number dropped."""
+
+    def __init__(
+        self, burst: int = 50, window: float = 10.0, max_sites: int = 4096
+    ):
+        super().__init__()
+        self.burst = burst
+        self.window = window
+        self.max_sites = max_sites
+        # Per call site: window start, records let through, records dropped
+        self._sites: dict[tuple[str, int], list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        key = (record.pathname, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            site = self._sites.get(key)
+            if site is None or now - site[0] >= self.window:
+                if site is None and len(self._sites) >= self.max_sites:
+                    self._sites.clear()
+                if site is not None and site[2]:
+                    record.suppressed = site[2]
+                self._sites[key] = [now, 1, 0]
+                return True
+            if site[1] < self.burst:
+                site[1] += 1
+                return True
+            site[2] += 1
+            return False
+
+
+class BoundedQueueHandler(QueueHandler):
+    """Queue handler that drops records instead of blocking or raising
+    when the listener falls behind"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Resolve the message and traceback in the caller's thread, but
+        # leave formatting to the listener's handler
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(
+                record.exc_info
+            )
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def parse_sampling(value: str | None) -> dict[str, int]:
+    """Parse ``"logger=N,other=M"`` into sampling rates"""
+    rates: dict[str, int] = {}
+    for item in (value or "").split(","):
+        name, _, rate = item.partition("=")
+        try:
+            rates[name.strip()] = int(rate)
+        except ValueError:
+            continue
+    return rates
+
+
+def setup_logging(
+    level: str | None = None,
+    log_format: str | None = None,
+    sampling: dict[str, int] | None = None,
+    max_queue_size: int = 10000,
+) -> QueueListener:
+    """Route all logging through a queue written by a listener thread.
+
+    Arguments default to ``EIGENT_LOG_LEVEL`` (INFO), ``EIGENT_LOG_FORMAT``
+    (text, or json when opted in) and ``EIGENT_LOG_SAMPLING``. Sampling
+    and rate limits run before records are queued, so dropped records
+    cost almost nothing.
+
+    Returns:
+        The started listener, stopped at exit to flush queued records.
+    """
+    level = (level or os.getenv(ENV_LOG_LEVEL) or "INFO").upper()
+    log_format = (log_format or os.getenv(ENV_LOG_FORMAT) or "text").lower()
+    if sampling is None:
+        sampling = parse_sampling(os.getenv(ENV_LOG_SAMPLING))
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(
+        JsonFormatter()
+        if log_format == "json"
+        else logging.Formatter(TEXT_FORMAT)
+    )
+    queue_handler = BoundedQueueHandler(queue.Queue(max_queue_size))
+    queue_handler.addFilter(SamplingFilter(sampling))
+    queue_handler.addFilter(RateLimitFilter())
+
+    root = logging.getLogger()
+    for existing in root.handlers[:]:
+        root.removeHandler(existing)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+    for name in _CAPTURED_LOGGERS:
+        captured = logging.getLogger(name)
+        for existing in captured.handlers[:]:
+            captured.removeHandler(existing)
+        captured.propagate = True
+
+    listener = QueueListener(
+        queue_handler.queue, handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
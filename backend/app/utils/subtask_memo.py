@@ -0,0 +1,107 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+"""
+Opt-in memo of subtask results, so identical subtasks in later runs reuse
+the earlier result instead of calling the model again
+"""
+
+import hashlib
+import json
+import logging
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from app.utils.sqlite_store import SQLiteStore
+
+logger = logging.getLogger("subtask_memo")
+
+DEFAULT_MEMO_PATH = Path.home() / ".eigent" / "subtask_memo.db"
+DEFAULT_MEMO_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+def memo_key(
+    content: str,
+    dependency_results: Iterable[str | None],
+    role: str,
+    model: str,
+    working_directory: str,
+) -> str:
+    """Build the memo key for a subtask.
+
+    Whitespace in the content is normalized, and dependency results are
+    hashed and sorted so the key does not depend on their order. The
+    working directory is part of the key, because results refer to files
+    written there and must not be served to another project.
+    """
+    dependency_hashes = sorted(
+        hashlib.sha256((result or "").encode()).hexdigest()
+        for result in dependency_results
+    )
+    payload = json.dumps(
+        [
+            " ".join(content.split()),
+            dependency_hashes,
+            role,
+            model,
+            working_directory,
+        ]
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class SubtaskMemoStore(SQLiteStore):
+    """SQLite store of subtask results that expire after a TTL"""
+
+    schema = (
+        "CREATE TABLE IF NOT EXISTS subtask_memo ("
+        "key TEXT PRIMARY KEY, "
+        "result TEXT NOT NULL, "
+        "expires_at REAL NOT NULL)"
+    )
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_MEMO_PATH,
+        ttl_seconds: float = DEFAULT_MEMO_TTL_SECONDS,
+    ):
+        super().__init__(path)
+        self.ttl_seconds = ttl_seconds
+
+    def get(self, key: str) -> str | None:
+        """Get a cached result, or None if missing or expired"""
+        if not self.path.exists():
+            return None
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT result, expires_at FROM subtask_memo WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row and row[1] <= time.time():
+                conn.execute("DELETE FROM subtask_memo WHERE key = ?", (key,))
+                row = None
+        return row[0] if row else None
+
+    def put(self, key: str, result: str) -> None:
+        """Cache a result until the store's TTL elapses"""
+        with self._transaction(create=True) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO subtask_memo "
+                "(key, result, expires_at) VALUES (?, ?, ?)",
+                (key, result, time.time() + self.ttl_seconds),
+            )
+        logger.debug("Subtask result memoized", extra={"key": key})
+
+
+subtask_memo_store = SubtaskMemoStore()
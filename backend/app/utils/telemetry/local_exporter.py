@@ -0,0 +1,91 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+"""
+Span exporters that keep traces on this machine, for inspecting slow runs
+without a collector or network access
+"""
+
+import json
+import threading
+from collections import deque
+from collections.abc import Sequence
+from pathlib import Path
+
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+
+class JsonlSpanExporter(SpanExporter):
+    """Appends each finished span to a file as one line of JSON"""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        lines = "".join(span.to_json(indent=None) + "\n" for span in spans)
+        try:
+            with self._lock, self.path.open("a", encoding="utf-8") as f:
+                f.write(lines)
+        except OSError:
+            return SpanExportResult.FAILURE
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self) -> None:
+        pass
+
+
+class RingBufferSpanExporter(SpanExporter):
+    """Keeps the latest finished spans in memory, dropping the oldest"""
+
+    def __init__(self, max_spans: int = 2048):
+        self._spans: deque[dict] = deque(maxlen=max_spans)
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        records = [json.loads(span.to_json(indent=None)) for span in spans]
+        with self._lock:
+            self._spans.extend(records)
+        return SpanExportResult.SUCCESS
+
+    def spans(
+        self, trace_id: str | None = None, limit: int | None = None
+    ) -> list[dict]:
+        """Get buffered spans, oldest first.
+
+        Args:
+            trace_id: Only return spans of this trace, as hex with or
+                without the ``0x`` prefix.
+            limit: Only return the newest this many spans.
+        """
+        with self._lock:
+            spans = list(self._spans)
+        if trace_id:
+            wanted = trace_id.lower().removeprefix("0x")
+            spans = [
+                span
+                for span in spans
+                if span["context"]["trace_id"].removeprefix("0x") == wanted
+            ]
+        if limit is not None:
+            spans = spans[-limit:] if limit > 0 else []
+        return spans
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+    def shutdown(self) -> None:
+        pass
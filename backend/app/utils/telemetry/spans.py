@@ -0,0 +1,107 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+"""
+Child spans for the steps of a run: agent steps, model and tool calls,
+decomposition, assignment, task analysis and SSE sends
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import camel
+from opentelemetry import trace
+from opentelemetry.trace import INVALID_SPAN, Span
+
+from app.utils.telemetry import workforce_metrics
+
+TRACER_NAME_AGENT = "eigent.agent"
+
+# Span names
+SPAN_AGENT_STEP = "agent.step"
+SPAN_LLM_CALL = "llm.call"
+SPAN_TOOL_CALL = "tool.call"
+SPAN_TASK_DECOMPOSE = "workforce.decompose"
+SPAN_TASK_ASSIGN = "workforce.assign"
+SPAN_TASK_ANALYZE = "workforce.analyze_task"
+SPAN_SSE_SEND = "sse.send"
+
+# Attribute keys
+ATTR_AGENT_NAME = "eigent.agent.name"
+ATTR_AGENT_ID = "eigent.agent.id"
+ATTR_MODEL_TYPE = "eigent.model.type"
+ATTR_TOOLKIT_NAME = "eigent.tool.toolkit"
+ATTR_TOOL_METHOD = "eigent.tool.method"
+ATTR_BYTES_IN = "eigent.bytes_in"
+ATTR_BYTES_OUT = "eigent.bytes_out"
+ATTR_SSE_STEP = "eigent.sse.step"
+ATTR_SUBTASK_COUNT = "eigent.task.subtask_count"
+ATTR_FOR_FAILURE = "eigent.task.for_failure"
+ATTR_TOKENS_PROMPT = "eigent.tokens.prompt"
+ATTR_TOKENS_COMPLETION = "eigent.tokens.completion"
+ATTR_TOKENS_TOTAL = "eigent.tokens.total"
+
+
+def _tracer() -> trace.Tracer | None:
+    if not workforce_metrics.tracing_enabled():
+        return None
+    return workforce_metrics.get_tracer_provider().get_tracer(
+        TRACER_NAME_AGENT, camel.__version__
+    )
+
+
+@contextmanager
+def span(
+    name: str, attributes: dict[str, Any] | None = None
+) -> Iterator[Span]:
+    """Run a block in a span that is a child of the current one.
+
+    Yields a non-recording span when tracing is disabled, so callers can
+    set attributes unconditionally at almost no cost. Exceptions are
+    recorded on the span and re-raised.
+    """
+    tracer = _tracer()
+    if tracer is None:
+        yield INVALID_SPAN
+        return
+    attributes = {k: v for k, v in (attributes or {}).items() if v is not None}
+    with tracer.start_as_current_span(name, attributes=attributes) as current:
+        yield current
+
+
+def start_span(name: str, attributes: dict[str, Any] | None = None) -> Span:
+    """Start a span under the current one without making it current.
+
+    For work spread across generator yields, where a context manager
+    would attach and detach the context in different places. The caller
+    must call ``end()``.
+    """
+    tracer = _tracer()
+    if tracer is None:
+        return INVALID_SPAN
+    attributes = {k: v for k, v in (attributes or {}).items() if v is not None}
+    return tracer.start_span(name, attributes=attributes)
+
+
+def set_token_usage(current: Span, usage: dict | None) -> None:
+    """Set a model response's token counts on a span"""
+    if not usage or not current.is_recording():
+        return
+    for key, attribute in (
+        ("prompt_tokens", ATTR_TOKENS_PROMPT),
+        ("completion_tokens", ATTR_TOKENS_COMPLETION),
+        ("total_tokens", ATTR_TOKENS_TOTAL),
+    ):
+        if usage.get(key) is not None:
+            current.set_attribute(attribute, usage[key])
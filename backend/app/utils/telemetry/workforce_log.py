@@ -0,0 +1,73 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+"""
+Workforce event log with bounded retention, indexed by task and event type
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Any
+
+from camel.societies.workforce.events import LogEvent
+from camel.societies.workforce.workforce_logger import WorkforceLogger
+
+logger = logging.getLogger("workforce_log")
+
+# Entries kept for KPIs and JSON dumps; older entries are dropped
+MAX_LOG_ENTRIES = 2000
+
+
+class IndexedWorkforceLogger(WorkforceLogger):
+    """CAMEL's workforce logger with bounded memory.
+
+    ``log_entries`` keeps the latest ``max_entries`` events, trimmed in
+    chunks so appends stay O(1) amortized, and :meth:`latest` finds a
+    task's most recent event of a type without scanning the log.
+    """
+
+    def __init__(self, workforce_id: str, max_entries: int = MAX_LOG_ENTRIES):
+        super().__init__(workforce_id)
+        self.max_entries = max_entries
+        self._latest: OrderedDict[tuple[str, str], dict[str, Any]] = (
+            OrderedDict()
+        )
+
+    def _log_event(self, event_type: str, **kwargs: Any) -> None:
+        super()._log_event(event_type, **kwargs)
+        task_id = kwargs.get("task_id")
+        if task_id:
+            key = (task_id, event_type)
+            self._latest[key] = self.log_entries[-1]
+            self._latest.move_to_end(key)
+            if len(self._latest) > self.max_entries:
+                self._latest.popitem(last=False)
+        if len(self.log_entries) > self.max_entries + self.max_entries // 4:
+            del self.log_entries[: len(self.log_entries) - self.max_entries]
+
+    def latest(self, task_id: str, event_type: str) -> dict[str, Any] | None:
+        """Get a task's most recent entry of an event type, e.g.
+        ``"task_failed"``"""
+        return self._latest.get((task_id, event_type))
+
+    def log_message(self, event: LogEvent) -> None:
+        # The base class prints every message to stdout
+        logger.log(
+            logging.getLevelName(event.level.upper()),
+            event.message,
+            extra={"workforce_id": self.workforce_id},
+        )
+
+    def reset_task_data(self) -> None:
+        super().reset_task_data()
+        self._latest.clear()
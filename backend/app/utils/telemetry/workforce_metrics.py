@@ -16,7 +16,6 @@ import base64
 import json
 import logging
 import os
-import re
 from typing import Any
 
 import camel
@@ -38,9 +37,14 @@ from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
 )
 from opentelemetry.sdk.resources import SERVICE_NAME, Resource
 from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, SpanExporter
 from opentelemetry.trace import Status, StatusCode
 
+from app.utils.telemetry.local_exporter import (
+    JsonlSpanExporter,
+    RingBufferSpanExporter,
+)
+
 logger = logging.getLogger(__name__)
 
 # Environment variable keys
@@ -49,6 +53,8 @@ ENV_LANGFUSE_SECRET_KEY = "LANGFUSE_SECRET_KEY"
 ENV_LANGFUSE_BASE_URL = "LANGFUSE_BASE_URL"
 ENV_OTEL_EXPORTER_OTLP_ENDPOINT = "OTEL_EXPORTER_OTLP_ENDPOINT"
 ENV_OTEL_EXPORTER_OTLP_HEADERS = "OTEL_EXPORTER_OTLP_HEADERS"
+ENV_TRACE_FILE = "EIGENT_TRACE_FILE"
+ENV_TRACE_BUFFER_SIZE = "EIGENT_TRACE_BUFFER_SIZE"
 
 # Default values
 DEFAULT_LANGFUSE_BASE_URL = "https://us.cloud.langfuse.com"
@@ -108,6 +114,20 @@ SPAN_ALL_TASKS_COMPLETED = "workforce.all_tasks_completed"
 # This is initialized once during FastAPI startup
 _GLOBAL_TRACER_PROVIDER: TracerProvider = None
 
+# Whether the global provider has any exporter, i.e. spans go anywhere
+_TRACING_ENABLED = False
+
+# In-memory exporter served over HTTP, when configured
+_TRACE_BUFFER: RingBufferSpanExporter | None = None
+
+# Smoothing factor for the per-role task duration moving average
+DURATION_EMA_ALPHA = 0.3
+
+# Moving average of task processing seconds keyed by worker role. Worker
+# node ids change on every run, roles do not, so estimates carry over to
+# later plans within the same process.
+_role_durations: dict[str, float] = {}
+
 
 def initialize_tracer_provider() -> None:
     """Initialize the global TracerProvider during application startup.
@@ -117,7 +137,7 @@ def initialize_tracer_provider() -> None:
     preventing resource leaks when multiple WorkforceMetricsCallback
     instances are created.
     """
-    global _GLOBAL_TRACER_PROVIDER
+    global _GLOBAL_TRACER_PROVIDER, _TRACING_ENABLED
 
     if _GLOBAL_TRACER_PROVIDER is not None:
         logger.warning("TracerProvider already initialized, skipping")
@@ -165,9 +185,63 @@ def initialize_tracer_provider() -> None:
     else:
         logger.info("Langfuse credentials not found, telemetry disabled")
 
+    exporters = _local_exporters()
+    for exporter in exporters:
+        # Local exports are cheap, so flush often to keep them current
+        provider.add_span_processor(
+            BatchSpanProcessor(
+                exporter,
+                max_queue_size=4096,
+                schedule_delay_millis=500,
+                max_export_batch_size=1024,
+            )
+        )
+
+    _TRACING_ENABLED = bool(
+        exporters or (langfuse_public_key and langfuse_secret_key)
+    )
     _GLOBAL_TRACER_PROVIDER = provider
 
 
+def _local_exporters() -> list[SpanExporter]:
+    """Create the local exporters configured in the environment.
+
+    ``EIGENT_TRACE_FILE`` appends spans to a JSONL file and
+    ``EIGENT_TRACE_BUFFER_SIZE`` keeps that many of the latest spans in
+    memory for the ``/traces`` endpoint.
+    """
+    global _TRACE_BUFFER
+
+    exporters: list[SpanExporter] = []
+    trace_file = os.getenv(ENV_TRACE_FILE)
+    if trace_file:
+        exporters.append(JsonlSpanExporter(trace_file))
+        logger.info(f"Writing traces to {trace_file}")
+
+    try:
+        buffer_size = int(os.getenv(ENV_TRACE_BUFFER_SIZE) or 0)
+    except ValueError:
+        logger.warning(f"Invalid {ENV_TRACE_BUFFER_SIZE}, ignoring it")
+        buffer_size = 0
+    _TRACE_BUFFER = (
+        RingBufferSpanExporter(buffer_size) if buffer_size > 0 else None
+    )
+    if _TRACE_BUFFER is not None:
+        exporters.append(_TRACE_BUFFER)
+        logger.info(f"Keeping the latest {buffer_size} spans in memory")
+    return exporters
+
+
+def tracing_enabled() -> bool:
+    """Whether spans are exported anywhere, so they are worth creating"""
+    return _GLOBAL_TRACER_PROVIDER is not None and _TRACING_ENABLED
+
+
+def get_trace_buffer() -> RingBufferSpanExporter | None:
+    """Get the in-memory span buffer, if configured"""
+    return _TRACE_BUFFER
+
+
 def get_tracer_provider() -> TracerProvider:
     """Get the global TracerProvider instance.
 
@@ -239,15 +313,16 @@ class WorkforceMetricsCallback(WorkforceMetrics):
             LANGFUSE_SECRET_KEY: Langfuse secret key (required)
             LANGFUSE_BASE_URL: Langfuse base URL
                 (optional, defaults to "https://us.cloud.langfuse.com")
+            EIGENT_TRACE_FILE: JSONL file spans are appended to (optional)
+            EIGENT_TRACE_BUFFER_SIZE: Spans kept in memory for the
+                /traces endpoint (optional)
         """
         super().__init__()
         self.project_id = project_id
         self.task_id = task_id
 
-        # Check if telemetry is enabled
-        langfuse_public_key = os.getenv(ENV_LANGFUSE_PUBLIC_KEY)
-        langfuse_secret_key = os.getenv(ENV_LANGFUSE_SECRET_KEY)
-        self.enabled = bool(langfuse_public_key and langfuse_secret_key)
+        # Telemetry is enabled when Langfuse or a local exporter is set up
+        self.enabled = tracing_enabled()
 
         # Initialize tracer and root_span as None by default
         self.tracer = None
@@ -281,6 +356,9 @@ class WorkforceMetricsCallback(WorkforceMetrics):
         # Track quality scores (task_id -> quality_score)
         self.task_quality_scores = {}
 
+        # Track worker roles (worker_id -> role) for duration estimates
+        self.worker_roles: dict[str, str] = {}
+
     def log_worker_created(
         self,
         event: WorkerCreatedEvent,
@@ -296,6 +374,7 @@ class WorkforceMetricsCallback(WorkforceMetrics):
             model_type: Model type (optional)
             **kwargs: Additional unused arguments for compatibility
         """
+        self.worker_roles[event.worker_id] = event.role
         if not self.enabled:
             return
 
@@ -459,6 +538,7 @@ class WorkforceMetricsCallback(WorkforceMetrics):
         Args:
             event: Task completion event from CAMEL
         """
+        self._record_duration(event)
         if not self.enabled:
             return
 
@@ -482,7 +562,7 @@ class WorkforceMetricsCallback(WorkforceMetrics):
                     event.processing_time_seconds,
                 )
 
-            # Check for quality score from parsed log messages first
+            # Check for quality score recorded by the workforce first
             if event.task_id in self.task_quality_scores:
                 quality_score = self.task_quality_scores.pop(event.task_id)
                 span.set_attribute(ATTR_TASK_QUALITY_SCORE, quality_score)
@@ -511,6 +591,39 @@ class WorkforceMetricsCallback(WorkforceMetrics):
             span.set_status(Status(StatusCode.OK))
             span.end()
 
+    def _record_duration(self, event: TaskCompletedEvent) -> None:
+        """Fold a completed task's processing time into its role average.
+
+        Args:
+            event: Task completion event from CAMEL
+        """
+        role = self.worker_roles.get(event.worker_id)
+        if role is None or event.processing_time_seconds is None:
+            return
+        previous = _role_durations.get(role)
+        if previous is None:
+            _role_durations[role] = event.processing_time_seconds
+        else:
+            _role_durations[role] = (
+                DURATION_EMA_ALPHA * event.processing_time_seconds
+                + (1 - DURATION_EMA_ALPHA) * previous
+            )
+
+    def estimate_duration(self, worker_id: str) -> float | None:
+        """Estimate how long a task takes on the given worker.
+
+        Args:
+            worker_id: The worker node identifier
+
+        Returns:
+            Average processing seconds from earlier tasks of the same
+            role, or None when there is no history yet
+        """
+        role = self.worker_roles.get(worker_id)
+        if role is None:
+            return None
+        return _role_durations.get(role)
+
     def log_task_failed(self, event: TaskFailedEvent) -> None:
         """Log task failure and end the execution span with error status.
 
@@ -534,9 +647,18 @@ class WorkforceMetricsCallback(WorkforceMetrics):
             span.set_status(Status(StatusCode.ERROR, event.error_message))
             span.end()
 
+    def record_quality_score(self, task_id: str, quality_score: int) -> None:
+        """Remember a task's quality score for its completion span.
+
+        Args:
+            task_id: The task identifier
+            quality_score: Score from the workforce's quality analysis
+        """
+        if self.enabled:
+            self.task_quality_scores[task_id] = quality_score
+
     def log_message(self, log_event: LogEvent) -> None:
         """Log error and critical messages as span events.
-        Also parse quality scores from info-level task completion messages.
 
         Args:
             log_event: LogEvent from CAMEL
@@ -544,20 +666,6 @@ class WorkforceMetricsCallback(WorkforceMetrics):
         if not self.enabled:
             return
 
-        # Parse quality score from info-level messages
-        # Pattern: "Task <task_id> completed successfully (quality score: X)."
-        # TODO: add this from the camel
-        if log_event.level == "info":
-            pattern = (
-                r"Task\s+(\S+)\s+completed successfully"
-                r".*quality score:\s*(\d+)"
-            )
-            match = re.search(pattern, log_event.message)
-            if match:
-                task_id = match.group(1)
-                quality_score = int(match.group(2))
-                self.task_quality_scores[task_id] = quality_score
-
         # Only log errors and critical messages
         if log_event.level in ["error", "critical"]:
             ctx = trace.set_span_in_context(self.root_span)
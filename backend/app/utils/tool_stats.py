@@ -0,0 +1,128 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+"""
+Per-tool latency, payload size and error statistics for a project
+"""
+
+import math
+import threading
+from collections import deque
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+# Containers nested deeper than this are counted as one scalar
+_MAX_PAYLOAD_DEPTH = 3
+# Size counted for values measured without serializing them
+_SCALAR_SIZE = 8
+
+
+def payload_size(value: Any, _depth: int = 0) -> int:
+    """Cheap size estimate of a tool argument or result.
+
+    Strings count their characters and bytes their length. Containers add
+    up their items a few levels deep, and anything else counts as a small
+    scalar, so nothing is serialized on the tool call path.
+    """
+    if value is None:
+        return 0
+    if isinstance(value, (str, bytes, bytearray)):
+        return len(value)
+    if isinstance(value, bool):
+        return 4 if value else 5
+    if isinstance(value, (int, float)):
+        return len(str(value))
+    if _depth < _MAX_PAYLOAD_DEPTH:
+        if isinstance(value, dict):
+            return sum(
+                payload_size(key, _depth + 1) + payload_size(item, _depth + 1)
+                for key, item in value.items()
+            )
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return sum(payload_size(item, _depth + 1) for item in value)
+    return _SCALAR_SIZE
+
+
+class ToolUsage(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    calls: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    # Latest call durations the percentiles are computed over
+    samples: deque[float] = Field(default_factory=lambda: deque(maxlen=512))
+
+    def percentile(self, q: float) -> float | None:
+        samples = sorted(self.samples)
+        if not samples:
+            return None
+        return samples[max(0, math.ceil(q * len(samples)) - 1)]
+
+
+class ToolStatsTracker:
+    """Accumulates tool calls per toolkit, method and agent, for finding
+    the tools that dominate a project's wall time"""
+
+    def __init__(self) -> None:
+        self._tools: dict[tuple[str, str, str], ToolUsage] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        toolkit: str,
+        method: str,
+        agent: str,
+        seconds: float,
+        bytes_in: int = 0,
+        bytes_out: int = 0,
+        error: bool = False,
+    ) -> None:
+        with self._lock:
+            entry = self._tools.setdefault(
+                (toolkit, method, agent), ToolUsage()
+            )
+            entry.calls += 1
+            entry.errors += int(error)
+            entry.seconds += seconds
+            entry.bytes_in += bytes_in
+            entry.bytes_out += bytes_out
+            entry.samples.append(seconds)
+
+    def report(self) -> list[dict]:
+        """Summarize each tool, the one taking most wall time first"""
+        with self._lock:
+            rows = [
+                {
+                    "toolkit": toolkit,
+                    "method": method,
+                    "agent": agent,
+                    "calls": usage.calls,
+                    "errors": usage.errors,
+                    "seconds": round(usage.seconds, 3),
+                    "p50_seconds": _round(usage.percentile(0.5)),
+                    "p95_seconds": _round(usage.percentile(0.95)),
+                    "p99_seconds": _round(usage.percentile(0.99)),
+                    "bytes_in": usage.bytes_in,
+                    "bytes_out": usage.bytes_out,
+                }
+                for (toolkit, method, agent), usage in self._tools.items()
+            ]
+        rows.sort(key=lambda row: row["seconds"], reverse=True)
+        return rows
+
+
+def _round(value: float | None) -> float | None:
+    return None if value is None else round(value, 3)
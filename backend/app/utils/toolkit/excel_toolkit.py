@@ -18,6 +18,7 @@ from camel.toolkits import ExcelToolkit as BaseExcelToolkit
 
 from app.component.environment import env
 from app.service.task import Agents
+from app.utils.attachment_cache import EXCEL, attachment_cache
 from app.utils.listen.toolkit_listen import auto_listen_toolkit
 from app.utils.toolkit.abstract_toolkit import AbstractToolkit
 
@@ -38,3 +39,8 @@ class ExcelToolkit(BaseExcelToolkit, AbstractToolkit):
                 "file_save_path", os.path.expanduser("~/Downloads")
             )
         super().__init__(timeout=timeout, working_directory=working_directory)
+
+    def extract_excel_content(self, document_path: str) -> str:
+        return attachment_cache.read(
+            document_path, EXCEL, super().extract_excel_content
+        )
@@ -23,6 +23,7 @@ from app.service.task import (
     get_task_lock,
     process_task,
 )
+from app.utils.attachment_cache import read_markdown_files
 from app.utils.listen.toolkit_listen import (
     _safe_put_queue,
     auto_listen_toolkit,
@@ -88,3 +89,14 @@ class FileToolkit(BaseFileToolkit, AbstractToolkit):
                 ),
             )
         return res
+
+    def read_file(self, file_paths: str | list[str]) -> str | dict[str, str]:
+        if isinstance(file_paths, str):
+            path = str(self._resolve_filepath(file_paths))
+            return read_markdown_files([path])[path]
+        resolved = [str(self._resolve_filepath(fp)) for fp in file_paths]
+        results = read_markdown_files(resolved)
+        return {
+            original: results[path]
+            for original, path in zip(file_paths, resolved)
+        }
@@ -30,7 +30,8 @@ from camel.toolkits.hybrid_browser_toolkit.ws_wrapper import (
 from typing_extensions import TypedDict
 
 from app.component.environment import env
-from app.service.task import Agents
+from app.service.task import Agents, get_task_lock_if_exists
+from app.utils.cancellation import CancellationToken, TaskCancelledError
 from app.utils.listen.toolkit_listen import auto_listen_toolkit
 from app.utils.toolkit.abstract_toolkit import AbstractToolkit
 
@@ -45,6 +46,10 @@ _global_tab_registry: dict[str, str] = {}
 _global_tab_registry_lock = asyncio.Lock()
 
 
+# Commands that may leave a page load running when they are abandoned
+_NAVIGATION_COMMANDS = {"visit_page", "back", "forward", "click", "enter"}
+
+
 class SheetCell(TypedDict):
     row: int
     col: int
@@ -58,6 +63,8 @@ class WebSocketBrowserWrapper(BaseWebSocketBrowserWrapper):
         logger.info(f"WebSocketBrowserWrapper using ts_dir: {self.ts_dir}")
         # Track tabs opened by this session for isolation
         self._session_tab_ids: set = set()
+        # Project whose cancellation aborts this session's commands
+        self.api_task_id: str | None = None
         self._wrapper_session_id: str = str(uuid.uuid4())
 
     def _ensure_local_no_proxy(self) -> None:
@@ -163,8 +170,43 @@ class WebSocketBrowserWrapper(BaseWebSocketBrowserWrapper):
         )
         await super().start()
 
+    def _cancel_token(self) -> CancellationToken | None:
+        if self.api_task_id is None:
+            return None
+        task_lock = get_task_lock_if_exists(self.api_task_id)
+        if task_lock is None:
+            return None
+        return task_lock.work_token()
+
     async def _send_command(
         self, command: str, params: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Send a command, abandoning it as soon as the project or subtask
+        is cancelled. An abandoned navigation is stopped in the page."""
+        token = self._cancel_token()
+        if token is None:
+            return await self._send_checked_command(command, params)
+        try:
+            return await token.run(self._send_checked_command(command, params))
+        except TaskCancelledError:
+            logger.info(f"Browser command '{command}' cancelled")
+            if command in _NAVIGATION_COMMANDS:
+                await self._abort_navigation()
+            raise
+
+    async def _abort_navigation(self) -> None:
+        try:
+            await asyncio.wait_for(
+                super()._send_command(
+                    "console_exec", {"code": "window.stop()"}
+                ),
+                timeout=1.0,
+            )
+        except Exception as e:
+            logger.debug(f"Failed to stop page load: {e}")
+
+    async def _send_checked_command(
+        self, command: str, params: dict[str, Any]
     ) -> dict[str, Any]:
         """Send a command to the WebSocket server with enhanced error handling."""
         try:
@@ -538,6 +580,7 @@ class HybridBrowserToolkit(BaseHybridBrowserToolkit, AbstractToolkit):
         self._ws_wrapper = await websocket_connection_pool.get_connection(
             session_id, self._ws_config
         )
+        self._ws_wrapper.api_task_id = self.api_task_id
         logger.info(
             f"[HybridBrowserToolkit] WebSocket wrapper initialized for session: {session_id}"
         )
@@ -551,6 +594,7 @@ class HybridBrowserToolkit(BaseHybridBrowserToolkit, AbstractToolkit):
             self._ws_wrapper = await websocket_connection_pool.get_connection(
                 session_id, self._ws_config
             )
+            self._ws_wrapper.api_task_id = self.api_task_id
 
     def clone_for_new_session(
         self, new_session_id: str | None = None
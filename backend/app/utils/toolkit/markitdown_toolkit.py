@@ -15,6 +15,7 @@
 from camel.toolkits import MarkItDownToolkit as BaseMarkItDownToolkit
 
 from app.service.task import Agents
+from app.utils.attachment_cache import read_markdown_files
 from app.utils.listen.toolkit_listen import auto_listen_toolkit
 from app.utils.toolkit.abstract_toolkit import AbstractToolkit
 
@@ -26,3 +27,6 @@ class MarkItDownToolkit(BaseMarkItDownToolkit, AbstractToolkit):
     def __init__(self, api_task_id: str, timeout: float | None = None):
         self.api_task_id = api_task_id
         super().__init__(timeout)
+
+    def read_files(self, file_paths: list[str]) -> dict[str, str]:
+        return read_markdown_files(file_paths)
@@ -17,9 +17,12 @@ import logging
 import os
 import platform
 import shutil
+import signal
 import subprocess
 import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
 
 from camel.toolkits.terminal_toolkit import (
     TerminalToolkit as BaseTerminalToolkit,
@@ -32,8 +35,10 @@ from app.service.task import (
     ActionTerminalData,
     Agents,
     get_task_lock,
+    get_task_lock_if_exists,
     process_task,
 )
+from app.utils.cancellation import CancellationToken
 from app.utils.listen.toolkit_listen import auto_listen_toolkit
 from app.utils.toolkit.abstract_toolkit import AbstractToolkit
 
@@ -54,6 +59,22 @@ def get_terminal_base_venv_path() -> str:
     )
 
 
+def _kill_process_tree(proc: subprocess.Popen) -> None:
+    """Kill a shell and every command it started"""
+    if proc.poll() is not None:
+        return
+    try:
+        if platform.system() == "Windows":
+            subprocess.run(
+                ["taskkill", "/F", "/T", "/PID", str(proc.pid)],
+                capture_output=True,
+            )
+        else:
+            os.killpg(proc.pid, signal.SIGKILL)
+    except OSError:
+        proc.kill()
+
+
 @auto_listen_toolkit(BaseTerminalToolkit)
 class TerminalToolkit(BaseTerminalToolkit, AbstractToolkit):
     agent_name: str = Agents.developer_agent
@@ -370,13 +391,15 @@ class TerminalToolkit(BaseTerminalToolkit, AbstractToolkit):
         """
         # Auto-generate ID if not provided
         if id is None:
-            import time
-
             id = f"auto_{int(time.time() * 1000)}"
 
-        result = super().shell_exec(
-            id=id, command=command, block=block, timeout=timeout
-        )
+        token = self._cancel_token()
+        if block and token is not None and not self.use_docker_backend:
+            result = self._cancellable_shell_exec(id, command, timeout, token)
+        else:
+            result = super().shell_exec(
+                id=id, command=command, block=block, timeout=timeout
+            )
 
         # If the command executed successfully but returned empty output,
         # provide a clear success message to help the AI agent understand
@@ -386,6 +409,167 @@ class TerminalToolkit(BaseTerminalToolkit, AbstractToolkit):
 
         return result
 
+    def _cancel_token(self) -> CancellationToken | None:
+        task_lock = get_task_lock_if_exists(self.api_task_id)
+        if task_lock is None:
+            return None
+        return task_lock.work_token()
+
+    def _cancellable_shell_exec(
+        self,
+        id: str,
+        command: str,
+        timeout: float,
+        token: CancellationToken,
+    ) -> str:
+        """Run a blocking command so that it is killed, along with its
+        children, as soon as the token is cancelled.
+
+        The command runs in its own process group. Like the base
+        implementation, a timeout converts it to a background session.
+        """
+        token.raise_if_cancelled()
+        if self.safe_mode:
+            is_safe, message = self._sanitize_command(command)
+            if not is_safe:
+                return f"Error: {message}"
+            command = message
+        env_path = self._get_venv_path()
+        if env_path:
+            if self.os_type == "Windows":
+                activate = os.path.join(env_path, "Scripts", "activate.bat")
+                command = f'call "{activate}" && {command}'
+            else:
+                activate = os.path.join(env_path, "bin", "activate")
+                command = f'. "{activate}" && {command}'
+
+        log_entry = (
+            f"--- Executing blocking command at "
+            f"{time.ctime()} ---\n> {command}\n"
+        )
+        env_vars = os.environ.copy()
+        env_vars["PYTHONUNBUFFERED"] = "1"
+        try:
+            proc = subprocess.Popen(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                stdin=subprocess.DEVNULL,
+                shell=True,
+                text=True,
+                cwd=self.working_dir,
+                encoding="utf-8",
+                env=env_vars,
+                start_new_session=platform.system() != "Windows",
+            )
+        except Exception as e:
+            error_msg = f"Error executing command: {e}"
+            self._write_to_log(
+                self.blocking_log_file,
+                f"{log_entry}--- Error ---\n{error_msg}\n\n",
+            )
+            return error_msg
+
+        result: dict = {}
+        done = threading.Event()
+
+        def read_output() -> None:
+            try:
+                result["output"], _ = proc.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired as e:
+                if not token.cancelled:
+                    self._write_to_log(
+                        self.blocking_log_file, log_entry + "\n"
+                    )
+                    result["session"] = self._convert_to_session(
+                        id, command, proc, e.stdout, timeout
+                    )
+            except Exception as e:
+                result["error"] = e
+            finally:
+                if "session" not in result:
+                    proc.wait()
+                done.set()
+
+        def on_cancel() -> None:
+            _kill_process_tree(proc)
+            done.set()
+
+        # stdout is read to EOF off this thread so that a cancel returns at
+        # once, even if something the command started still holds the pipe
+        threading.Thread(
+            target=read_output, name=f"shell_exec_{id}", daemon=True
+        ).start()
+        remove = token.add_callback(on_cancel)
+        try:
+            done.wait()
+        finally:
+            remove()
+
+        if token.cancelled:
+            self._write_to_log(
+                self.blocking_log_file, f"{log_entry}--- Cancelled ---\n\n"
+            )
+            logger.info(
+                "Shell command cancelled",
+                extra={"api_task_id": self.api_task_id, "session_id": id},
+            )
+            return f"Command cancelled: {token.reason}"
+        if "session" in result:
+            return result["session"]
+        if "error" in result:
+            error_msg = f"Error executing command: {result['error']}"
+            self._write_to_log(
+                self.blocking_log_file,
+                f"{log_entry}--- Error ---\n{error_msg}\n\n",
+            )
+            return error_msg
+        output = result["output"] or ""
+        self._write_to_log(
+            self.blocking_log_file, f"{log_entry}--- Output ---\n{output}\n\n"
+        )
+        return _to_plain(output)
+
+    def _convert_to_session(
+        self,
+        id: str,
+        command: str,
+        proc: subprocess.Popen,
+        partial_output: str | bytes | None,
+        timeout: float,
+    ) -> str:
+        """Track a timed out blocking command as a background session."""
+        if isinstance(partial_output, bytes):
+            partial_output = partial_output.decode("utf-8", errors="ignore")
+        log_file = os.path.join(self.log_dir, f"session_{id}.log")
+        self._write_to_log(
+            log_file,
+            f"--- Blocking command timed out, converted to session at "
+            f"{time.ctime()} ---\n> {command}\n",
+        )
+        output_stream: Queue = Queue(maxsize=10000)
+        if partial_output:
+            output_stream.put(partial_output)
+        with self._session_lock:
+            self.shell_sessions[id] = {
+                "id": id,
+                "process": proc,
+                "output_stream": output_stream,
+                "command_history": [command],
+                "running": True,
+                "log_file": log_file,
+                "backend": "local",
+                "timeout_converted": True,
+            }
+        self._start_output_reader_thread(id)
+        return (
+            f"Command did not complete within {timeout} seconds. "
+            f"Process continues in background as session '{id}'.\n\n"
+            f"You can use:\n"
+            f"  - shell_view('{id}') - get output\n"
+            f"  - shell_kill_process('{id}') - terminate"
+        )
+
     def cleanup(self, remove_venv: bool = True):
         """Clean up all active sessions and optionally remove the virtual environment.
 
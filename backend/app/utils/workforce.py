@@ -30,6 +30,7 @@ from camel.societies.workforce.task_channel import TaskChannel
 from camel.societies.workforce.utils import (
     FailureHandlingConfig,
     TaskAnalysisResult,
+    TaskAssignment,
     TaskAssignResult,
 )
 from camel.societies.workforce.workforce import (
@@ -37,8 +38,10 @@ from camel.societies.workforce.workforce import (
     Workforce as BaseWorkforce,
     WorkforceState,
 )
+from camel.societies.workforce.workforce_callback import WorkforceCallback
 from camel.societies.workforce.workforce_metrics import WorkforceMetrics
 from camel.tasks.task import Task, TaskState, validate_task_content
+from opentelemetry import trace
 
 from app.agent.listen_chat_agent import ListenChatAgent
 from app.component import code
@@ -51,14 +54,63 @@ from app.service.task import (
     ActionTimeoutData,
     get_camel_task,
     get_task_lock,
+    get_task_lock_if_exists,
+    task_tree,
+)
+from app.utils.assignment_rules import (
+    DECOMPOSE_ANNOTATION_PROMPT,
+    AssignmentRuleConfig,
+    SimilarityFn,
+    match_worker,
+    read_annotation,
+    strip_annotations,
+)
+from app.utils.checkpoint import CheckpointStore, task_from_dict, task_to_dict
+from app.utils.dependency_context import DependencyContextConfig, Summarizer
+from app.utils.quality_precheck import (
+    DEFAULT_QUALITY_PRECHECKS,
+    QualityPreCheck,
+    QualityPreCheckConfig,
 )
 from app.utils.single_agent_worker import SingleAgentWorker
-from app.utils.telemetry.workforce_metrics import WorkforceMetricsCallback
+from app.utils.subtask_memo import SubtaskMemoStore
+from app.utils.telemetry.spans import (
+    ATTR_FOR_FAILURE,
+    ATTR_SUBTASK_COUNT,
+    SPAN_TASK_ANALYZE,
+    SPAN_TASK_ASSIGN,
+    SPAN_TASK_DECOMPOSE,
+    span,
+    start_span,
+)
+from app.utils.telemetry.workforce_log import IndexedWorkforceLogger
+from app.utils.telemetry.workforce_metrics import (
+    ATTR_TASK_ID,
+    WorkforceMetricsCallback,
+)
 
 logger = logging.getLogger("workforce")
 
 _ANALYZE_TASK_MAX_RETRIES = 3
 
+# Pseudo task id holding the execution loop open while a pipelined
+# decomposition waits for the user to confirm the plan
+_PIPELINE_HOLD_ID = "__pipeline_hold__"
+
+# How long a pipelined run waits for the user to confirm the plan before
+# releasing its hold, so an abandoned plan does not keep the loop alive
+_PIPELINE_HOLD_TIMEOUT_SECONDS = 1800.0
+
+# Duration assumed for subtasks whose worker role has no recorded history
+_DEFAULT_TASK_DURATION_SECONDS = 60.0
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
 
 class Workforce(BaseWorkforce):
     def __init__(
@@ -72,6 +124,15 @@ class Workforce(BaseWorkforce):
         graceful_shutdown_timeout: float = 3,
         share_memory: bool = False,
         use_structured_output_handler: bool = True,
+        checkpoint_store: CheckpointStore | None = None,
+        memo_store: SubtaskMemoStore | None = None,
+        dependency_context: DependencyContextConfig | None = None,
+        dependency_summarizer: Summarizer | None = None,
+        quality_precheck: QualityPreCheckConfig | None = None,
+        assignment_rules: AssignmentRuleConfig | None = None,
+        assignment_similarity: SimilarityFn | None = None,
+        max_concurrent_tasks: int | None = None,
+        working_directory: str | None = None,
     ) -> None:
         self.api_task_id = api_task_id
         logger.info("=" * 80)
@@ -101,10 +162,83 @@ class Workforce(BaseWorkforce):
         )
         self.task_agent.stream_accumulate = True
         self.task_agent._stream_accumulate_explicit = True
+        # Pipelined decomposition state, see eigent_make_sub_tasks
+        self._pipelined = False
+        self._pipeline_hold = False
+        self._pipeline_task_ids: set[str] = set()
+        self._pipeline_wakeup = asyncio.Event()
+        self._pipeline_runner: asyncio.Task | None = None
+        self._pipeline_loop: asyncio.AbstractEventLoop | None = None
+        self._pipeline_hold_timer: asyncio.TimerHandle | None = None
+        # Critical-path scheduling state, see _post_ready_tasks
+        self._worker_concurrency: dict[str, int] = {}
+        self._default_worker_concurrency = max_concurrent_tasks
+        self._running_tasks: dict[str, str] = {}
+        self._dispatch_batch: list[tuple[Task, str]] | None = None
+        # Durable progress, see _save_checkpoint
+        self._checkpoint_store = checkpoint_store
+        # Opt-in subtask result reuse, passed on to every worker
+        self._memo_store = memo_store
+        # Project directory the workers write files to
+        self.working_directory = working_directory
+        # Budget of dependency results in subtask prompts, passed on to
+        # every worker
+        self._dependency_context = dependency_context
+        self._dependency_summarizer = dependency_summarizer
+        # Deterministic acceptance before LLM quality analysis, see
+        # _analyze_task
+        self.quality_precheck = quality_precheck or QualityPreCheckConfig()
+        if working_directory and not self.quality_precheck.working_directory:
+            self.quality_precheck = self.quality_precheck.model_copy(
+                update={"working_directory": working_directory}
+            )
+        self._quality_prechecks: list[QualityPreCheck] = list(
+            DEFAULT_QUALITY_PRECHECKS
+        )
+        self.quality_check_stats = {"skipped": 0, "analysed": 0}
+        # Deterministic assignment before asking the coordinator, see
+        # _find_assignee
+        self.assignment_rules = assignment_rules or AssignmentRuleConfig()
+        self._assignment_similarity = assignment_similarity
+        self.assignment_stats = {"rule": 0, "coordinator": 0}
         logger.info(
             f"[WF-LIFECYCLE] ✅ Workforce.__init__ COMPLETED, id={id(self)}"
         )
 
+    def add_quality_precheck(self, check: QualityPreCheck) -> None:
+        """Register an extra check a result must pass to skip LLM quality
+        analysis.
+
+        Args:
+            check: Callable taking the task and the pre-check config and
+                returning True when the result is clearly acceptable.
+        """
+        self._quality_prechecks.append(check)
+
+    def _passes_quality_precheck(self, task: Task) -> bool:
+        if not self.quality_precheck.enabled:
+            return False
+        for check in self._quality_prechecks:
+            try:
+                if not check(task, self.quality_precheck):
+                    return False
+            except Exception as e:
+                logger.warning(
+                    f"[QUALITY] Pre-check {getattr(check, '__name__', check)}"
+                    f" raised {type(e).__name__}: {e}, task_id={task.id}"
+                )
+                return False
+        return True
+
+    def _initialize_callbacks(
+        self, callbacks: list[WorkforceCallback] | None
+    ) -> None:
+        """Use the bounded, indexed logger in place of CAMEL's default"""
+        callbacks = list(callbacks or [])
+        if not any(isinstance(cb, WorkforceMetrics) for cb in callbacks):
+            callbacks.append(IndexedWorkforceLogger(self.node_id))
+        super()._initialize_callbacks(callbacks)
+
     def _analyze_task(
         self,
         task: Task,
@@ -112,21 +246,59 @@ class Workforce(BaseWorkforce):
         for_failure: bool,
         error_message: str | None = None,
     ) -> TaskAnalysisResult:
-        """Override to retry when the base class returns None.
+        """Override to hand quality scores to the metrics callbacks as
+        structured data, rather than leaving them to parse log text."""
+        result = self._analyze_task_with_retries(
+            task, for_failure=for_failure, error_message=error_message
+        )
+        if not for_failure and result.quality_score is not None:
+            for cb in self._callbacks:
+                if isinstance(cb, WorkforceMetricsCallback):
+                    cb.record_quality_score(task.id, result.quality_score)
+        return result
 
-        The base class can return None when the LLM fails to produce
-        valid structured output. We retry up to _ANALYZE_TASK_MAX_RETRIES
-        times before falling back.
+    def _analyze_task_with_retries(
+        self,
+        task: Task,
+        *,
+        for_failure: bool,
+        error_message: str | None = None,
+    ) -> TaskAnalysisResult:
+        """Analyze a task, retrying when the base class returns None.
+
+        Quality evaluations first run the deterministic pre-checks, and
+        only results they cannot vouch for go to the LLM. The base class
+        can return None when the LLM fails to produce valid structured
+        output. We retry up to _ANALYZE_TASK_MAX_RETRIES times before
+        falling back.
         """
+        if not for_failure:
+            if self._passes_quality_precheck(task):
+                self.quality_check_stats["skipped"] += 1
+                logger.info(
+                    f"[QUALITY] Pre-check accepted task {task.id}, "
+                    f"skipping LLM analysis",
+                    extra={"quality_check_stats": self.quality_check_stats},
+                )
+                return TaskAnalysisResult(
+                    reasoning="Accepted by deterministic quality pre-check",
+                    quality_score=self.quality_precheck.accepted_quality_score,
+                )
+            self.quality_check_stats["analysed"] += 1
+
         last_exception: Exception | None = None
 
         for attempt in range(1, _ANALYZE_TASK_MAX_RETRIES + 1):
             try:
-                result = super()._analyze_task(
-                    task,
-                    for_failure=for_failure,
-                    error_message=error_message,
-                )
+                with span(
+                    SPAN_TASK_ANALYZE,
+                    {ATTR_TASK_ID: task.id, ATTR_FOR_FAILURE: for_failure},
+                ):
+                    result = super()._analyze_task(
+                        task,
+                        for_failure=for_failure,
+                        error_message=error_message,
+                    )
 
                 if result is not None:
                     return result
@@ -177,6 +349,7 @@ class Workforce(BaseWorkforce):
         coordinator_context: str = "",
         on_stream_batch=None,
         on_stream_text=None,
+        auto_start_loop: asyncio.AbstractEventLoop | None = None,
     ):
         """Split process_task method to eigent_make_sub_tasks
         and eigent_start method.
@@ -190,6 +363,11 @@ class Workforce(BaseWorkforce):
                 batches signature (List[Task], bool)
             on_stream_text: Optional callback for raw
                 streaming text chunks
+            auto_start_loop: Event loop the workforce runs on. When set,
+                subtasks start executing on it as soon as they are parsed
+                from the decomposition stream, and the later
+                :meth:`eigent_start` call reconciles the confirmed plan
+                with what is already running.
         """
         logger.debug(
             "[DECOMPOSE] eigent_make_sub_tasks called",
@@ -215,15 +393,28 @@ class Workforce(BaseWorkforce):
         self.set_channel(TaskChannel())
         self._state = WorkforceState.RUNNING
         task.state = TaskState.OPEN
-        subtasks = asyncio.run(
-            self.handle_decompose_append_task(
-                task,
-                reset=False,
-                coordinator_context=coordinator_context,
-                on_stream_batch=on_stream_batch,
-                on_stream_text=on_stream_text,
+        self._pipeline_hold = False
+        self._pipeline_task_ids.clear()
+        self._pipeline_runner = None
+        self._pipelined = auto_start_loop is not None
+        self._pipeline_loop = auto_start_loop
+        if auto_start_loop is not None:
+            on_stream_batch = self._pipeline_stream_batch(
+                auto_start_loop, on_stream_batch
             )
-        )
+        try:
+            subtasks = asyncio.run(
+                self.handle_decompose_append_task(
+                    task,
+                    reset=False,
+                    coordinator_context=coordinator_context,
+                    on_stream_batch=on_stream_batch,
+                    on_stream_text=on_stream_text,
+                )
+            )
+        finally:
+            self._pipelined = False
+            self._pipeline_loop = None
 
         logger.info(
             "[DECOMPOSE] Task decomposition completed",
@@ -244,13 +435,142 @@ class Workforce(BaseWorkforce):
             ),
             extra={"api_task_id": self.api_task_id},
         )
+        if self._pipeline_task_ids:
+            # Subtasks already started during decomposition: apply the
+            # user-confirmed plan to the running loop instead
+            self._reconcile_pipelined_subtasks(subtasks)
+            self._release_pipeline_hold("plan confirmed")
+            runner = self._pipeline_runner
+            if runner is not None and not runner.done():
+                return
+            subtasks = list(self._pending_tasks)
+
         # Clear existing pending tasks to use the user-edited task list
         # (tasks may have been added during decomposition before user edits)
         self._pending_tasks.clear()
 
         self._pending_tasks.extendleft(reversed(subtasks))
         self.save_snapshot("Initial task decomposition")
+        await self._save_checkpoint()
+        await self._run_started_workforce()
+
+    def checkpoint_state(self) -> dict:
+        """Capture the task tree, dependencies and assignments.
+
+        Assignees are recorded by worker description because node ids
+        are regenerated whenever the workforce is rebuilt.
+        """
+        roles = {
+            child.node_id: child.description
+            for child in self._children
+            if hasattr(child, "node_id")
+        }
+        return {
+            "task": task_to_dict(self._task),
+            "dependencies": {
+                task_id: list(deps)
+                for task_id, deps in self._task_dependencies.items()
+            },
+            "assignees": {
+                task_id: roles[node_id]
+                for task_id, node_id in self._assignees.items()
+                if node_id in roles
+            },
+        }
+
+    async def _save_checkpoint(self) -> None:
+        if self._checkpoint_store is None or self._task is None:
+            return
+        state = self.checkpoint_state()
+        try:
+            await asyncio.to_thread(
+                self._checkpoint_store.save,
+                self.api_task_id,
+                self._task.id,
+                state,
+            )
+        except Exception as e:
+            logger.warning(
+                f"[CHECKPOINT] Failed to save checkpoint: {e}",
+                extra={"api_task_id": self.api_task_id},
+            )
+
+    async def discard_checkpoint(self) -> None:
+        """Delete the checkpoint of a run that finished, so completed
+        projects are no longer resumable and the store does not grow.
+
+        A stopped run keeps its checkpoint so it can still be resumed.
+        """
+        if self._checkpoint_store is None or (
+            self._state == WorkforceState.STOPPED
+        ):
+            return
+        try:
+            await asyncio.to_thread(
+                self._checkpoint_store.delete, self.api_task_id
+            )
+        except Exception as e:
+            logger.warning(
+                f"[CHECKPOINT] Failed to delete checkpoint: {e}",
+                extra={"api_task_id": self.api_task_id},
+            )
+
+    def restore_checkpoint(self, checkpoint: dict) -> Task:
+        """Rebuild the task tree from a checkpoint for :meth:`eigent_start`.
+
+        Finished subtasks are marked completed so their results feed the
+        remaining ones without running again. Unfinished subtasks are
+        queued afresh, keeping their dependencies and assignee when that
+        worker still exists and otherwise going back to the coordinator.
+
+        Args:
+            checkpoint: State produced by :meth:`checkpoint_state`.
+
+        Returns:
+            Task: The restored main task.
+        """
+        self.reset()
+        task = task_from_dict(checkpoint["task"])
+        self._task = task
+        self.set_channel(TaskChannel())
+        self._state = WorkforceState.RUNNING
 
+        node_ids = {
+            child.description: child.node_id
+            for child in self._children
+            if hasattr(child, "node_id")
+        }
+        known_ids = {sub.id for sub in task.subtasks}
+        for sub in task.subtasks:
+            if sub.state == TaskState.DONE:
+                self._completed_tasks.append(sub)
+                continue
+            sub.state = TaskState.OPEN
+            sub.result = None
+            sub.failure_count = 0
+            self._pending_tasks.append(sub)
+            deps = checkpoint["dependencies"].get(sub.id)
+            assignee_id = node_ids.get(checkpoint["assignees"].get(sub.id))
+            if (
+                deps is not None
+                and assignee_id is not None
+                and known_ids.issuperset(deps)
+            ):
+                self._task_dependencies[sub.id] = deps
+                self._assignees[sub.id] = assignee_id
+
+        logger.info(
+            "[CHECKPOINT] Restored task tree",
+            extra={
+                "api_task_id": self.api_task_id,
+                "completed": len(self._completed_tasks),
+                "pending": len(self._pending_tasks),
+            },
+        )
+        return task
+
+    async def _run_started_workforce(self) -> None:
+        """Run the execution loop, keeping the lifecycle state consistent."""
         try:
             await self.start()
         except Exception as e:
@@ -262,9 +582,197 @@ class Workforce(BaseWorkforce):
             self._state = WorkforceState.STOPPED
             raise
         finally:
+            self._release_pipeline_hold("run ended")
+            self._running_tasks.clear()
             if self._state != WorkforceState.STOPPED:
                 self._state = WorkforceState.IDLE
 
+    def _pipeline_stream_batch(
+        self, loop: asyncio.AbstractEventLoop, on_stream_batch=None
+    ):
+        """Wrap a stream batch callback so parsed subtasks are also
+        submitted to the workforce running on :obj:`loop`.
+
+        Args:
+            loop: Event loop the workforce execution runs on.
+            on_stream_batch: Optional callback to chain.
+
+        Returns:
+            The wrapped callback with signature (List[Task], bool).
+        """
+
+        def callback(new_tasks: list[Task], is_final: bool = False):
+            if new_tasks:
+                asyncio.run_coroutine_threadsafe(
+                    self.eigent_pipeline_submit(list(new_tasks)), loop
+                )
+            if on_stream_batch:
+                on_stream_batch(new_tasks, is_final)
+
+        return callback
+
+    async def eigent_pipeline_submit(self, subtasks: list[Task]) -> None:
+        """Queue subtasks parsed from a still-running decomposition.
+
+        The first batch starts the execution loop, which is held open
+        until :meth:`eigent_start` confirms the plan. Subtasks already
+        submitted are ignored, so overlapping stream batches are safe.
+
+        Args:
+            subtasks: Newly parsed subtasks.
+        """
+        fresh = [t for t in subtasks if t.id not in self._pipeline_task_ids]
+        if not fresh or self._stop_requested:
+            return
+        self._pipeline_task_ids.update(t.id for t in fresh)
+        self._pending_tasks.extend(fresh)
+        logger.info(
+            f"[PIPELINE] Submitted {len(fresh)} subtasks during decomposition",
+            extra={
+                "api_task_id": self.api_task_id,
+                "subtask_ids": [t.id for t in fresh],
+            },
+        )
+
+        if self._pipeline_hold:
+            self._pipeline_wakeup.set()
+            return
+
+        self._pipeline_hold = True
+        self._increment_in_flight_tasks(_PIPELINE_HOLD_ID)
+        self._pipeline_hold_timer = asyncio.get_running_loop().call_later(
+            _PIPELINE_HOLD_TIMEOUT_SECONDS,
+            self._release_pipeline_hold,
+            "confirmation timed out",
+        )
+        self.save_snapshot("Pipelined task decomposition")
+        self._pipeline_runner = asyncio.create_task(
+            self._run_started_workforce()
+        )
+        get_task_lock(self.api_task_id).add_background_task(
+            self._pipeline_runner
+        )
+
+    def _reconcile_pipelined_subtasks(self, subtasks: list[Task]) -> None:
+        """Apply the user-confirmed plan to a pipelined run.
+
+        Subtasks that were removed and have not been posted yet are
+        dropped, and their ids are removed from the remaining
+        dependencies. New subtasks are queued. Subtasks that already
+        started keep running. Content edits apply in place, because the
+        confirmed plan holds the same :class:`Task` objects.
+
+        Args:
+            subtasks: The confirmed subtask list.
+        """
+        confirmed_ids = {t.id for t in subtasks}
+        dropped = [t for t in self._pending_tasks if t.id not in confirmed_ids]
+        for task in dropped:
+            self._pending_tasks.remove(task)
+            self._cleanup_task_tracking(task.id)
+        dropped_ids = {t.id for t in dropped}
+        if dropped_ids:
+            for dependencies in self._task_dependencies.values():
+                dependencies[:] = [
+                    dep for dep in dependencies if dep not in dropped_ids
+                ]
+
+        added = [t for t in subtasks if t.id not in self._pipeline_task_ids]
+        self._pipeline_task_ids.update(t.id for t in added)
+        self._pending_tasks.extend(added)
+
+        pending_ids = {t.id for t in self._pending_tasks}
+        started_removed = (
+            self._pipeline_task_ids - confirmed_ids - dropped_ids - pending_ids
+        )
+        logger.info(
+            "[PIPELINE] Reconciled confirmed plan",
+            extra={
+                "api_task_id": self.api_task_id,
+                "dropped": sorted(dropped_ids),
+                "added": [t.id for t in added],
+                "removed_but_started": sorted(started_removed),
+            },
+        )
+
+    def _release_pipeline_hold(self, reason: str) -> None:
+        """Let the execution loop finish once queued work is done.
+
+        Called when the plan is confirmed, the run stops or ends, or the
+        confirmation times out.
+        """
+        if self._pipeline_hold_timer is not None:
+            self._pipeline_hold_timer.cancel()
+            self._pipeline_hold_timer = None
+        if not self._pipeline_hold:
+            return
+        self._pipeline_hold = False
+        self._decrement_in_flight_tasks(_PIPELINE_HOLD_ID, reason)
+        self._pipeline_wakeup.set()
+        if reason != "plan confirmed":
+            logger.info(
+                f"[PIPELINE] Released plan confirmation hold: {reason}",
+                extra={"api_task_id": self.api_task_id},
+            )
+
+    def _update_decomposition_dependencies(
+        self, task: Task, subtasks: list[Task]
+    ) -> None:
+        """Update dependency tracking for streamed subtasks.
+
+        A pipelined decomposition streams in a worker thread while the
+        execution loop reads and changes the same dependencies, so the
+        update is handed to the loop that owns them. Calls queued with
+        ``call_soon_threadsafe`` run in order, before the coroutine
+        submitting the same batch.
+        """
+        loop = self._pipeline_loop
+        if loop is None or _running_loop() is loop:
+            self._update_dependencies_for_decomposition(task, subtasks)
+            return
+        loop.call_soon_threadsafe(
+            self._update_dependencies_for_decomposition, task, list(subtasks)
+        )
+
+    def _read_annotations(
+        self, task: Task, subtasks: list[Task], known_ids: set[str]
+    ) -> None:
+        """Take the worker hint and dependencies of new subtasks from the
+        annotations the decomposition prompt asks for.
+
+        Args:
+            task (Task): The decomposed task.
+            subtasks (list[Task]): Subtasks not read yet, in plan order.
+            known_ids (set[str]): Ids of the subtasks read so far, which
+                the new ones are added to.
+        """
+        if not self.assignment_rules.enabled:
+            return
+        for subtask in subtasks:
+            read_annotation(subtask, task.id)
+            info = subtask.additional_info or {}
+            if "dependencies" in info:
+                # Only earlier subtasks of this plan can be depended on
+                info["dependencies"] = [
+                    dep for dep in info["dependencies"] if dep in known_ids
+                ]
+            known_ids.add(subtask.id)
+
+    @staticmethod
+    def _without_annotations(stream_callback):
+        """Wrap a decomposition stream callback so that it gets the
+        accumulated text without the assignment annotations."""
+
+        def callback(chunk):
+            content = (
+                chunk.msg.content
+                if hasattr(chunk, "msg") and chunk.msg
+                else str(chunk)
+            )
+            stream_callback(strip_annotations(content))
+
+        return callback
+
     def _decompose_task(self, task: Task, stream_callback=None):
         """Decompose task with optional streaming text callback."""
         decompose_prompt = str(
@@ -274,29 +782,56 @@ class Workforce(BaseWorkforce):
                 additional_info=task.additional_info,
             )
         )
+        if self.assignment_rules.enabled:
+            decompose_prompt += DECOMPOSE_ANNOTATION_PROMPT
+            if stream_callback is not None:
+                stream_callback = self._without_annotations(stream_callback)
 
         self.task_agent.reset()
-        result = task.decompose(
-            self.task_agent, decompose_prompt, stream_callback=stream_callback
+        decompose_span = start_span(
+            SPAN_TASK_DECOMPOSE, {ATTR_TASK_ID: task.id}
         )
+        try:
+            with trace.use_span(decompose_span, end_on_exit=False):
+                result = task.decompose(
+                    self.task_agent,
+                    decompose_prompt,
+                    stream_callback=stream_callback,
+                )
+        except Exception:
+            decompose_span.end()
+            raise
 
         if isinstance(result, Generator):
 
             def streaming_with_dependencies():
                 all_subtasks = []
-                for new_tasks in result:
-                    all_subtasks.extend(new_tasks)
-                    if new_tasks:
-                        self._update_dependencies_for_decomposition(
-                            task, all_subtasks
-                        )
-                    yield new_tasks
+                known_ids: set[str] = set()
+                try:
+                    for new_tasks in result:
+                        self._read_annotations(task, new_tasks, known_ids)
+                        all_subtasks.extend(new_tasks)
+                        if new_tasks:
+                            self._update_decomposition_dependencies(
+                                task, all_subtasks
+                            )
+                        yield new_tasks
+                finally:
+                    decompose_span.set_attribute(
+                        ATTR_SUBTASK_COUNT, len(all_subtasks)
+                    )
+                    decompose_span.end()
 
             return streaming_with_dependencies()
         else:
             subtasks = result
             if subtasks:
-                self._update_dependencies_for_decomposition(task, subtasks)
+                self._read_annotations(task, subtasks, set())
+                self._update_decomposition_dependencies(task, subtasks)
+            decompose_span.set_attribute(
+                ATTR_SUBTASK_COUNT, len(subtasks or [])
+            )
+            decompose_span.end()
             return subtasks
 
     async def handle_decompose_append_task(
@@ -380,7 +915,9 @@ class Workforce(BaseWorkforce):
             subtasks = subtasks_result
 
         if subtasks:
-            self._pending_tasks.extendleft(reversed(subtasks))
+            # Pipelined subtasks are queued by eigent_pipeline_submit
+            if not self._pipelined:
+                self._pending_tasks.extendleft(reversed(subtasks))
             # Log task created events
             metrics_callbacks = [
                 cb
@@ -487,7 +1024,35 @@ class Workforce(BaseWorkforce):
         # Task assignment phase: send "waiting for execution" notification
         # to the frontend, and send "start execution" notification when the
         # task actually begins execution
-        assigned = await super()._find_assignee(tasks)
+        candidates = self._rule_candidates(tasks)
+        if self._assignment_similarity is None:
+            rule_assignments = self._rule_based_assignments(candidates)
+        else:
+            # Embedding subtasks blocks, keep it off the event loop
+            rule_assignments = await asyncio.to_thread(
+                self._rule_based_assignments, candidates
+            )
+        assigned_ids = {item.task_id for item in rule_assignments}
+        remaining = [t for t in tasks if t.id not in assigned_ids]
+        if rule_assignments:
+            self._update_task_dependencies_from_assignments(
+                rule_assignments, tasks
+            )
+        assigned = TaskAssignResult(assignments=rule_assignments)
+        if remaining:
+            with span(SPAN_TASK_ASSIGN, {ATTR_SUBTASK_COUNT: len(remaining)}):
+                coordinator_result = await super()._find_assignee(remaining)
+            if rule_assignments:
+                assigned.assignments.extend(coordinator_result.assignments)
+            else:
+                assigned = coordinator_result
+        self.assignment_stats["rule"] += len(rule_assignments)
+        self.assignment_stats["coordinator"] += len(remaining)
+        logger.info(
+            f"[WF] Assigned {len(rule_assignments)} of {len(tasks)} tasks "
+            f"by rule",
+            extra={"assignment_stats": self.assignment_stats},
+        )
 
         task_lock = get_task_lock(self.api_task_id)
         for item in assigned.assignments:
@@ -574,11 +1139,230 @@ class Workforce(BaseWorkforce):
                 metrics_callbacks[0].log_task_assigned(event)
         return assigned
 
+    def _known_dependencies(
+        self, task: Task, batch: list[Task]
+    ) -> list[str] | None:
+        """Get a subtask's dependencies when they do not need the
+        coordinator, or None if only the coordinator can tell."""
+        declared = (task.additional_info or {}).get("dependencies")
+        if isinstance(declared, list):
+            # Keep what the subtask inherited from its decomposed parent
+            inherited = self._task_dependencies.get(task.id, [])
+            return list(
+                dict.fromkeys([*inherited, *(str(dep) for dep in declared)])
+            )
+        if task.assigned_worker_id:
+            # Reassignment after a failure keeps the original dependencies
+            return list(self._task_dependencies.get(task.id, []))
+        others = [t for t in self._pending_tasks if t.id != task.id] + [
+            t for t in batch if t.id != task.id
+        ]
+        if not others and not self._completed_tasks:
+            return []
+        return None
+
+    def _rule_candidates(
+        self, tasks: list[Task]
+    ) -> list[tuple[Task, list[str], dict[str, str]]]:
+        """Collect the subtasks whose dependencies are already known.
+
+        Args:
+            tasks (list[Task]): The subtasks awaiting assignment.
+
+        Returns:
+            list[tuple[Task, list[str], dict[str, str]]]: Each subtask that
+                may be assigned by rule, with its dependencies and the
+                descriptions of the workers it may go to, by node id.
+        """
+        if not self.assignment_rules.enabled:
+            return []
+        workers = {
+            child.node_id: child.description
+            for child in self._children
+            if child.node_id in self._get_valid_worker_ids()
+        }
+        candidates = []
+        for task in tasks:
+            dependencies = self._known_dependencies(task, tasks)
+            if dependencies is None:
+                continue
+            task_workers = workers
+            if task.assigned_worker_id and len(workers) > 1:
+                # A reassigned subtask should go to a different worker
+                task_workers = {
+                    node_id: description
+                    for node_id, description in workers.items()
+                    if node_id != task.assigned_worker_id
+                }
+            candidates.append((task, dependencies, task_workers))
+        return candidates
+
+    def _rule_based_assignments(
+        self, candidates: list[tuple[Task, list[str], dict[str, str]]]
+    ) -> list[TaskAssignment]:
+        """Assign the candidate subtasks whose worker is obvious.
+
+        Args:
+            candidates (list[tuple[Task, list[str], dict[str, str]]]): The
+                subtasks from :meth:`_rule_candidates`.
+
+        Returns:
+            list[TaskAssignment]: Assignments made without the
+                coordinator. Subtasks left out go to the coordinator.
+        """
+        assignments = []
+        for task, dependencies, workers in candidates:
+            try:
+                assignee_id = match_worker(
+                    task,
+                    workers,
+                    self.assignment_rules,
+                    self._assignment_similarity,
+                )
+            except Exception as e:
+                logger.warning(
+                    f"[WF] Rule-based assignment failed for task "
+                    f"{task.id}: {type(e).__name__}: {e}"
+                )
+                continue
+            if assignee_id is None:
+                continue
+            assignments.append(
+                TaskAssignment(
+                    task_id=task.id,
+                    assignee_id=assignee_id,
+                    dependencies=dependencies,
+                )
+            )
+        return assignments
+
+    def _estimate_task_duration(self, task: Task) -> float:
+        """Estimate a subtask's processing time from earlier tasks of its
+        worker role in this backend process.
+
+        Args:
+            task (Task): The subtask to estimate.
+
+        Returns:
+            float: Estimated seconds, falling back to a default when the
+                assigned worker role has not completed any task yet.
+        """
+        assignee_id = self._assignees.get(task.id)
+        if assignee_id:
+            for cb in self._callbacks:
+                if isinstance(cb, WorkforceMetricsCallback):
+                    estimate = cb.estimate_duration(assignee_id)
+                    if estimate is not None:
+                        return estimate
+        return _DEFAULT_TASK_DURATION_SECONDS
+
+    def _critical_path_weights(self, tasks: list[Task]) -> dict[str, float]:
+        """Compute the critical-path weight of each task.
+
+        A task's weight is its own estimated duration plus the heaviest
+        weight among the tasks that depend on it, i.e. the length of the
+        longest chain it blocks.
+
+        Args:
+            tasks (list[Task]): The tasks that have not finished yet.
+
+        Returns:
+            dict[str, float]: Weight per task id.
+        """
+        by_id = {task.id: task for task in tasks}
+        dependents: dict[str, list[str]] = {task_id: [] for task_id in by_id}
+        for task_id in by_id:
+            for dep_id in self._task_dependencies.get(task_id, []):
+                if dep_id in dependents and dep_id != task_id:
+                    dependents[dep_id].append(task_id)
+
+        weights: dict[str, float] = {}
+        visiting: set[str] = set()
+
+        def weight(task_id: str) -> float:
+            if task_id in weights:
+                return weights[task_id]
+            if task_id in visiting:
+                # Dependency cycle, count each task once
+                return 0.0
+            visiting.add(task_id)
+            downstream = max(
+                (weight(child) for child in dependents[task_id]),
+                default=0.0,
+            )
+            visiting.discard(task_id)
+            weights[task_id] = (
+                self._estimate_task_duration(by_id[task_id]) + downstream
+            )
+            return weights[task_id]
+
+        for task_id in by_id:
+            weight(task_id)
+        return weights
+
+    def _worker_has_capacity(self, assignee_id: str) -> bool:
+        limit = self._worker_concurrency.get(assignee_id)
+        if limit is None:
+            return True
+        running = sum(
+            1
+            for worker in self._running_tasks.values()
+            if worker == assignee_id
+        )
+        return running < limit
+
+    async def _post_ready_tasks(self) -> None:
+        """Post ready subtasks, longest critical path first.
+
+        CAMEL posts ready tasks in queue order. Here they are collected
+        while the base pass runs, ranked by the estimated length of the
+        dependency chain each one blocks, and then dispatched in that
+        order as far as each worker's concurrency limit allows. Tasks
+        that do not fit go back to the pending queue and are retried
+        once a running task returns.
+        """
+        if self._dispatch_batch is not None:
+            await super()._post_ready_tasks()
+            return
+
+        self._dispatch_batch = []
+        try:
+            await super()._post_ready_tasks()
+            batch = self._dispatch_batch
+        finally:
+            self._dispatch_batch = None
+        if not batch:
+            return
+
+        weights = self._critical_path_weights(
+            [*self._pending_tasks, *(task for task, _ in batch)]
+        )
+        batch.sort(key=lambda item: weights[item[0].id], reverse=True)
+        for task, assignee_id in batch:
+            if self._worker_has_capacity(assignee_id):
+                await self._dispatch_task(task, assignee_id)
+            else:
+                logger.debug(
+                    f"[WF] DEFER {task.id}, {assignee_id} is at capacity"
+                )
+                self._pending_tasks.append(task)
+
     async def _post_task(self, task: Task, assignee_id: str) -> None:
+        if self._dispatch_batch is not None:
+            # Collected and ranked by _post_ready_tasks
+            self._dispatch_batch.append((task, assignee_id))
+            return
+        if not self._worker_has_capacity(assignee_id):
+            logger.debug(f"[WF] DEFER {task.id}, {assignee_id} is at capacity")
+            self._pending_tasks.append(task)
+            return
+        await self._dispatch_task(task, assignee_id)
+
+    async def _dispatch_task(self, task: Task, assignee_id: str) -> None:
         # DEBUG ▶ Dependencies are met, the task really starts to execute
         logger.debug(f"[WF] POST  {task.id} -> {assignee_id}")
-        """Override the _post_task method to notify the frontend
-        when the task really starts to execute
+        """Notify the frontend when the task really starts to execute,
+        then publish it through CAMEL's _post_task
         """
         # When the dependency check is passed and the task is
         # about to be published to the execution queue, send a
@@ -613,17 +1397,34 @@ class Workforce(BaseWorkforce):
                         },
                     )
                 )
+        self._running_tasks[task.id] = assignee_id
         # Call the parent class method to continue the
         # normal task publishing process
         await super()._post_task(task, assignee_id)
 
+    def _decrement_in_flight_tasks(
+        self, task_id: str, context: str = ""
+    ) -> None:
+        # Every path that takes a task out of flight frees its worker slot
+        self._running_tasks.pop(task_id, None)
+        super()._decrement_in_flight_tasks(task_id, context)
+
+    def _cleanup_task_tracking(self, task_id: str) -> None:
+        self._running_tasks.pop(task_id, None)
+        super()._cleanup_task_tracking(task_id)
+
     def add_single_agent_worker(
         self,
         description: str,
         worker: ListenChatAgent,
         pool_max_size: int = DEFAULT_WORKER_POOL_SIZE,
         enable_workflow_memory: bool = False,
+        max_concurrent_tasks: int | None = None,
     ) -> BaseWorkforce:
+        if max_concurrent_tasks is None:
+            max_concurrent_tasks = self._default_worker_concurrency
+        if max_concurrent_tasks is not None and max_concurrent_tasks < 1:
+            raise ValueError("max_concurrent_tasks must be at least 1")
         if self._state == WorkforceState.RUNNING:
             raise RuntimeError(
                 "Cannot add workers while workforce is running. "
@@ -643,8 +1444,16 @@ class Workforce(BaseWorkforce):
             use_structured_output_handler=self.use_structured_output_handler,
             context_utility=None,
             enable_workflow_memory=enable_workflow_memory,
+            memo_store=self._memo_store,
+            dependency_context=self._dependency_context,
+            dependency_summarizer=self._dependency_summarizer,
+            working_directory=self.working_directory,
         )
         self._children.append(worker_node)
+        if max_concurrent_tasks is not None:
+            self._worker_concurrency[worker_node.node_id] = (
+                max_concurrent_tasks
+            )
 
         # If we have a channel set up, set it for the new worker
         if hasattr(self, "_channel") and self._channel is not None:
@@ -699,15 +1508,17 @@ class Workforce(BaseWorkforce):
         if not parent or not parent.subtasks:
             return
 
-        for sub in parent.subtasks:
-            if sub.id == task.id:
-                sub.result = task.result
-                sub.state = task.state
-                logger.debug(
-                    f"[SYNC] Synced subtask {task.id} "
-                    f"result to parent.subtasks"
-                )
-                return
+        sub = task_tree.child(parent.id, task.id)
+        if sub is None:
+            task_tree.index(parent.subtasks, parent)
+            sub = task_tree.child(parent.id, task.id)
+        if sub is not None:
+            sub.result = task.result
+            sub.state = task.state
+            logger.debug(
+                f"[SYNC] Synced subtask {task.id} result to parent.subtasks"
+            )
+            return
 
         logger.warning(
             f"[SYNC] Subtask {task.id} not found in parent.subtasks"
@@ -747,6 +1558,9 @@ class Workforce(BaseWorkforce):
             "state": task.state,
             "result": task.result or "",
             "failure_count": task.failure_count,
+            "cached": bool(
+                task.additional_info and task.additional_info.get("memo_hit")
+            ),
         }
         await task_lock.put_queue(ActionTaskStateData(data=task_data))
 
@@ -777,11 +1591,40 @@ class Workforce(BaseWorkforce):
         self._sync_subtask_to_parent(task)
         await self._notify_task_completion(task)
         await super()._handle_completed_task(task)
+        await self._save_checkpoint()
+
+    async def _handle_cancelled_task(self, task: Task) -> bool:
+        """Fail a subtask cancelled while running without retrying or
+        replanning it, so the subtasks depending on it do not run.
+
+        Returns:
+            bool: False, the rest of the workforce keeps running.
+        """
+        logger.info(f"[WF] CANCELLED {task.id}: {task.result}")
+        task.failure_count = self.failure_handling_config.max_retries
+        await self._mark_task_permanently_failed(task)
+        await self._post_ready_tasks()
+        task_lock = get_task_lock(self.api_task_id)
+        await task_lock.put_queue(
+            ActionTaskStateData(
+                data={
+                    "task_id": task.id,
+                    "content": task.content,
+                    "state": task.state,
+                    "failure_count": task.failure_count,
+                    "result": task.result or "",
+                }
+            )
+        )
+        return False
 
     async def _handle_failed_task(self, task: Task) -> bool:
         # DEBUG ▶ Task failed
         logger.debug(f"[WF] FAIL  {task.id} retry={task.failure_count}")
 
+        if (task.additional_info or {}).get("cancelled"):
+            return await self._handle_cancelled_task(task)
+
         result = await super()._handle_failed_task(task)
 
         # Only send completion report to frontend when all
@@ -795,14 +1638,12 @@ class Workforce(BaseWorkforce):
         metrics_callbacks = [
             cb for cb in self._callbacks if isinstance(cb, WorkforceMetrics)
         ]
-        if metrics_callbacks and hasattr(metrics_callbacks[0], "log_entries"):
-            for entry in reversed(metrics_callbacks[0].log_entries):
-                if (
-                    entry.get("event_type") == "task_failed"
-                    and entry.get("task_id") == task.id
-                ):
+        for cb in metrics_callbacks:
+            if isinstance(cb, IndexedWorkforceLogger):
+                entry = cb.latest(task.id, "task_failed")
+                if entry:
                     error_message = entry.get("error_message")
-                    break
+                break
 
         task_lock = get_task_lock(self.api_task_id)
         await task_lock.put_queue(
@@ -834,6 +1675,33 @@ class Workforce(BaseWorkforce):
 
         return result
 
+    async def _wait_returned_task(self) -> Task | None:
+        """Wait for a returned task, or for new pipelined subtasks.
+
+        Returns:
+            Task | None: The returned task, or None when the wait was cut
+                short so the caller posts newly queued subtasks.
+        """
+        returned = asyncio.ensure_future(
+            self._channel.get_returned_task_by_publisher(self.node_id)
+        )
+        if not self._pipeline_hold:
+            return await returned
+
+        wakeup = asyncio.ensure_future(self._pipeline_wakeup.wait())
+        try:
+            await asyncio.wait(
+                {returned, wakeup}, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            wakeup.cancel()
+            if not returned.done():
+                returned.cancel()
+        if returned.done() and not returned.cancelled():
+            return returned.result()
+        self._pipeline_wakeup.clear()
+        return None
+
     async def _get_returned_task(self) -> Task | None:
         r"""Override to handle timeout and send notification to frontend.
 
@@ -845,10 +1713,11 @@ class Workforce(BaseWorkforce):
             asyncio.TimeoutError: If waiting for task exceeds timeout
         """
         try:
-            return await asyncio.wait_for(
-                self._channel.get_returned_task_by_publisher(self.node_id),
+            returned = await asyncio.wait_for(
+                self._wait_returned_task(),
                 timeout=self.task_timeout_seconds,
             )
+            return returned
         except TimeoutError:
             # Send timeout notification to frontend before re-raising
             logger.warning(
@@ -890,6 +1759,10 @@ class Workforce(BaseWorkforce):
             )
             raise
 
+    def reset(self) -> None:
+        super().reset()
+        self._running_tasks.clear()
+
     def stop(self) -> None:
         logger.info("=" * 80)
         logger.info(
@@ -901,16 +1774,37 @@ class Workforce(BaseWorkforce):
             f"{self._state.name}, _running: {self._running}"
         )
         logger.info("=" * 80)
+        task_lock = get_task_lock(self.api_task_id)
+        # Interrupt in-flight model calls and tools, not just the queue
+        task_lock.cancel_running_work("stop")
+        self._release_pipeline_hold("stopped")
         super().stop()
         logger.info(
             f"[WF-LIFECYCLE] super().stop() completed, "
             f"new state: {self._state.name}"
         )
-        task_lock = get_task_lock(self.api_task_id)
         task = asyncio.create_task(task_lock.put_queue(ActionEndData()))
         task_lock.add_background_task(task)
         logger.info("[WF-LIFECYCLE] ✅ ActionEndData queued")
 
+    def remove_task(self, task_id: str) -> bool:
+        """Remove a pending subtask, or cancel it if it is already running.
+
+        Args:
+            task_id (str): The ID of the subtask to remove.
+
+        Returns:
+            bool: True if the subtask was removed or cancelled.
+        """
+        if super().remove_task(task_id):
+            return True
+        if task_id not in self._running_tasks:
+            return False
+        task_lock = get_task_lock_if_exists(self.api_task_id)
+        return task_lock is not None and task_lock.cancel_subtask(
+            task_id, "removed"
+        )
+
     def stop_gracefully(self) -> None:
         logger.info("=" * 80)
         logger.info(
@@ -922,6 +1816,7 @@ class Workforce(BaseWorkforce):
             f"{self._state.name}, _running: {self._running}"
         )
         logger.info("=" * 80)
+        self._release_pipeline_hold("stopped")
         super().stop_gracefully()
         logger.info(
             f"[WF-LIFECYCLE] ✅ super().stop_gracefully() completed, "
@@ -981,6 +1876,7 @@ class Workforce(BaseWorkforce):
 
     async def cleanup(self) -> None:
         r"""Clean up resources when workforce is done"""
+        self._release_pipeline_hold("cleaned up")
         try:
             # Clean up the task lock
             from app.service.task import delete_task_lock
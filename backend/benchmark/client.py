@@ -14,10 +14,12 @@
 
 import asyncio
 import json
+import time
 
 import httpx
 
 from benchmark.environment import BenchmarkData, ModelKwargs
+from benchmark.timing import RunTiming
 
 
 class BenchmarkClient:
@@ -42,8 +44,13 @@ class BenchmarkClient:
         data: BenchmarkData,
         model_kwargs: ModelKwargs | None = None,
         verbose: bool | None = None,
+        timing: RunTiming | None = None,
     ) -> list[dict]:
-        """Run a single benchmark and return all events."""
+        """Run a single benchmark and return all events.
+
+        Pass ``timing`` to have it filled with the run's latencies and
+        event counts.
+        """
         chat = data.to_chat(model_kwargs or ModelKwargs())
         payload = chat.model_dump()
 
@@ -51,6 +58,7 @@ class BenchmarkClient:
         events = []
         task_started = False
         last_step = None
+        started = time.perf_counter()
 
         async with self.client.stream(
             "POST", f"{self.base_url}/chat", json=payload
@@ -67,6 +75,12 @@ class BenchmarkClient:
                     continue
 
                 events.append(event)
+                if timing is not None:
+                    timing.observe(
+                        event,
+                        len(line.encode()),
+                        time.perf_counter() - started,
+                    )
                 step = event.get("step")
                 if should_print:
                     last_step = self._print_event(event, last_step)
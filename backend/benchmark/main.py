@@ -12,15 +12,18 @@
 # limitations under the License.
 # ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
 
+import argparse
 import asyncio
 import csv
 import importlib.util
-import sys
+import json
+import time
 from datetime import datetime
 from pathlib import Path
 
 from benchmark.client import BenchmarkClient
 from benchmark.environment import BenchmarkConfig
+from benchmark.timing import LATENCY_FIELDS, RunTiming, summarize
 
 DATASET_DIR = Path(__file__).parent / "dataset"
 RESULTS_DIR = Path(__file__).parent
@@ -29,7 +32,9 @@ RESULTS_DIR = Path(__file__).parent
 async def run_benchmark(
     client: BenchmarkClient,
     benchmark_path: Path,
-    verbose: bool = False
+    verbose: bool = False,
+    llm_url: str | None = None,
+    run: int | None = None,
 ) -> dict:
     """Load a benchmark config and run it.
 
@@ -38,15 +43,29 @@ async def run_benchmark(
             communication.
         benchmark_path (Path): Path to the benchmark JSON config file.
         verbose (bool): If True, print SSE events during the run.
+        llm_url (str | None): If set, send model calls to this
+            OpenAI-compatible endpoint, e.g. the stub server in
+            ``benchmark/stub_llm.py``.
+        run (int | None): Index of a repeated run. Each run gets its own
+            project and working directory so runs can overlap.
 
     Returns:
         dict: Results including benchmark name, model, checker and
-            grader outcomes.
+            grader outcomes, and the run's timing.
     """
     config = BenchmarkConfig.from_json(benchmark_path)
     data = config.data
+    if run is not None:
+        data = data.model_copy(update={"name": f"{data.name}_{run}"})
 
     model_kwargs = config.model_kwargs
+    if llm_url:
+        model_kwargs = model_kwargs.model_copy(
+            update={
+                "api_url": llm_url,
+                "api_key": model_kwargs.api_key or "stub",
+            }
+        )
     model = f"{model_kwargs.model_platform}/{model_kwargs.model_type}"
     print(f"--- Benchmark: {data.name} ---")
     print(f"Question: {data.question}")
@@ -55,8 +74,17 @@ async def run_benchmark(
     print(f"Checkers: {config.tests.checker}")
     print(f"Graders: {config.tests.grader}")
 
-    events = await client.run(data, model_kwargs=model_kwargs, verbose=verbose)
-    print(f"\n--- Done: {data.name} ({len(events)} events) ---")
+    timing = RunTiming(benchmark=data.name)
+    try:
+        events = await client.run(
+            data, model_kwargs=model_kwargs, verbose=verbose, timing=timing
+        )
+    except Exception as e:
+        timing.error = f"{type(e).__name__}: {e}"
+        events = []
+        print(f"\n--- Failed: {data.name} ({timing.error}) ---")
+    else:
+        print(f"\n--- Done: {data.name} ({len(events)} events) ---")
 
     working_dir = data.get_working_directory(model_kwargs)
     checker_results = []
@@ -85,6 +113,7 @@ async def run_benchmark(
         "model": model,
         "checkers": checker_results,
         "graders": grader_results,
+        "timing": timing,
     }
 
 
@@ -120,27 +149,116 @@ def _write_results_csv(all_results: list[dict]) -> Path:
     return csv_path
 
 
-async def main() -> None:
-    verbose: bool = "--verbose" in sys.argv or "-v" in sys.argv
-    args: list[str] = [a for a in sys.argv[1:] if a not in ("--verbose", "-v")]
+def _write_timings(
+    all_results: list[dict], wall_seconds: float, fmt: str
+) -> Path:
+    """Write per-run timings and their summary, as CSV or JSON"""
+    timings = [result["timing"] for result in all_results]
+    summary = summarize(timings, wall_seconds)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-    if args:
-        paths = [Path(p) for p in args]
-    else:
-        paths = sorted(DATASET_DIR.glob("*.json"))
+    if fmt == "json":
+        path = RESULTS_DIR / f"{timestamp}_timings.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "summary": summary,
+                    "runs": [timing.model_dump() for timing in timings],
+                },
+                indent=2,
+            )
+        )
+        return path
+
+    path = RESULTS_DIR / f"{timestamp}_timings.csv"
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(
+            ["benchmark", *LATENCY_FIELDS, "subtasks", "subtask_seconds_max"]
+            + ["events", "bytes", "error"]
+        )
+        for timing in timings:
+            writer.writerow(
+                [
+                    timing.benchmark,
+                    *(getattr(timing, field) for field in LATENCY_FIELDS),
+                    len(timing.subtask_seconds),
+                    max(timing.subtask_seconds.values(), default=None),
+                    timing.events,
+                    timing.bytes,
+                    timing.error or "",
+                ]
+            )
+        writer.writerow([])
+        writer.writerow(
+            ["metric", "count", "mean", "p50", "p95", "p99", "max"]
+        )
+        for metric, value in summary.items():
+            if isinstance(value, dict):
+                writer.writerow([metric, *value.values()])
+        for metric, value in summary.items():
+            if not isinstance(value, dict):
+                writer.writerow([metric, value])
+    return path
 
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Run Eigent benchmarks")
+    parser.add_argument(
+        "paths", nargs="*", type=Path, help="Benchmark JSON configs"
+    )
+    parser.add_argument("-v", "--verbose", action="store_true")
+    parser.add_argument(
+        "--llm-url", help="OpenAI-compatible endpoint for all model calls"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Runs in flight at once against the backend",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=1, help="Runs of each benchmark"
+    )
+    parser.add_argument(
+        "--timings-format", choices=["csv", "json"], default="csv"
+    )
+    args = parser.parse_args()
+
+    paths = args.paths or sorted(DATASET_DIR.glob("*.json"))
     if not paths:
         print(f"No benchmark configs found in {DATASET_DIR}")
         return
 
-    all_results = []
+    semaphore = asyncio.Semaphore(max(1, args.concurrency))
+
+    async def run_one(client: BenchmarkClient, path: Path, run: int) -> dict:
+        async with semaphore:
+            return await run_benchmark(
+                client,
+                path,
+                verbose=args.verbose,
+                llm_url=args.llm_url,
+                run=run if args.repeat > 1 else None,
+            )
+
     async with BenchmarkClient() as client:
-        for path in paths:
-            result = await run_benchmark(client, path, verbose=verbose)
-            all_results.append(result)
+        started = time.perf_counter()
+        all_results = await asyncio.gather(
+            *(
+                run_one(client, path, run)
+                for path in paths
+                for run in range(args.repeat)
+            )
+        )
+        wall_seconds = time.perf_counter() - started
 
     csv_path = _write_results_csv(all_results)
     print(f"Results saved to {csv_path}")
+    timings_path = _write_timings(
+        all_results, wall_seconds, args.timings_format
+    )
+    print(f"Timings saved to {timings_path}")
 
 
 if __name__ == "__main__":
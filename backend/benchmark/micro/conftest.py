@@ -0,0 +1,89 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+"""
+Synthetic fixtures for the micro-benchmarks of backend hot paths
+"""
+
+import asyncio
+import logging
+from pathlib import Path
+
+import pytest
+from camel.tasks import Task
+
+pytest.importorskip("pytest_benchmark")
+
+# Shape of the synthetic subtask tree: children per node at each level
+TREE_SHAPE = (20, 5, 3)
+
+# Shape of the synthetic workspace: directories per level, files per dir
+WORKSPACE_DIRS = (10, 10)
+WORKSPACE_FILES = 20
+
+
+@pytest.fixture(autouse=True)
+def _quiet_logging():
+    """Keep log handlers out of the measurements; the hot paths log at
+    debug level, which production also filters out"""
+    previous = logging.root.manager.disable
+    logging.disable(logging.INFO)
+    yield
+    logging.disable(previous)
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+def _build_tree(prefix: str, shape: tuple[int, ...]) -> list[Task]:
+    if not shape:
+        return []
+    tasks = []
+    for i in range(1, shape[0] + 1):
+        task_id = f"{prefix}.{i}"
+        task = Task(content=f"Subtask {task_id}: summarize", id=task_id)
+        for child in _build_tree(task_id, shape[1:]):
+            task.add_subtask(child)
+        tasks.append(task)
+    return tasks
+
+
+@pytest.fixture
+def sub_tasks() -> list[Task]:
+    """A 20 x 5 x 3 subtask tree, 420 tasks in all"""
+    return _build_tree("bench", TREE_SHAPE)
+
+
+@pytest.fixture(scope="session")
+def workspace(tmp_path_factory) -> Path:
+    """A working directory of 2,000 visible files plus the hidden,
+    compiled and vendored entries format_task_context has to skip"""
+    root = tmp_path_factory.mktemp("workspace")
+    for a in range(WORKSPACE_DIRS[0]):
+        for b in range(WORKSPACE_DIRS[1]):
+            directory = root / f"dir_{a}" / f"sub_{b}"
+            directory.mkdir(parents=True)
+            for n in range(WORKSPACE_FILES):
+                (directory / f"file_{n}.md").touch()
+            (directory / "module.pyc").touch()
+            (directory / ".hidden").touch()
+    for skipped in ("node_modules/pkg", "__pycache__", ".git/objects"):
+        directory = root / skipped
+        directory.mkdir(parents=True)
+        for n in range(WORKSPACE_FILES * 10):
+            (directory / f"file_{n}.js").touch()
+    return root
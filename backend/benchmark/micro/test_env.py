@@ -0,0 +1,45 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import os
+
+import pytest
+
+from app.component import environment
+from app.component.environment import env, set_user_env_path
+
+# Keys in the synthetic user .env file
+USER_ENV_KEYS = 50
+
+
+@pytest.mark.benchmark(group="env")
+def test_env_global(benchmark, monkeypatch):
+    monkeypatch.setenv("EIGENT_BENCH_KEY", "value")
+    assert benchmark(env, "EIGENT_BENCH_KEY") == "value"
+
+
+@pytest.mark.benchmark(group="env")
+def test_env_user_env_path(benchmark, monkeypatch, tmp_path):
+    """A lookup with a per-user .env set, which re-reads the file"""
+    monkeypatch.setattr(environment, "env_base_dir", str(tmp_path))
+    keys = [f"EIGENT_BENCH_KEY_{n}" for n in range(USER_ENV_KEYS)]
+    env_file = tmp_path / ".env"
+    env_file.write_text("".join(f"{key}=value\n" for key in keys))
+    set_user_env_path(str(env_file))
+    try:
+        assert benchmark(env, keys[-1]) == "value"
+    finally:
+        set_user_env_path(None)
+        for key in keys:
+            os.environ.pop(key, None)
@@ -0,0 +1,70 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import pytest
+
+from app.model.chat import sse_json
+from app.service.chat_service import tree_sub_tasks
+from app.utils.server import sync_step
+
+# Streamed decompose_text chunks per benchmark round
+DECOMPOSE_CHUNKS = 500
+
+
+@pytest.mark.benchmark(group="sse_json")
+def test_sse_json_small(benchmark):
+    data = {
+        "agent_name": "developer_agent",
+        "process_task_id": "1.2",
+        "toolkit_name": "Terminal Toolkit",
+        "method_name": "shell exec",
+        "message": "ls -la",
+    }
+    event = benchmark(sse_json, "activate_toolkit", data)
+    assert event.startswith("data: ")
+
+
+@pytest.mark.benchmark(group="sse_json")
+def test_sse_json_sub_task_tree(benchmark, sub_tasks):
+    data = {"project_id": "bench", "sub_tasks": tree_sub_tasks(sub_tasks)}
+    event = benchmark(sse_json, "to_sub_tasks", data)
+    assert event.endswith("\n\n")
+
+
+@pytest.mark.benchmark(group="sync_step")
+def test_parse_value(benchmark):
+    event = sse_json("task_state", {"task_id": "1.2", "state": "DONE"})
+    data = benchmark(sync_step._parse_value, event)
+    assert data["step"] == "task_state"
+
+
+@pytest.mark.benchmark(group="sync_step")
+def test_decompose_text_batching(benchmark):
+    """The buffering _try_sync does for decompose_text, without sending"""
+    chunks = [f"token{n} " for n in range(DECOMPOSE_CHUNKS)]
+
+    def batch() -> int:
+        flushes = 0
+        for chunk in chunks:
+            event = sse_json("decompose_text", {"content": chunk})
+            data = sync_step._parse_value(event)
+            sync_step._buffer_text("bench", data["data"]["content"])
+            if sync_step._should_flush("bench"):
+                sync_step._text_buffers.pop("bench")
+                flushes += 1
+        sync_step._text_buffers.pop("bench", None)
+        return flushes
+
+    flushes = benchmark(batch)
+    assert flushes == DECOMPOSE_CHUNKS // sync_step.BATCH_WORD_THRESHOLD
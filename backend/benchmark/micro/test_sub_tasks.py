@@ -0,0 +1,63 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import pytest
+from camel.tasks import Task
+
+from app.model.chat import TaskContent
+from app.service.chat_service import (
+    format_task_context,
+    tree_sub_tasks,
+    update_sub_tasks,
+)
+
+
+def _walk(tasks: list[Task]):
+    for task in tasks:
+        yield task
+        yield from _walk(task.subtasks)
+
+
+@pytest.mark.benchmark(group="sub_tasks")
+def test_tree_sub_tasks(benchmark, sub_tasks):
+    tree = benchmark(tree_sub_tasks, sub_tasks)
+    assert len(tree) == len(sub_tasks)
+
+
+@pytest.mark.benchmark(group="sub_tasks")
+def test_update_sub_tasks(benchmark, sub_tasks):
+    updates = {
+        task.id: TaskContent(id=task.id, content=f"{task.content}, edited")
+        for task in _walk(sub_tasks)
+    }
+    kept = benchmark(update_sub_tasks, sub_tasks, updates)
+    assert len(kept) == len(sub_tasks)
+
+
+@pytest.mark.benchmark(group="format_task_context")
+def test_format_task_context(benchmark, workspace):
+    task_data = {
+        "task_content": "Summarize the workspace",
+        "task_result": "Done",
+        "working_directory": str(workspace),
+    }
+    context = benchmark(format_task_context, task_data)
+    assert context.count("\n  - ") == 2000
+
+
+@pytest.mark.benchmark(group="format_task_context")
+def test_format_task_context_seen_files(benchmark, workspace):
+    task_data = {"working_directory": str(workspace)}
+    context = benchmark(lambda: format_task_context(task_data, set()))
+    assert context.startswith("Generated Files")
@@ -0,0 +1,91 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import asyncio
+
+import pytest
+
+from app.service.task import (
+    ActionDecomposeTextData,
+    TaskLock,
+    create_task_lock,
+    task_locks,
+)
+from app.utils.listen.toolkit_listen import listen_toolkit
+from app.utils.toolkit.abstract_toolkit import AbstractToolkit
+
+# Queue round trips or tool calls per benchmark round
+CALLS = 200
+
+
+class BenchToolkit(AbstractToolkit):
+    def __init__(self, api_task_id: str):
+        self.api_task_id = api_task_id
+        self.agent_name = "developer_agent"
+
+    async def raw_echo(self, text: str) -> str:
+        return text
+
+    @listen_toolkit()
+    async def echo(self, text: str) -> str:
+        return text
+
+
+@pytest.fixture
+def toolkit():
+    lock = create_task_lock("bench_toolkit")
+    yield BenchToolkit(lock.id)
+    task_locks.pop(lock.id, None)
+
+
+@pytest.mark.benchmark(group="task_lock_queue")
+def test_put_get_queue(benchmark, loop):
+    lock = TaskLock(id="bench", queue=asyncio.Queue(), human_input={})
+    item = ActionDecomposeTextData(data={"content": "token"})
+
+    async def round_trips() -> int:
+        for _ in range(CALLS):
+            await lock.put_queue(item)
+            await lock.get_queue()
+        return lock.queue.qsize()
+
+    assert benchmark(lambda: loop.run_until_complete(round_trips())) == 0
+
+
+async def _calls(method, queue: asyncio.Queue) -> int:
+    for n in range(CALLS):
+        await method(f"call {n}")
+    events = queue.qsize()
+    while not queue.empty():
+        queue.get_nowait()
+    return events
+
+
+@pytest.mark.benchmark(group="listen_toolkit")
+def test_unwrapped_tool_call(benchmark, loop, toolkit):
+    queue = task_locks[toolkit.api_task_id].queue
+    events = benchmark(
+        lambda: loop.run_until_complete(_calls(toolkit.raw_echo, queue))
+    )
+    assert events == 0
+
+
+@pytest.mark.benchmark(group="listen_toolkit")
+def test_listen_toolkit_call(benchmark, loop, toolkit):
+    queue = task_locks[toolkit.api_task_id].queue
+    events = benchmark(
+        lambda: loop.run_until_complete(_calls(toolkit.echo, queue))
+    )
+    # One activate and one deactivate event per call
+    assert events == 2 * CALLS
@@ -0,0 +1,309 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+"""
+OpenAI-compatible stub LLM server for running benchmarks offline.
+
+In record mode it forwards requests to a real provider and appends each
+exchange to a JSONL fixture file. In replay mode it serves those fixtures
+with configurable latency and streaming rate, so runs measure backend
+and workforce overhead rather than provider latency.
+
+Usage, from the ``backend/`` directory:
+
+    python3 -m benchmark.stub_llm --mode record \\
+        --fixtures benchmark/fixtures/0.jsonl \\
+        --upstream https://api.openai.com/v1
+    python3 -m benchmark.stub_llm --fixtures benchmark/fixtures/0.jsonl
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import re
+import threading
+import time
+import uuid
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Literal
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel
+
+# Values that change between otherwise identical runs, masked before
+# requests are matched to recordings
+_VOLATILE_PATTERNS = [
+    re.compile(
+        r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.I
+    ),
+    re.compile(r"\d{4}-\d{2}-\d{2}([T ]\d{2}:\d{2}(:\d{2}(\.\d+)?)?)?"),
+    re.compile(r"\d{6,}"),
+]
+
+
+class StubConfig(BaseModel):
+    mode: Literal["record", "replay"] = "replay"
+    fixtures: Path
+    # Base URL of the real provider, used in record mode
+    upstream: str = "https://api.openai.com/v1"
+    # Delay before the first byte of every response
+    latency_ms: float = 0
+    # Streamed chunks per second, 0 sends all chunks at once
+    chunks_per_second: float = 0
+    # Characters of content per streamed chunk
+    chunk_chars: int = 16
+
+
+def request_key(body: dict) -> str:
+    """Hash the parts of a request that decide the response.
+
+    The model name is left out so recordings replay under any model, and
+    volatile values such as dates and ids are masked.
+    """
+    relevant = {
+        "messages": body.get("messages", []),
+        "tools": [
+            tool.get("function", {}).get("name")
+            for tool in body.get("tools") or []
+        ],
+        "response_format": body.get("response_format"),
+    }
+    text = json.dumps(relevant, sort_keys=True, ensure_ascii=False)
+    for pattern in _VOLATILE_PATTERNS:
+        text = pattern.sub("#", text)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class FixtureStore:
+    """Recorded exchanges, matched by request key.
+
+    Repeated requests get their recordings in order, then the last one
+    again. Requests with no recording get the oldest recording not served
+    yet, so runs whose prompts drifted still replay in recorded order.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._by_key: dict[str, deque[dict]] = defaultdict(deque)
+        self._last: dict[str, dict] = {}
+        self._unserved: dict[int, dict] = {}
+        self._lock = threading.Lock()
+        if path.exists():
+            with path.open(encoding="utf-8") as f:
+                for index, line in enumerate(f):
+                    if not line.strip():
+                        continue
+                    exchange = json.loads(line)
+                    exchange["_index"] = index
+                    self._by_key[exchange["key"]].append(exchange)
+                    self._unserved[index] = exchange
+
+    def __len__(self) -> int:
+        return sum(len(queue) for queue in self._by_key.values())
+
+    def match(self, key: str) -> dict | None:
+        with self._lock:
+            queue = self._by_key.get(key)
+            if queue:
+                exchange = queue.popleft()
+                self._last[key] = exchange
+            elif key in self._last:
+                return self._last[key]["response"]
+            elif self._unserved:
+                exchange = self._unserved[min(self._unserved)]
+                self._by_key[exchange["key"]].remove(exchange)
+            else:
+                return None
+            self._unserved.pop(exchange["_index"], None)
+            return exchange["response"]
+
+    def record(self, key: str, body: dict, response: dict) -> None:
+        exchange = {"key": key, "request": body, "response": response}
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(json.dumps(exchange, ensure_ascii=False) + "\n")
+
+
+def _chunk(response: dict, delta: dict, finish_reason: str | None) -> str:
+    chunk = {
+        "id": response.get("id", "chatcmpl-stub"),
+        "object": "chat.completion.chunk",
+        "created": response.get("created", int(time.time())),
+        "model": response.get("model", "stub"),
+        "choices": [
+            {"index": 0, "delta": delta, "finish_reason": finish_reason}
+        ],
+    }
+    return f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+
+
+def stream_chunks(
+    response: dict, chunk_chars: int, include_usage: bool = False
+) -> list[str]:
+    """Split a chat completion into SSE chat.completion.chunk events"""
+    choice = response["choices"][0]
+    message = choice.get("message") or {}
+    content = message.get("content") or ""
+    events = [_chunk(response, {"role": "assistant", "content": ""}, None)]
+    for start in range(0, len(content), chunk_chars):
+        delta = {"content": content[start : start + chunk_chars]}
+        events.append(_chunk(response, delta, None))
+    if message.get("tool_calls"):
+        tool_calls = [
+            {"index": i, **call}
+            for i, call in enumerate(message["tool_calls"])
+        ]
+        events.append(_chunk(response, {"tool_calls": tool_calls}, None))
+    finish_reason = choice.get("finish_reason") or "stop"
+    events.append(_chunk(response, {}, finish_reason))
+    if include_usage and response.get("usage"):
+        usage = {
+            "id": response.get("id", "chatcmpl-stub"),
+            "object": "chat.completion.chunk",
+            "created": response.get("created", int(time.time())),
+            "model": response.get("model", "stub"),
+            "choices": [],
+            "usage": response["usage"],
+        }
+        events.append(f"data: {json.dumps(usage)}\n\n")
+    events.append("data: [DONE]\n\n")
+    return events
+
+
+def create_app(config: StubConfig) -> FastAPI:
+    """Build the stub server for a record or replay configuration"""
+    store = FixtureStore(config.fixtures)
+    upstream = httpx.AsyncClient(base_url=config.upstream, timeout=600)
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        yield
+        await upstream.aclose()
+
+    app = FastAPI(title="Eigent stub LLM", lifespan=lifespan)
+    app.state.store = store
+
+    async def _record(request: Request, body: dict) -> dict | Response:
+        headers = {"Content-Type": "application/json"}
+        if "authorization" in request.headers:
+            headers["Authorization"] = request.headers["authorization"]
+        forwarded = {**body, "stream": False}
+        forwarded.pop("stream_options", None)
+        reply = await upstream.post(
+            "/chat/completions", json=forwarded, headers=headers
+        )
+        if reply.status_code != 200:
+            return Response(
+                reply.content,
+                status_code=reply.status_code,
+                media_type=reply.headers.get("content-type"),
+            )
+        response = reply.json()
+        store.record(request_key(body), body, response)
+        return response
+
+    @app.get("/v1/models")
+    async def models():
+        return {"object": "list", "data": [{"id": "stub", "object": "model"}]}
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        if config.mode == "record":
+            response = await _record(request, body)
+            if isinstance(response, Response):
+                return response
+        else:
+            response = store.match(request_key(body))
+            if response is None:
+                return JSONResponse(
+                    {
+                        "error": {
+                            "message": "No recorded response left",
+                            "type": "stub_fixture_exhausted",
+                        }
+                    },
+                    status_code=404,
+                )
+            response = {
+                **response,
+                "id": f"chatcmpl-{uuid.uuid4().hex}",
+                "created": int(time.time()),
+            }
+
+        if config.latency_ms:
+            await asyncio.sleep(config.latency_ms / 1000)
+        if not body.get("stream"):
+            return response
+
+        events = stream_chunks(
+            response,
+            config.chunk_chars,
+            include_usage=bool(
+                (body.get("stream_options") or {}).get("include_usage")
+            ),
+        )
+
+        async def send():
+            for event in events:
+                yield event
+                if config.chunks_per_second:
+                    await asyncio.sleep(1 / config.chunks_per_second)
+
+        return StreamingResponse(send(), media_type="text/event-stream")
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--mode", choices=["record", "replay"], default="replay"
+    )
+    parser.add_argument("--fixtures", type=Path, required=True)
+    parser.add_argument(
+        "--upstream", default=StubConfig.model_fields["upstream"].default
+    )
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--chunks-per-second", type=float, default=0)
+    parser.add_argument("--chunk-chars", type=int, default=16)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    import uvicorn
+
+    config = StubConfig(
+        mode=args.mode,
+        fixtures=args.fixtures,
+        upstream=args.upstream,
+        latency_ms=args.latency_ms,
+        chunks_per_second=args.chunks_per_second,
+        chunk_chars=args.chunk_chars,
+    )
+    app = create_app(config)
+    print(
+        f"Stub LLM ({config.mode}, {len(app.state.store)} recordings) at "
+        f"http://{args.host}:{args.port}/v1"
+    )
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import math
+import statistics
+
+from pydantic import BaseModel
+
+# Subtask states that end a subtask's timing
+_FINISHED_STATES = {"DONE", "FAILED"}
+
+# Timings summarized with percentiles, as RunTiming field names
+LATENCY_FIELDS = (
+    "first_event_seconds",
+    "to_sub_tasks_seconds",
+    "end_to_end_seconds",
+)
+
+
+class RunTiming(BaseModel):
+    """Timings of one benchmark run, in seconds since the request"""
+
+    benchmark: str
+    first_event_seconds: float | None = None
+    to_sub_tasks_seconds: float | None = None
+    end_to_end_seconds: float | None = None
+    events: int = 0
+    bytes: int = 0
+    subtask_seconds: dict[str, float] = {}
+    error: str | None = None
+    _running: dict[str, float] = {}
+
+    def observe(self, event: dict, size: int, elapsed: float) -> None:
+        """Account for one SSE event received ``elapsed`` seconds in"""
+        self.events += 1
+        self.bytes += size
+        if self.first_event_seconds is None:
+            self.first_event_seconds = elapsed
+        step = event.get("step")
+        data = event.get("data")
+        data = data if isinstance(data, dict) else {}
+        task_id = data.get("task_id")
+        if step == "to_sub_tasks" and self.to_sub_tasks_seconds is None:
+            self.to_sub_tasks_seconds = elapsed
+        elif step == "assign_task" and data.get("state") == "running":
+            self._running.setdefault(task_id, elapsed)
+        elif step == "task_state" and data.get("state") in _FINISHED_STATES:
+            started = self._running.pop(task_id, None)
+            if started is not None:
+                self.subtask_seconds[task_id] = round(elapsed - started, 3)
+        elif step == "end":
+            self.end_to_end_seconds = elapsed
+
+
+def percentile(values: list[float], q: float) -> float | None:
+    """Nearest-rank percentile, ``q`` in [0, 1]"""
+    values = sorted(values)
+    if not values:
+        return None
+    return values[max(0, math.ceil(q * len(values)) - 1)]
+
+
+def _distribution(values: list[float]) -> dict:
+    return {
+        "count": len(values),
+        "mean": round(statistics.fmean(values), 3) if values else None,
+        "p50": percentile(values, 0.5),
+        "p95": percentile(values, 0.95),
+        "p99": percentile(values, 0.99),
+        "max": max(values, default=None),
+    }
+
+
+def summarize(timings: list[RunTiming], wall_seconds: float) -> dict:
+    """Latency percentiles and throughput over concurrent runs.
+
+    Args:
+        timings: One entry per run.
+        wall_seconds: Time from the first request to the last run's end.
+
+    Returns:
+        Per-metric distributions, plus completed runs, events and bytes
+        per second of wall time.
+    """
+    completed = [t for t in timings if t.end_to_end_seconds is not None]
+    summary = {
+        "runs": len(timings),
+        "completed": len(completed),
+        "errors": sum(1 for t in timings if t.error),
+        "wall_seconds": round(wall_seconds, 3),
+        "runs_per_minute": (
+            round(len(completed) / wall_seconds * 60, 3)
+            if wall_seconds
+            else None
+        ),
+        "events_per_second": (
+            round(sum(t.events for t in timings) / wall_seconds, 3)
+            if wall_seconds
+            else None
+        ),
+        "bytes_per_second": (
+            round(sum(t.bytes for t in timings) / wall_seconds, 3)
+            if wall_seconds
+            else None
+        ),
+    }
+    for field in LATENCY_FIELDS:
+        values = [
+            getattr(t, field) for t in timings if getattr(t, field) is not None
+        ]
+        summary[field] = _distribution(values)
+    summary["subtask_seconds"] = _distribution(
+        [s for t in timings for s in t.subtask_seconds.values()]
+    )
+    summary["events_per_run"] = _distribution([t.events for t in timings])
+    summary["bytes_per_run"] = _distribution([t.bytes for t in timings])
+    return summary
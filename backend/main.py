@@ -26,11 +26,10 @@ if str(_project_root) not in sys.path:
 
 import logging
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+from app.utils.structured_logging import setup_logging
+
+# Setup logging, written from a background thread
+setup_logging()
 
 # Disable verbose CAMEL logs
 logging.getLogger("camel").setLevel(logging.WARNING)
@@ -110,6 +109,11 @@ async def startup_event():
     initialize_tracer_provider()
     app_logger.info("Telemetry tracer provider initialized")
 
+    from app.utils.loop_watchdog import start_loop_watchdog
+
+    if start_loop_watchdog():
+        app_logger.info("Event loop watchdog started")
+
 
 # Graceful shutdown handler
 shutdown_event = asyncio.Event()
@@ -54,6 +54,27 @@ class TestAgentFactoryFunctions:
             assert result is mock_agent
             mock_listen_agent.assert_called_once()
 
+    def test_agent_model_uses_role_override(self, sample_chat_data):
+        """Test utility roles get the fast model when requested."""
+        options = Chat(**sample_chat_data, fast_utility_models=True)
+        mock_task_lock = MagicMock()
+
+        _m = sys.modules["app.agent.agent_model"]
+        with (
+            patch.object(_m, "ListenChatAgent"),
+            patch.object(_m, "ModelFactory") as mock_model_factory,
+            patch.object(_m, "get_task_lock", return_value=mock_task_lock),
+            patch.object(_m, "_schedule_async_task"),
+        ):
+            agent_model("coordinator_agent", "prompt", options, [])
+            agent_model("developer_agent", "prompt", options, [])
+
+        model_types = [
+            call.kwargs["model_type"]
+            for call in mock_model_factory.create.call_args_list
+        ]
+        assert model_types == ["gpt-4.1-mini", "gpt-4"]
+
     def test_agent_model_with_missing_options(self):
         """Test agent_model with missing required options."""
         agent_name = "ErrorAgent"
@@ -0,0 +1,122 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from camel.models import BaseModelBackend
+
+from app.agent.hedged_model import (
+    HedgeBudget,
+    HedgeConfig,
+    HedgedModelBackend,
+    LatencyTracker,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class FakeModel(BaseModelBackend):
+    """Backend answering after a fixed delay"""
+
+    def __init__(self, model_type: str, delay: float, answer: str):
+        super().__init__(model_type)
+        self.delay = delay
+        self.answer = answer
+        self.cancelled = False
+
+    @property
+    def token_counter(self):
+        return MagicMock()
+
+    def _run(self, messages, response_format=None, tools=None):
+        return self.answer
+
+    async def _arun(self, messages, response_format=None, tools=None):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return self.answer
+
+
+def _tracker(model: str, latency: float) -> LatencyTracker:
+    tracker = LatencyTracker()
+    for _ in range(20):
+        tracker.record(model, latency)
+    return tracker
+
+
+def test_latency_tracker_percentile_needs_enough_samples():
+    """Test percentiles are only reported once enough calls completed."""
+    tracker = LatencyTracker(window=100)
+    for seconds in range(1, 21):
+        tracker.record("gpt-4o", float(seconds))
+
+    assert tracker.percentile("gpt-4o", 0.95, min_samples=20) == 19.0
+    assert tracker.percentile("gpt-4o", 0.95, min_samples=21) is None
+    assert tracker.percentile("other", 0.95) is None
+
+
+def test_hedge_budget_caps_share_of_hedged_calls():
+    """Test the budget allows at most its ratio of hedged calls."""
+    budget = HedgeBudget(ratio=0.2)
+    for _ in range(9):
+        budget.record_call()
+    assert budget.try_spend()
+    assert not budget.try_spend()
+
+    budget.record_call()
+    assert budget.try_spend()
+
+
+@pytest.mark.asyncio
+async def test_slow_call_is_hedged_on_fallback_and_loser_cancelled():
+    """Test a straggling call is raced against the fallback model."""
+    primary = FakeModel("gpt-4o", delay=10, answer="slow")
+    fallback = FakeModel("gpt-4o-mini", delay=0, answer="fast")
+    budget = HedgeBudget(ratio=1.0)
+    model = HedgedModelBackend(
+        primary,
+        fallback,
+        config=HedgeConfig(min_delay_seconds=0.01),
+        tracker=_tracker("gpt-4o", 0.01),
+        budget=budget,
+    )
+
+    result = await asyncio.wait_for(model.arun([]), timeout=1)
+    await asyncio.sleep(0)
+
+    assert result == "fast"
+    assert primary.cancelled
+    assert budget.hedges == 1
+
+
+@pytest.mark.asyncio
+async def test_call_is_not_hedged_without_budget():
+    """Test an exhausted budget leaves slow calls alone."""
+    primary = FakeModel("gpt-4o", delay=0.05, answer="slow")
+    fallback = FakeModel("gpt-4o-mini", delay=0, answer="fast")
+    model = HedgedModelBackend(
+        primary,
+        fallback,
+        config=HedgeConfig(min_delay_seconds=0.01),
+        tracker=_tracker("gpt-4o", 0.01),
+        budget=HedgeBudget(ratio=0.0),
+    )
+
+    assert await model.arun([]) == "slow"
+    assert not primary.cancelled
@@ -19,6 +19,7 @@ import pytest
 from camel.agents import ChatAgent
 from camel.agents._types import ToolCallRequest
 from camel.messages import BaseMessage
+from camel.models.stub_model import StubModel
 from camel.responses import ChatAgentResponse
 from camel.toolkits import FunctionTool
 from camel.types.agents import ToolCallingRecord
@@ -366,6 +367,94 @@ class TestListenChatAgent:
                 assert result is cloned_agent
                 mock_clone_constructor.assert_called_once()
 
+    def test_listen_chat_agent_clone_shares_stateless_tools(self):
+        """Test clone reuses FunctionTools and clones session toolkits."""
+
+        class _SessionToolkit:
+            def __init__(self, session_id: str = "root"):
+                self.session_id = session_id
+
+            def clone_for_new_session(self, new_session_id: str):
+                return _SessionToolkit(new_session_id)
+
+            def browse(self, url: str) -> str:
+                """Browse a page.
+
+                Args:
+                    url (str): Page to open.
+                """
+                return f"{self.session_id}:{url}"
+
+        class _StatelessToolkit:
+            def browse(self, url: str) -> str:
+                """Browse a page.
+
+                Args:
+                    url (str): Page to open.
+                """
+                return url
+
+        def add(a: int, b: int) -> int:
+            """Add two numbers.
+
+            Args:
+                a (int): First number.
+                b (int): Second number.
+            """
+            return a + b
+
+        session_tool = FunctionTool(_SessionToolkit().browse)
+        stateless_tool = FunctionTool(_StatelessToolkit().browse)
+        plain_tool = FunctionTool(add)
+        # Give the stateless toolkit a distinct tool name
+        stateless_tool.openai_tool_schema["function"]["name"] = "browse2"
+
+        agent = ListenChatAgent(
+            api_task_id="test_api_task_123",
+            agent_name="TestAgent",
+            model=StubModel("stub"),
+            tools=[session_tool, stateless_tool, plain_tool],
+        )
+        with patch.object(
+            FunctionTool, "validate_openai_tool_schema"
+        ) as mock_validate:
+            clone = agent.clone()
+
+        mock_validate.assert_not_called()
+        assert clone._internal_tools["add"] is plain_tool
+        assert clone._internal_tools["browse2"] is stateless_tool
+        cloned_session_tool = clone._internal_tools["browse"]
+        assert cloned_session_tool is not session_tool
+        assert cloned_session_tool.func.__self__.session_id != "root"
+        assert (
+            cloned_session_tool.openai_tool_schema
+            is session_tool.openai_tool_schema
+        )
+
+    def test_listen_chat_agent_clone_copies_memory_lazily(self):
+        """Test clone(with_memory=True) defers copying until first use."""
+        agent = ListenChatAgent(
+            api_task_id="test_api_task_123",
+            agent_name="TestAgent",
+            model=StubModel("stub"),
+            system_message="You are a helpful assistant",
+        )
+        agent.update_memory(
+            BaseMessage.make_user_message("User", "hello"), "user"
+        )
+
+        clone = agent.clone(with_memory=True)
+
+        assert len(clone._pending_memory_records) == 2
+        assert clone._memory.retrieve() == []
+        assert len(clone.memory.retrieve()) == 2
+        assert "_pending_memory_records" not in clone.__dict__
+        # Writes to the clone never reach the source agent
+        clone.update_memory(
+            BaseMessage.make_user_message("User", "again"), "user"
+        )
+        assert len(agent.memory.retrieve()) == 2
+
     def test_listen_chat_agent_with_tools(self, mock_task_lock):
         """Test ListenChatAgent with tools."""
         api_task_id = "test_api_task_123"
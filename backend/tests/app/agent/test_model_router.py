@@ -0,0 +1,141 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from camel.models import ModelFactory
+from camel.types import ModelPlatformType
+
+from app.agent.model_router import ModelRoute, RoutedModelBackend
+
+pytestmark = pytest.mark.unit
+
+
+def _stub_server(status: int, answer: str) -> ThreadingHTTPServer:
+    """Start an OpenAI-compatible server answering every chat completion
+    with a fixed status and message"""
+
+    class Handler(BaseHTTPRequestHandler):
+        calls = 0
+
+        def do_POST(self):
+            Handler.calls += 1
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            if status == 200:
+                body = {
+                    "id": "chatcmpl-stub",
+                    "object": "chat.completion",
+                    "created": 0,
+                    "model": "stub-model",
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {
+                                "role": "assistant",
+                                "content": answer,
+                            },
+                            "finish_reason": "stop",
+                        }
+                    ],
+                    "usage": {
+                        "prompt_tokens": 1,
+                        "completion_tokens": 1,
+                        "total_tokens": 2,
+                    },
+                }
+            else:
+                body = {"error": {"message": answer, "type": "server_error"}}
+            payload = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.handler = Handler
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@pytest.fixture
+def stub_servers() -> Iterator[
+    tuple[ThreadingHTTPServer, ThreadingHTTPServer]
+]:
+    down = _stub_server(503, "overloaded")
+    up = _stub_server(200, "hello from backup")
+    yield down, up
+    for server in (down, up):
+        server.shutdown()
+        server.server_close()
+
+
+def _route(server: ThreadingHTTPServer) -> ModelRoute:
+    host, port = server.server_address
+    return ModelRoute(
+        ModelFactory.create(
+            model_platform=ModelPlatformType.OPENAI_COMPATIBLE_MODEL,
+            model_type="stub-model",
+            api_key="stub",
+            url=f"http://{host}:{port}/v1",
+            max_retries=0,
+        )
+    )
+
+
+@pytest.mark.asyncio
+# The first request of a new OpenAI client loads its SSL context and lazy
+# imports on the loop
+@pytest.mark.allow_loop_blocking
+async def test_router_fails_over_and_avoids_failed_route(stub_servers):
+    """Test a failing provider is skipped until its cooldown ends."""
+    down, up = stub_servers
+    down_route, up_route = _route(down), _route(up)
+    router = RoutedModelBackend([down_route, up_route])
+    messages = [{"role": "user", "content": "hi"}]
+
+    first = await router.arun(messages)
+    second = await router.arun(messages)
+
+    assert first.choices[0].message.content == "hello from backup"
+    assert second.choices[0].message.content == "hello from backup"
+    assert down.handler.calls == 1
+    assert up.handler.calls == 2
+    assert down_route.stats.cooling_down
+    assert router.ranked_routes() == [up_route, down_route]
+
+
+def test_router_prefers_faster_route(stub_servers):
+    """Test calls go to the route with the lowest weighted latency."""
+    _, up = stub_servers
+    slow, fast = _route(up), _route(up)
+    slow.stats.record_success(2.0)
+    fast.stats.record_success(0.5)
+    router = RoutedModelBackend([slow, fast])
+
+    assert router.ranked_routes() == [fast, slow]
+
+    fast.stats.record_failure(cooldown_seconds=0)
+    fast.weight = 0.1
+    assert router.ranked_routes() == [slow, fast]
+
+    result = router.run([{"role": "user", "content": "hi"}])
+    assert result.choices[0].message.content == "hello from backup"
@@ -23,6 +23,7 @@ from app.utils.listen.toolkit_listen import (
     _truncate,
     listen_toolkit,
 )
+from app.utils.tool_stats import ToolStatsTracker
 
 
 @pytest.mark.unit
@@ -235,6 +236,40 @@ def test_listen_toolkit_sync_raises_exception():
             test_method(mock_toolkit)
 
 
+@pytest.mark.unit
+def test_listen_toolkit_records_tool_stats():
+    """Calls are recorded per toolkit, method and agent, errors included."""
+    mock_toolkit = _create_mock_toolkit()
+    mock_task_lock = MagicMock()
+    mock_task_lock.put_queue = AsyncMock()
+    mock_task_lock.tool_stats = ToolStatsTracker()
+
+    with patch(
+        "app.utils.listen.toolkit_listen.get_task_lock",
+        return_value=mock_task_lock,
+    ):
+
+        @listen_toolkit()
+        def read(self, path, fail=False):
+            if fail:
+                raise ValueError("missing")
+            return "x" * 100
+
+        read(mock_toolkit, "a.txt")
+        with pytest.raises(ValueError):
+            read(mock_toolkit, "b.txt", fail=True)
+
+    [stats] = mock_task_lock.tool_stats.report()
+    assert stats["toolkit"] == "TestToolkit"
+    assert stats["method"] == "read"
+    assert stats["agent"] == "test_agent"
+    assert stats["calls"] == 2
+    assert stats["errors"] == 1
+    assert stats["bytes_in"] == len("a.txt") + len("b.txt") + len("true")
+    assert stats["bytes_out"] == 100 + len("missing")
+    assert stats["p50_seconds"] is not None
+
+
 @pytest.mark.unit
 def test_listen_toolkit_sync_without_api_task_id():
     """Sync function should be called directly if api_task_id is missing."""
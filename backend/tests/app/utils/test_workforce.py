@@ -12,6 +12,8 @@
 # limitations under the License.
 # ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
 
+import asyncio
+import threading
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -422,6 +424,45 @@ async def test_handle_failed_task(mock_task_lock):
         mock_super_handle.assert_called_once_with(task)
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_handle_failed_task_reports_indexed_error(mock_task_lock):
+    """Test the failure report uses the task's latest logged error."""
+    from camel.societies.workforce.events import TaskFailedEvent
+
+    from app.utils.telemetry.workforce_log import IndexedWorkforceLogger
+
+    workforce = Workforce(
+        api_task_id="test_api_task_123", description="Test workforce"
+    )
+    task_log = workforce._callbacks[0]
+    assert isinstance(task_log, IndexedWorkforceLogger)
+    for error in ("first error", "last error"):
+        task_log.log_task_failed(
+            TaskFailedEvent(task_id="failed_123", error_message=error)
+        )
+
+    task = Task(content="Failed task", id="failed_123")
+    task.state = TaskState.FAILED
+    task.failure_count = 3
+
+    with (
+        patch(
+            "app.utils.workforce.get_task_lock",
+            return_value=mock_task_lock,
+        ),
+        patch.object(
+            workforce.__class__.__bases__[0],
+            "_handle_failed_task",
+            return_value=True,
+        ),
+    ):
+        await workforce._handle_failed_task(task)
+
+    call_args = mock_task_lock.put_queue.call_args[0][0]
+    assert call_args.data["result"] == "last error"
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_stop_sends_end_notification(mock_task_lock):
@@ -760,6 +801,213 @@ def test_analyze_task_returns_valid_result_on_first_attempt():
         assert mock_super.call_count == 1
 
 
+@pytest.mark.unit
+def test_analyze_task_quality_precheck_skips_llm():
+    """Test a clean result is accepted without LLM quality analysis."""
+    workforce = Workforce(api_task_id="test_123", description="Test workforce")
+    task = Task(content="Summarise the findings", id="task_1")
+    task.result = "The findings show three consistent trends in the data."
+    task.additional_info = {"worker_attempts": [{"tool_errors": 0}]}
+
+    with patch.object(
+        workforce.__class__.__bases__[0], "_analyze_task"
+    ) as mock_super:
+        result = workforce._analyze_task(task, for_failure=False)
+
+    print(
+        "DBG",
+        [(c.node_id, c.description) for c in workforce._children],
+        workforce._get_valid_worker_ids(),
+    )
+    mock_super.assert_not_called()
+    assert result.quality_sufficient
+    assert workforce.quality_check_stats == {"skipped": 1, "analysed": 0}
+
+
+@pytest.mark.unit
+def test_analyze_task_quality_precheck_defers_ambiguous_results():
+    """Test tool errors or a failing custom check fall back to the LLM."""
+    workforce = Workforce(api_task_id="test_123", description="Test workforce")
+    task = Task(content="Summarise the findings", id="task_1")
+    task.result = "The findings show three consistent trends in the data."
+    task.additional_info = {"worker_attempts": [{"tool_errors": 1}]}
+    expected = TaskAnalysisResult(reasoning="checked", quality_score=75)
+
+    with patch.object(
+        workforce.__class__.__bases__[0],
+        "_analyze_task",
+        return_value=expected,
+    ) as mock_super:
+        assert workforce._analyze_task(task, for_failure=False) is expected
+        task.additional_info = {"worker_attempts": [{"tool_errors": 0}]}
+        workforce.add_quality_precheck(lambda task, config: False)
+        assert workforce._analyze_task(task, for_failure=False) is expected
+
+    assert mock_super.call_count == 2
+    assert workforce.quality_check_stats == {"skipped": 0, "analysed": 2}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_find_assignee_rule_based_fast_path(mock_task_lock):
+    """Test obvious assignments with known dependencies skip the
+    coordinator, while the rest of the batch still goes to it."""
+    workforce = Workforce(api_task_id="test_123", description="Test workforce")
+    mock_worker = MagicMock(spec=ListenChatAgent)
+    mock_worker.agent_id = "test_worker_123"
+    mock_worker.agent_name = "test_worker"
+    with (
+        patch.object(workforce, "_validate_agent_compatibility"),
+        patch.object(workforce, "_attach_pause_event_to_agent"),
+        patch.object(workforce, "_start_child_node_when_paused"),
+    ):
+        workforce.add_single_agent_worker(
+            "Developer Agent: Writes and runs code.", mock_worker
+        )
+        workforce.add_single_agent_worker(
+            "Browser Agent: Searches the web.", mock_worker
+        )
+    browser_id = workforce._children[1].node_id
+
+    search = Task(
+        content="Search the web for recent news about solar panels",
+        id="sub_1",
+        additional_info={"dependencies": []},
+    )
+    summary = Task(content="Summarise what was found", id="sub_2")
+    coordinator_result = TaskAssignResult(
+        assignments=[
+            TaskAssignment(
+                task_id="sub_2", assignee_id=browser_id, dependencies=["sub_1"]
+            )
+        ]
+    )
+
+    with (
+        patch(
+            "app.utils.workforce.get_task_lock",
+            return_value=mock_task_lock,
+        ),
+        patch.object(
+            workforce.__class__.__bases__[0],
+            "_find_assignee",
+            return_value=coordinator_result,
+        ) as mock_super,
+    ):
+        result = await workforce._find_assignee([search, summary])
+        mock_super.assert_called_once_with([summary])
+
+        # A lone subtask needs no dependency analysis
+        workforce._pending_tasks.clear()
+        alone = Task(content="Browse the website for prices", id="sub_3")
+        alone_result = await workforce._find_assignee([alone])
+        assert mock_super.call_count == 1
+
+    assert [(a.task_id, a.assignee_id) for a in result.assignments] == [
+        ("sub_1", browser_id),
+        ("sub_2", browser_id),
+    ]
+    assert alone_result.assignments[0].assignee_id == browser_id
+    assert workforce.assignment_stats == {"rule": 2, "coordinator": 1}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_annotated_plan_skips_coordinator(mock_task_lock):
+    """Test a decomposed plan annotated with workers and dependencies is
+    assigned without the coordinator."""
+    workforce = Workforce(api_task_id="test_123", description="Test workforce")
+    workforce.task_agent = MagicMock()
+    workers = {}
+    for name in ("browser_agent", "document_agent"):
+        workers[name] = MagicMock(spec=ListenChatAgent)
+        workers[name].agent_id = f"{name}_id"
+        workers[name].agent_name = name
+    with (
+        patch.object(workforce, "_validate_agent_compatibility"),
+        patch.object(workforce, "_attach_pause_event_to_agent"),
+        patch.object(workforce, "_start_child_node_when_paused"),
+    ):
+        workforce.add_single_agent_worker(
+            "Browser Agent: Searches the web.", workers["browser_agent"]
+        )
+        workforce.add_single_agent_worker(
+            "Document Agent: Creates and modifies files.",
+            workers["document_agent"],
+        )
+    browser_id = workforce._children[0].node_id
+    document_id = workforce._children[1].node_id
+
+    main = Task(content="Compare solar and wind power", id="main")
+    plan = [
+        Task(
+            content="Find solar power prices [worker: browser; after: none]",
+            id="main.1",
+        ),
+        Task(
+            content="Find wind power prices [worker: browser; after: none]",
+            id="main.2",
+        ),
+        Task(
+            content="Write the comparison to compare.md\n"
+            "[worker: document; after: 1, 2, 7]",
+            id="main.3",
+        ),
+    ]
+    with patch.object(Task, "decompose", return_value=plan) as decompose:
+        subtasks = workforce._decompose_task(main)
+    assert "[worker:" in decompose.call_args.args[1]
+    assert subtasks[2].content == "Write the comparison to compare.md"
+    workforce._pending_tasks.extend(subtasks)
+
+    with (
+        patch(
+            "app.utils.workforce.get_task_lock",
+            return_value=mock_task_lock,
+        ),
+        patch.object(
+            workforce.__class__.__bases__[0], "_find_assignee"
+        ) as mock_super,
+    ):
+        result = await workforce._find_assignee(subtasks)
+
+    mock_super.assert_not_called()
+    assert [
+        (a.task_id, a.assignee_id, a.dependencies) for a in result.assignments
+    ] == [
+        ("main.1", browser_id, []),
+        ("main.2", browser_id, []),
+        ("main.3", document_id, ["main.1", "main.2"]),
+    ]
+    assert subtasks[2].dependencies == subtasks[:2]
+    assert workforce.assignment_stats == {"rule": 3, "coordinator": 0}
+
+
+@pytest.mark.unit
+def test_decompose_stream_hides_annotations():
+    """Test the streamed decomposition text leaves out the annotations."""
+    workforce = Workforce(api_task_id="test_123", description="Test workforce")
+    workforce.task_agent = MagicMock()
+    text = (
+        "<task>Find solar power prices\n[worker: browser; after: none]</task>"
+    )
+
+    def decompose(agent, prompt, stream_callback=None):
+        for end in range(1, len(text) + 1):
+            stream_callback(MagicMock(msg=MagicMock(content=text[:end])))
+        return []
+
+    streamed = []
+    with patch.object(Task, "decompose", side_effect=decompose):
+        workforce._decompose_task(
+            Task(content="Compare power prices", id="main"),
+            stream_callback=streamed.append,
+        )
+
+    assert streamed[-1] == "<task>Find solar power prices\n</task>"
+    assert not any("worker" in chunk for chunk in streamed)
+
+
 @pytest.mark.unit
 @pytest.mark.parametrize(
     "side_effect, expected_calls",
@@ -827,3 +1075,460 @@ def test_analyze_task_failure_raises_after_exhausted_retries():
             )
 
         assert mock_super.call_count == _ANALYZE_TASK_MAX_RETRIES
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_pipeline_submit_starts_loop_once(mock_task_lock):
+    """Test pipelined subtasks start the loop on the first batch only."""
+    workforce = Workforce(api_task_id="test_123", description="Test workforce")
+
+    with (
+        patch(
+            "app.utils.workforce.get_task_lock", return_value=mock_task_lock
+        ),
+        patch.object(workforce, "start", new_callable=AsyncMock) as mock_start,
+        patch.object(workforce, "save_snapshot"),
+    ):
+        await workforce.eigent_pipeline_submit([Task(content="A", id="a")])
+        await workforce.eigent_pipeline_submit(
+            [Task(content="A", id="a"), Task(content="B", id="b")]
+        )
+        assert workforce._pipeline_hold is True
+        assert workforce._in_flight_tasks == 1
+        assert workforce._pipeline_wakeup.is_set()
+        await workforce._pipeline_runner
+
+    assert [t.id for t in workforce._pending_tasks] == ["a", "b"]
+    # The hold is released once the execution loop ends
+    assert workforce._pipeline_hold is False
+    assert workforce._in_flight_tasks == 0
+    mock_start.assert_called_once()
+    mock_task_lock.add_background_task.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_eigent_start_reconciles_pipelined_plan(mock_task_lock):
+    """Test eigent_start applies the confirmed plan to a pipelined run."""
+    workforce = Workforce(api_task_id="test_123", description="Test workforce")
+    running = Task(content="Running", id="running")
+    kept = Task(content="Kept", id="kept")
+    dropped = Task(content="Dropped", id="dropped")
+    added = Task(content="Added", id="added")
+    workforce._pipeline_task_ids.update({"running", "kept", "dropped"})
+    workforce._pending_tasks.extend([kept, dropped])
+    workforce._task_dependencies["kept"] = ["running", "dropped"]
+    workforce._task_dependencies["dropped"] = []
+    workforce._pipeline_hold = True
+    workforce._in_flight_tasks = 2
+    workforce._pipeline_runner = asyncio.get_running_loop().create_future()
+
+    with patch.object(
+        workforce, "start", new_callable=AsyncMock
+    ) as mock_start:
+        await workforce.eigent_start([running, kept, added])
+
+    assert [t.id for t in workforce._pending_tasks] == ["kept", "added"]
+    assert workforce._task_dependencies["kept"] == ["running"]
+    assert "dropped" not in workforce._task_dependencies
+    assert workforce._pipeline_hold is False
+    assert workforce._in_flight_tasks == 1
+    mock_start.assert_not_called()
+    workforce._pipeline_runner.cancel()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_wait_returned_task_wakes_for_pipelined_subtasks():
+    """Test a pipeline wakeup interrupts waiting for returned tasks."""
+    workforce = Workforce(api_task_id="test_123", description="Test workforce")
+    workforce._channel = MagicMock()
+    never = asyncio.get_running_loop().create_future()
+    workforce._channel.get_returned_task_by_publisher = MagicMock(
+        return_value=never
+    )
+    workforce._pipeline_hold = True
+    workforce._pipeline_wakeup.set()
+
+    result = await workforce._wait_returned_task()
+
+    assert result is None
+    assert never.cancelled()
+    assert not workforce._pipeline_wakeup.is_set()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_pipeline_hold_released_on_timeout(mock_task_lock):
+    """Test an unconfirmed plan stops holding the loop open."""
+    workforce = Workforce(api_task_id="test_123", description="Test workforce")
+
+    with (
+        patch(
+            "app.utils.workforce.get_task_lock", return_value=mock_task_lock
+        ),
+        patch("app.utils.workforce._PIPELINE_HOLD_TIMEOUT_SECONDS", 0.01),
+        patch.object(workforce, "start", new_callable=AsyncMock),
+        patch.object(workforce, "save_snapshot"),
+    ):
+        await workforce.eigent_pipeline_submit([Task(content="A", id="a")])
+        assert workforce._pipeline_hold is True
+        await asyncio.sleep(0.05)
+
+    assert workforce._pipeline_hold is False
+    assert workforce._in_flight_tasks == 0
+    assert workforce._pipeline_hold_timer is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stop_gracefully_releases_pipeline_hold(mock_task_lock):
+    """Test stopping a pipelined run releases the confirmation hold."""
+    workforce = Workforce(api_task_id="test_123", description="Test workforce")
+
+    with (
+        patch(
+            "app.utils.workforce.get_task_lock", return_value=mock_task_lock
+        ),
+        patch.object(workforce, "start", new_callable=AsyncMock),
+        patch.object(workforce, "save_snapshot"),
+    ):
+        await workforce.eigent_pipeline_submit([Task(content="A", id="a")])
+        await workforce._pipeline_runner
+        workforce.stop_gracefully()
+
+    assert workforce._pipeline_hold is False
+    assert workforce._in_flight_tasks == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_streamed_dependencies_update_on_owner_loop():
+    """Test dependency updates from the decomposition thread run on the
+    loop that owns the execution state."""
+    workforce = Workforce(api_task_id="test_123", description="Test workforce")
+    workforce._pipeline_loop = asyncio.get_running_loop()
+    task = Task(content="Main", id="main")
+    subtasks = [Task(content="A", id="main.1"), Task(content="B", id="main.2")]
+    workforce._task_dependencies["main"] = ["earlier"]
+    applied_on = []
+    update = workforce._update_dependencies_for_decomposition
+
+    def record(*args):
+        applied_on.append(threading.current_thread())
+        update(*args)
+
+    with patch.object(
+        workforce, "_update_dependencies_for_decomposition", record
+    ):
+        await asyncio.to_thread(
+            workforce._update_decomposition_dependencies, task, subtasks
+        )
+
+    assert applied_on == [threading.main_thread()]
+    assert workforce._task_dependencies == {"main.2": ["earlier"]}
+
+
+@pytest.mark.unit
+def test_eigent_make_sub_tasks_auto_start_forwards_batches():
+    """Test auto-start forwards stream batches instead of queueing them."""
+    workforce = Workforce(api_task_id="test_123", description="Test workforce")
+    task = Task(content="Complex project task", id="main_task")
+    batches = []
+
+    def mock_streaming_decomposition():
+        yield [Task(content="Phase 1", id="phase_1")]
+        yield [Task(content="Phase 2", id="phase_2")]
+
+    loop = MagicMock()
+    with (
+        patch.object(workforce, "reset"),
+        patch.object(workforce, "set_channel"),
+        patch.object(
+            workforce,
+            "_decompose_task",
+            return_value=mock_streaming_decomposition(),
+        ),
+        patch("app.utils.workforce.validate_task_content", return_value=True),
+        patch(
+            "app.utils.workforce.asyncio.run_coroutine_threadsafe"
+        ) as mock_submit,
+    ):
+        result = workforce.eigent_make_sub_tasks(
+            task,
+            on_stream_batch=lambda tasks, final: batches.append(final),
+            auto_start_loop=loop,
+        )
+
+    assert len(result) == 2
+    assert len(workforce._pending_tasks) == 0
+    assert batches == [False, False, True]
+    assert mock_submit.call_count == 3
+    assert all(c.args[1] is loop for c in mock_submit.call_args_list)
+    for c in mock_submit.call_args_list:
+        c.args[0].close()
+    assert workforce._pipelined is False
+
+
+@pytest.mark.unit
+def test_critical_path_weights_favor_long_chains():
+    """Test a task blocking a long chain outweighs an independent one."""
+    workforce = Workforce(api_task_id="test_123", description="Test workforce")
+    tasks = [Task(content=name, id=name) for name in ("a", "b", "c", "x")]
+    workforce._task_dependencies.update(
+        {"a": [], "b": ["a"], "c": ["b"], "x": []}
+    )
+
+    with patch.object(workforce, "_estimate_task_duration", return_value=10.0):
+        weights = workforce._critical_path_weights(tasks)
+
+    assert weights == {"a": 30.0, "b": 20.0, "c": 10.0, "x": 10.0}
+
+
+@pytest.mark.unit
+def test_estimate_task_duration_uses_metrics_history():
+    """Test duration estimates come from the worker role's history."""
+    from camel.societies.workforce.events import (
+        TaskCompletedEvent,
+        WorkerCreatedEvent,
+    )
+
+    from app.utils.telemetry import workforce_metrics
+    from app.utils.telemetry.workforce_metrics import WorkforceMetricsCallback
+
+    workforce = Workforce(api_task_id="test_123", description="Test workforce")
+    callback = WorkforceMetricsCallback(project_id="p", task_id="t")
+    workforce._callbacks.append(callback)
+    task = Task(content="Subtask", id="sub_1")
+    workforce._assignees["sub_1"] = "worker_1"
+
+    with patch.dict(workforce_metrics._role_durations, clear=True):
+        callback.log_worker_created(
+            WorkerCreatedEvent(
+                worker_id="worker_1",
+                worker_type="SingleAgentWorker",
+                role="Slow Agent",
+            )
+        )
+        default = workforce._estimate_task_duration(task)
+        callback.log_task_completed(
+            TaskCompletedEvent(
+                task_id="old",
+                worker_id="worker_1",
+                processing_time_seconds=120.0,
+            )
+        )
+        estimate = workforce._estimate_task_duration(task)
+
+    assert default == 60.0
+    assert estimate == 120.0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_post_ready_tasks_dispatches_critical_path_first():
+    """Test ready tasks are dispatched by weight within worker limits."""
+    workforce = Workforce(api_task_id="test_123", description="Test workforce")
+    short = Task(content="Short", id="short")
+    head = Task(content="Head", id="head")
+    tail = Task(content="Tail", id="tail")
+    workforce._pending_tasks.extend([short, head, tail])
+    workforce._task_dependencies.update(
+        {"short": [], "head": [], "tail": ["head"]}
+    )
+    workforce._worker_concurrency["worker_1"] = 1
+
+    async def base_post_ready_tasks(self):
+        await self._post_task(short, "worker_1")
+        await self._post_task(head, "worker_1")
+        self._pending_tasks.remove(short)
+        self._pending_tasks.remove(head)
+
+    dispatched = []
+
+    async def dispatch(task, assignee_id):
+        dispatched.append(task.id)
+        workforce._running_tasks[task.id] = assignee_id
+
+    with (
+        patch.object(
+            workforce.__class__.__bases__[0],
+            "_post_ready_tasks",
+            base_post_ready_tasks,
+        ),
+        patch.object(workforce, "_dispatch_task", side_effect=dispatch),
+    ):
+        await workforce._post_ready_tasks()
+
+    assert dispatched == ["head"]
+    assert [t.id for t in workforce._pending_tasks] == ["tail", "short"]
+    assert workforce._dispatch_batch is None
+
+
+@pytest.mark.unit
+def test_add_single_agent_worker_concurrency_limit():
+    """Test max_concurrent_tasks is recorded per worker node."""
+    workforce = Workforce(api_task_id="test_123", description="Test workforce")
+    mock_worker = MagicMock(spec=ListenChatAgent)
+    mock_worker.agent_id = "test_worker_123"
+    mock_worker.agent_name = "test_worker"
+
+    with (
+        patch.object(workforce, "_validate_agent_compatibility"),
+        patch.object(workforce, "_attach_pause_event_to_agent"),
+        patch.object(workforce, "_start_child_node_when_paused"),
+    ):
+        workforce.add_single_agent_worker(
+            "Worker", mock_worker, max_concurrent_tasks=2
+        )
+        with pytest.raises(ValueError):
+            workforce.add_single_agent_worker(
+                "Worker", mock_worker, max_concurrent_tasks=0
+            )
+
+    node_id = workforce._children[0].node_id
+    assert workforce._worker_concurrency == {node_id: 2}
+
+
+@pytest.mark.unit
+def test_add_single_agent_worker_default_concurrency_limit():
+    """Test the workforce-wide limit applies to workers without their own."""
+    workforce = Workforce(
+        api_task_id="test_123",
+        description="Test workforce",
+        max_concurrent_tasks=1,
+    )
+    mock_worker = MagicMock(spec=ListenChatAgent)
+    mock_worker.agent_id = "test_worker_123"
+    mock_worker.agent_name = "test_worker"
+
+    with (
+        patch.object(workforce, "_validate_agent_compatibility"),
+        patch.object(workforce, "_attach_pause_event_to_agent"),
+        patch.object(workforce, "_start_child_node_when_paused"),
+    ):
+        workforce.add_single_agent_worker("Worker", mock_worker)
+        workforce.add_single_agent_worker(
+            "Worker", mock_worker, max_concurrent_tasks=3
+        )
+
+    first, second = (child.node_id for child in workforce._children)
+    assert workforce._worker_concurrency == {first: 1, second: 3}
+
+
+@pytest.mark.unit
+def test_ended_tasks_free_worker_slots():
+    """Test skipped, removed and failed-over tasks free their slot."""
+    workforce = Workforce(api_task_id="test_123", description="Test workforce")
+    workforce._worker_concurrency["worker_1"] = 1
+    workforce._running_tasks.update(
+        {"skipped": "worker_1", "retried": "worker_1"}
+    )
+    workforce._in_flight_tasks = 2
+
+    workforce._decrement_in_flight_tasks("skipped", "skip request")
+    assert workforce._running_tasks == {"retried": "worker_1"}
+    assert not workforce._worker_has_capacity("worker_1")
+
+    workforce._cleanup_task_tracking("retried")
+    assert workforce._running_tasks == {}
+    assert workforce._worker_has_capacity("worker_1")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cancelled_subtask_fails_without_running_dependents(
+    mock_task_lock,
+):
+    """Test a subtask cancelled while running is not retried and the
+    subtasks depending on it never run."""
+    workforce = Workforce(api_task_id="test_123", description="Test workforce")
+    cancelled = Task(content="Search the web", id="main.1")
+    cancelled.state = TaskState.FAILED
+    cancelled.result = "Task cancelled: removed"
+    cancelled.additional_info = {"cancelled": True}
+    dependent = Task(content="Summarise the results", id="main.2")
+    workforce._pending_tasks.append(dependent)
+    workforce._task_dependencies.update({"main.1": [], "main.2": ["main.1"]})
+    workforce._assignees.update({"main.1": "node_1", "main.2": "node_1"})
+    workforce._channel = AsyncMock()
+    workforce._channel.get_task_by_id.return_value = None
+
+    with (
+        patch(
+            "app.utils.workforce.get_task_lock",
+            return_value=mock_task_lock,
+        ),
+        patch.object(workforce, "_post_task") as post_task,
+    ):
+        halt = await workforce._handle_failed_task(cancelled)
+
+    assert halt is False
+    post_task.assert_not_called()
+    assert not workforce._pending_tasks
+    assert dependent.state == TaskState.FAILED
+    assert [t.id for t in workforce._completed_tasks] == ["main.1", "main.2"]
+    sent = mock_task_lock.put_queue.call_args.args[0]
+    assert sent.data["task_id"] == "main.1"
+    assert sent.data["state"] == TaskState.FAILED
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_restore_checkpoint_skips_finished_subtasks():
+    """Test a checkpoint restores results and queues unfinished work."""
+    workforce = Workforce(api_task_id="test_123", description="Test workforce")
+    worker = MagicMock()
+    worker.node_id = "node_old"
+    worker.description = "Developer Agent"
+    workforce._children = [worker]
+
+    main = Task(content="Main task", id="main")
+    done = Task(content="Research", id="main.1")
+    done.state = TaskState.DONE
+    done.result = "notes"
+    pending = Task(content="Write report", id="main.2")
+    main.add_subtask(done)
+    main.add_subtask(pending)
+    workforce._task = main
+    workforce._task_dependencies["main.2"] = ["main.1"]
+    workforce._assignees["main.2"] = "node_old"
+
+    store = MagicMock()
+    workforce._checkpoint_store = store
+    await workforce._save_checkpoint()
+    checkpoint = store.save.call_args[0][2]
+
+    resumed = Workforce(api_task_id="test_123", description="Test workforce")
+    worker.node_id = "node_new"
+    resumed._children = [worker]
+    with patch.object(resumed, "set_channel"):
+        task = resumed.restore_checkpoint(checkpoint)
+
+    assert task.id == "main"
+    assert [t.id for t in resumed._completed_tasks] == ["main.1"]
+    assert resumed._completed_tasks[0].result == "notes"
+    assert [t.id for t in resumed._pending_tasks] == ["main.2"]
+    assert resumed._task_dependencies == {"main.2": ["main.1"]}
+    assert resumed._assignees == {"main.2": "node_new"}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_discard_checkpoint_only_after_finished_run():
+    """Test a finished run drops its checkpoint and a stopped one keeps it."""
+    store = MagicMock()
+    workforce = Workforce(
+        api_task_id="test_123",
+        description="Test workforce",
+        checkpoint_store=store,
+    )
+
+    workforce._state = WorkforceState.STOPPED
+    await workforce.discard_checkpoint()
+    store.delete.assert_not_called()
+
+    workforce._state = WorkforceState.IDLE
+    await workforce.discard_checkpoint()
+    store.delete.assert_called_once_with("test_123")
@@ -20,10 +20,13 @@ from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import pytest_asyncio
 from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from app.utils.loop_watchdog import LoopWatchdog
+
 # Load environment variables
 load_dotenv()
 
@@ -52,11 +55,27 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         action="store_true",
         help="Run only the very slow tests",
     )
+    parser.addoption(
+        "--strict-event-loop",
+        action="store_true",
+        help="Fail async tests whose code blocks the event loop",
+    )
 
 
 def pytest_collection_modifyitems(
     config: pytest.Config, items: list[pytest.Item]
 ) -> None:
+    if config.getoption("--strict-event-loop"):
+        for item in items:
+            fixturenames = getattr(item, "fixturenames", None)
+            if (
+                item.get_closest_marker("asyncio")
+                and not item.get_closest_marker("allow_loop_blocking")
+                and fixturenames is not None
+                and "loop_watchdog" not in fixturenames
+            ):
+                fixturenames.append("loop_watchdog")
+
     if config.getoption("--llm-test-only"):
         skip_fast = pytest.mark.skip(reason="Skipped for llm test only")
         for item in items:
@@ -91,6 +110,18 @@ def pytest_collection_modifyitems(
         return
 
 
+@pytest_asyncio.fixture
+async def loop_watchdog() -> AsyncGenerator[LoopWatchdog, None]:
+    """Fail the test if anything blocks its event loop."""
+    watchdog = LoopWatchdog(threshold=0.1)
+    watchdog.start()
+    yield watchdog
+    # Let a block that is still running be recorded
+    await asyncio.sleep(watchdog.interval * 2)
+    watchdog.stop()
+    watchdog.raise_if_blocked()
+
+
 @pytest.fixture
 def temp_dir() -> Generator[Path, None, None]:
     """Create a temporary directory for test files."""
@@ -201,13 +232,17 @@ def app() -> FastAPI:
     """Create FastAPI test application."""
     from fastapi import FastAPI
 
+    from app.controller.admin_controller import router as admin_router
     from app.controller.chat_controller import router as chat_router
+    from app.controller.metrics_controller import router as metrics_router
     from app.controller.model_controller import router as model_router
     from app.controller.task_controller import router as task_router
     from app.controller.tool_controller import router as tool_router
 
     app = FastAPI()
+    app.include_router(admin_router)
     app.include_router(chat_router)
+    app.include_router(metrics_router)
     app.include_router(model_router)
     app.include_router(task_router)
     app.include_router(tool_router)
@@ -364,3 +399,7 @@ def pytest_configure(config):
         "markers", "integration: mark test as integration test"
     )
     config.addinivalue_line("markers", "unit: mark test as unit test")
+    config.addinivalue_line(
+        "markers",
+        "allow_loop_blocking: exempt test from --strict-event-loop",
+    )
@@ -0,0 +1,126 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from benchmark.stub_llm import (
+    FixtureStore,
+    StubConfig,
+    create_app,
+    request_key,
+)
+
+
+def _request(text: str, **body) -> dict:
+    return {
+        "model": "gpt-4o",
+        "messages": [{"role": "user", "content": text}],
+    } | body
+
+
+def _response(content: str) -> dict:
+    return {
+        "id": "chatcmpl-recorded",
+        "object": "chat.completion",
+        "model": "gpt-4o",
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {
+            "prompt_tokens": 5,
+            "completion_tokens": 3,
+            "total_tokens": 8,
+        },
+    }
+
+
+@pytest.fixture
+def fixtures(tmp_path):
+    path = tmp_path / "fixtures.jsonl"
+    store = FixtureStore(path)
+    for text, content in [
+        ("plan", "step 1"),
+        ("plan", "step 2"),
+        ("write", "done"),
+    ]:
+        store.record(
+            request_key(_request(text)), _request(text), _response(content)
+        )
+    return path
+
+
+@pytest.mark.unit
+def test_request_key_ignores_model_and_volatile_values():
+    """Test keys match across models, dates and ids."""
+    a = _request("Today is 2026-01-02, task 1234567", model="gpt-4o")
+    b = _request("Today is 2026-10-19, task 7654321", model="stub")
+
+    assert request_key(a) == request_key(b)
+    assert request_key(a) != request_key(_request("Something else"))
+
+
+@pytest.mark.unit
+def test_replay_serves_recordings_in_order_with_fallback(fixtures):
+    """Test repeats replay in order and unknown requests get the oldest
+    unserved recording."""
+    store = FixtureStore(fixtures)
+
+    def content(text):
+        response = store.match(request_key(_request(text)))
+        return response and response["choices"][0]["message"]["content"]
+
+    assert len(store) == 3
+    assert content("unknown") == "step 1"
+    assert content("plan") == "step 2"
+    assert content("plan") == "step 2"
+    assert content("write") == "done"
+    assert content("other") is None
+
+
+@pytest.mark.unit
+def test_replay_streams_chunks_with_usage(fixtures):
+    """Test streamed replays split content into OpenAI chunks."""
+    app = create_app(StubConfig(fixtures=fixtures, chunk_chars=2))
+
+    with TestClient(app) as client:
+        response = client.post(
+            "/v1/chat/completions",
+            json=_request(
+                "write", stream=True, stream_options={"include_usage": True}
+            ),
+        )
+        repeat = client.post("/v1/chat/completions", json=_request("write"))
+
+    lines = [
+        line[6:]
+        for line in response.text.splitlines()
+        if line.startswith("data: ")
+    ]
+    assert lines[-1] == "[DONE]"
+    chunks = [json.loads(line) for line in lines[:-1]]
+    text = "".join(
+        chunk["choices"][0]["delta"].get("content", "")
+        for chunk in chunks
+        if chunk["choices"]
+    )
+    assert text == "done"
+    assert chunks[-1]["usage"]["total_tokens"] == 8
+    assert repeat.json()["choices"][0]["message"]["content"] == "done"
@@ -0,0 +1,78 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import pytest
+
+from benchmark.timing import RunTiming, percentile, summarize
+
+
+def _run(name: str, end: float, subtask: float) -> RunTiming:
+    timing = RunTiming(benchmark=name)
+    for elapsed, event in [
+        (0.5, {"step": "confirmed", "data": {}}),
+        (2.0, {"step": "to_sub_tasks", "data": {}}),
+        (
+            3.0,
+            {
+                "step": "assign_task",
+                "data": {"task_id": "1", "state": "waiting"},
+            },
+        ),
+        (
+            4.0,
+            {
+                "step": "assign_task",
+                "data": {"task_id": "1", "state": "running"},
+            },
+        ),
+        (
+            4.0 + subtask,
+            {"step": "task_state", "data": {"task_id": "1", "state": "DONE"}},
+        ),
+        (end, {"step": "end", "data": "done"}),
+    ]:
+        timing.observe(event, 100, elapsed)
+    return timing
+
+
+@pytest.mark.unit
+def test_observe_records_milestones_and_subtasks():
+    """Test SSE events fill in the run's latencies and counts."""
+    timing = _run("0", end=10.0, subtask=2.5)
+
+    assert timing.first_event_seconds == 0.5
+    assert timing.to_sub_tasks_seconds == 2.0
+    assert timing.end_to_end_seconds == 10.0
+    assert timing.subtask_seconds == {"1": 2.5}
+    assert timing.events == 6
+    assert timing.bytes == 600
+
+
+@pytest.mark.unit
+def test_summarize_percentiles_and_throughput():
+    """Test the summary reports percentiles and runs per minute."""
+    timings = [_run(str(i), end=float(i), subtask=1.0) for i in range(1, 101)]
+    timings.append(RunTiming(benchmark="failed", error="boom"))
+
+    summary = summarize(timings, wall_seconds=60.0)
+
+    assert percentile([3, 1, 2], 0.5) == 2
+    assert summary["runs"] == 101
+    assert summary["completed"] == 100
+    assert summary["errors"] == 1
+    assert summary["runs_per_minute"] == 100
+    assert summary["end_to_end_seconds"]["p50"] == 50
+    assert summary["end_to_end_seconds"]["p95"] == 95
+    assert summary["end_to_end_seconds"]["p99"] == 99
+    assert summary["subtask_seconds"]["count"] == 100
@@ -0,0 +1,112 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.controller import admin_controller
+from app.controller.admin_controller import (
+    ProfileRequest,
+    profile,
+    stop_profile,
+)
+from app.exception.exception import NoPermissionException, UserException
+from app.model.chat import Status
+
+
+@pytest.fixture
+def admin_token(monkeypatch):
+    monkeypatch.setenv(admin_controller.ENV_ADMIN_TOKEN, "secret")
+    return "secret"
+
+
+@pytest.mark.unit
+class TestAdminController:
+    """Test cases for admin profiling endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_profile_disabled_without_token_env(self, monkeypatch):
+        """Test profiling is refused when no admin token is configured."""
+        monkeypatch.delenv(admin_controller.ENV_ADMIN_TOKEN, raising=False)
+
+        with pytest.raises(NoPermissionException):
+            await profile(ProfileRequest(seconds=0.1), "anything")
+
+    @pytest.mark.asyncio
+    async def test_profile_rejects_wrong_token(self, admin_token):
+        """Test profiling is refused with a wrong admin token."""
+        with pytest.raises(NoPermissionException):
+            await profile(ProfileRequest(seconds=0.1), "wrong")
+
+    @pytest.mark.asyncio
+    async def test_profile_returns_folded_stacks(self, admin_token):
+        """Test a short profile returns a folded stacks attachment."""
+        response = await profile(
+            ProfileRequest(seconds=0.2, include_idle=True), admin_token
+        )
+
+        assert "attachment" in response.headers["content-disposition"]
+        lines = response.body.decode().splitlines()
+        assert lines
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+    @pytest.mark.asyncio
+    async def test_profile_stops_when_project_finishes(self, admin_token):
+        """Test profiling a project ends once its run is done."""
+        task_lock = MagicMock()
+        task_lock.status = Status.processing
+
+        async def finish():
+            await asyncio.sleep(0.1)
+            task_lock.status = Status.done
+
+        with patch.dict(
+            "app.controller.admin_controller.task_locks",
+            {"project": task_lock},
+        ):
+            asyncio.create_task(finish())
+            started = asyncio.get_running_loop().time()
+            await profile(
+                ProfileRequest(seconds=30, project_id="project"), admin_token
+            )
+
+        assert asyncio.get_running_loop().time() - started < 5
+
+    @pytest.mark.asyncio
+    async def test_profile_unknown_project(self, admin_token):
+        """Test profiling a project that is not running is rejected."""
+        with pytest.raises(UserException):
+            await profile(ProfileRequest(project_id="missing"), admin_token)
+
+    @pytest.mark.asyncio
+    async def test_stop_profile_ends_running_profile(self, admin_token):
+        """Test DELETE stops a running profile early."""
+        running = asyncio.create_task(
+            profile(ProfileRequest(seconds=30), admin_token)
+        )
+        await asyncio.sleep(0.1)
+
+        result = await stop_profile(admin_token)
+        response = await asyncio.wait_for(running, timeout=5)
+
+        assert result["samples"] >= 0
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_stop_profile_when_idle(self, admin_token):
+        """Test stopping without a running profile is rejected."""
+        with pytest.raises(UserException):
+            await stop_profile(admin_token)
@@ -26,6 +26,7 @@ from app.controller.chat_controller import (
     improve,
     install_mcp,
     post,
+    resume,
     stop,
     supplement,
 )
@@ -112,6 +113,118 @@ class TestChatController:
             assert os.environ.get("CAMEL_MODEL_LOG_ENABLED") == "true"
             assert os.environ.get("browser_port") == "8080"
 
+    @pytest.mark.asyncio
+    async def test_resume_chat_from_checkpoint(
+        self, sample_chat_data, mock_request, mock_task_lock
+    ):
+        """Test resume streams a run seeded from the saved checkpoint."""
+        chat_data = Chat(**sample_chat_data)
+        checkpoint = {"task": {"id": "saved_task"}}
+
+        with (
+            patch(
+                "app.controller.chat_controller.checkpoint_store.load",
+                return_value=checkpoint,
+            ),
+            patch(
+                "app.controller.chat_controller.get_or_create_task_lock",
+                return_value=mock_task_lock,
+            ),
+            patch(
+                "app.controller.chat_controller.step_solve"
+            ) as mock_step_solve,
+            patch("app.controller.chat_controller.set_current_task_id"),
+            patch("app.controller.chat_controller.load_dotenv"),
+            patch("pathlib.Path.mkdir"),
+            patch("pathlib.Path.home", return_value=MagicMock()),
+            patch.dict(os.environ),
+        ):
+
+            async def mock_generator():
+                yield "data: test_response\n\n"
+
+            mock_step_solve.return_value = mock_generator()
+
+            response = await resume("saved_project", chat_data, mock_request)
+
+            assert isinstance(response, StreamingResponse)
+            assert chat_data.project_id == "saved_project"
+            assert chat_data.task_id == "saved_task"
+            queued = mock_task_lock.put_queue.call_args[0][0]
+            assert queued.action == "resume_checkpoint"
+
+    @pytest.mark.asyncio
+    async def test_resume_chat_without_checkpoint(
+        self, sample_chat_data, mock_request
+    ):
+        """Test resume is rejected when the project has no checkpoint."""
+        chat_data = Chat(**sample_chat_data)
+
+        with patch(
+            "app.controller.chat_controller.checkpoint_store.load",
+            return_value=None,
+        ):
+            with pytest.raises(UserException):
+                await resume("missing_project", chat_data, mock_request)
+
+    @pytest.mark.asyncio
+    async def test_resume_chat_rejects_running_project(
+        self, sample_chat_data, mock_request, mock_task_lock
+    ):
+        """Test resume is rejected while the project's run is active."""
+        chat_data = Chat(**sample_chat_data)
+        mock_task_lock.status = Status.processing
+
+        with (
+            patch(
+                "app.controller.chat_controller.checkpoint_store.load",
+                return_value={"task": {"id": "saved_task"}},
+            ),
+            patch.dict(
+                "app.controller.chat_controller.task_locks",
+                {"saved_project": mock_task_lock},
+            ),
+            patch(
+                "app.controller.chat_controller.delete_task_lock"
+            ) as mock_delete,
+        ):
+            with pytest.raises(UserException, match="still running"):
+                await resume("saved_project", chat_data, mock_request)
+            mock_delete.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_resume_chat_replaces_finished_lock(
+        self, sample_chat_data, mock_request, mock_task_lock
+    ):
+        """Test a stopped project can be resumed while its lock remains."""
+        chat_data = Chat(**sample_chat_data)
+        finished_lock = MagicMock(status=Status.done)
+
+        with (
+            patch(
+                "app.controller.chat_controller.checkpoint_store.load",
+                return_value={"task": {"id": "saved_task"}},
+            ),
+            patch.dict(
+                "app.controller.chat_controller.task_locks",
+                {"saved_project": finished_lock},
+            ),
+            patch(
+                "app.controller.chat_controller.delete_task_lock"
+            ) as mock_delete,
+            patch(
+                "app.controller.chat_controller.get_or_create_task_lock",
+                return_value=mock_task_lock,
+            ),
+            patch("app.controller.chat_controller.step_solve"),
+            patch("app.controller.chat_controller._setup_chat_environment"),
+            patch("app.controller.chat_controller.set_current_task_id"),
+        ):
+            response = await resume("saved_project", chat_data, mock_request)
+
+        assert isinstance(response, StreamingResponse)
+        mock_delete.assert_awaited_once_with("saved_project")
+
     def test_improve_chat_success(self, mock_task_lock):
         """Test successful chat improvement."""
         task_id = "test_task_123"
@@ -0,0 +1,43 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.model.chat import sse_json
+from app.utils.metrics import record_llm_call, record_tool_call
+
+
+@pytest.mark.unit
+def test_metrics_endpoint(client: TestClient):
+    """Test /metrics exposes SSE, model, tool and task lock metrics."""
+    sse_json("metrics_test_step", {"ok": True})
+    record_llm_call("metrics-test-model", 1.2, {"prompt_tokens": 7})
+    record_tool_call("Metrics Test Toolkit", "run", 0.1, error=True)
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert 'eigent_sse_events_total{step="metrics_test_step"} 1' in body
+    assert (
+        'eigent_llm_tokens_total{kind="prompt_tokens",'
+        'model="metrics-test-model"} 7'
+    ) in body
+    assert (
+        'eigent_tool_calls_total{method="run",outcome="error",'
+        'toolkit="Metrics Test Toolkit"} 1'
+    ) in body
+    assert "# TYPE eigent_task_locks gauge" in body
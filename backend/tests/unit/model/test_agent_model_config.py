@@ -13,7 +13,7 @@
 # ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
 """Unit tests for AgentModelConfig and per-agent model configuration."""
 
-from app.model.chat import AgentModelConfig, NewAgent
+from app.model.chat import AgentModelConfig, Chat, NewAgent
 
 
 class TestAgentModelConfig:
@@ -118,3 +118,38 @@ class TestNewAgentWithModelConfig:
         assert "custom_model_config" in data
         assert data["custom_model_config"]["model_platform"] == "anthropic"
         assert data["custom_model_config"]["model_type"] == "claude-3-sonnet"
+
+
+class TestRoleModelConfig:
+    """Tests for per-role model overrides on Chat."""
+
+    def _chat(self, **kwargs) -> Chat:
+        return Chat(
+            task_id="task",
+            project_id="project",
+            question="question",
+            email="test@example.com",
+            model_platform="openai",
+            model_type="gpt-4o",
+            api_key="key",
+            **kwargs,
+        )
+
+    def test_no_override_by_default(self):
+        """Test roles use the task model unless configured otherwise."""
+        chat = self._chat()
+        assert chat.role_model_config("coordinator_agent") is None
+
+    def test_role_override_wins_over_fast_default(self):
+        """Test an explicit role override beats the fast utility model."""
+        override = AgentModelConfig(model_type="gpt-4.1-nano")
+        chat = self._chat(
+            role_models={"coordinator_agent": override},
+            fast_utility_models=True,
+        )
+        assert chat.role_model_config("coordinator_agent") == override
+        assert (
+            chat.role_model_config("task_summary_agent").model_type
+            == "gpt-4.1-mini"
+        )
+        assert chat.role_model_config("developer_agent") is None
@@ -29,6 +29,7 @@ from app.service.chat_service import (
     new_agent_model,
     question_confirm,
     step_solve,
+    sub_tasks_patch,
     summary_task,
     to_sub_tasks,
     tree_sub_tasks,
@@ -513,6 +514,46 @@ class TestChatServiceUtilities:
         assert new_subtasks[0].id.startswith("main.")
         assert new_subtasks[1].id.startswith("main.")
 
+    def test_add_sub_tasks_skips_taken_ids(self):
+        """Test add_sub_tasks does not reuse an id left by a removal."""
+        from app.model.chat import TaskContent
+
+        camel_task = Task(content="Main Task", id="main_ids")
+        for i in (2, 3):
+            camel_task.add_subtask(Task(content=f"T{i}", id=f"main_ids.{i}"))
+
+        added = add_sub_tasks(camel_task, [TaskContent(id="", content="New")])
+
+        assert added[0].id == "main_ids.4"
+        assert [t.id for t in camel_task.subtasks] == [
+            "main_ids.2",
+            "main_ids.3",
+            "main_ids.4",
+        ]
+
+    def test_sub_tasks_patch_produces_minimal_operations(self):
+        """Test sub_tasks_patch only describes what changed."""
+        old = [
+            {"id": "1", "content": "a"},
+            {"id": "", "content": "new"},
+            {"id": "2", "content": "b"},
+            {"id": "3", "content": "c"},
+        ]
+        new = [
+            {"id": "1", "content": "a", "state": "OPEN", "subtasks": []},
+            {"id": "3", "content": "c", "state": "OPEN", "subtasks": []},
+            {"id": "2", "content": "b2", "state": "OPEN", "subtasks": []},
+            {"id": "4", "content": "new", "state": "OPEN", "subtasks": []},
+        ]
+
+        patch = sub_tasks_patch(old, new)
+
+        assert patch[0] == {"op": "remove", "path": "/1"}
+        assert {"op": "move", "from": "/2", "path": "/1"} in patch
+        assert {"op": "replace", "path": "/2/content", "value": "b2"} in patch
+        assert {"op": "add", "path": "/3", "value": new[3]} in patch
+        assert sub_tasks_patch(new, new) == []
+
     def test_to_sub_tasks_creates_proper_response(self):
         """Test to_sub_tasks creates properly formatted SSE response."""
         task = Task(content="Main Task", id="main")
@@ -1197,6 +1238,8 @@ class TestChatServiceErrorCases:
             await summary_task(mock_camel_agent, task)
 
     @pytest.mark.asyncio
+    # developer_agent and document_agent build their toolkits on the loop
+    @pytest.mark.allow_loop_blocking
     async def test_construct_workforce_agent_creation_error(
         self, sample_chat_data, mock_task_lock
     ):
@@ -13,7 +13,6 @@
 # ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
 
 import asyncio
-import weakref
 from datetime import datetime, timedelta
 from unittest.mock import patch
 
@@ -41,8 +40,8 @@ from app.service.task import (
     get_task_lock,
     process_task,
     set_process_task,
-    task_index,
     task_locks,
+    task_tree,
 )
 
 
@@ -369,8 +368,8 @@ class TestCamelTaskManagement:
     """Test cases for CAMEL task management functions."""
 
     def setup_method(self):
-        """Clean up task_index before each test."""
-        task_index.clear()
+        """Clean up task_tree before each test."""
+        task_tree.clear()
 
     def test_get_camel_task_direct_match(self):
         """Test getting CAMEL task with direct ID match."""
@@ -399,9 +398,9 @@ class TestCamelTaskManagement:
         assert result is None
 
     def test_get_camel_task_from_cache(self):
-        """Test getting CAMEL task from weak reference cache."""
+        """Test getting CAMEL task from the task tree index."""
         task = Task(content="Test task", id="test_123")
-        task_index["test_123"] = weakref.ref(task)
+        task_tree.index([task])
 
         result = get_camel_task("test_123", [])
         assert result is task
@@ -409,8 +408,7 @@ class TestCamelTaskManagement:
     def test_get_camel_task_dead_reference(self):
         """Test getting CAMEL task with dead weak reference."""
         task = Task(content="Test task", id="test_123")
-        task_ref = weakref.ref(task)
-        task_index["test_123"] = task_ref
+        task_tree.index([task])
 
         # Delete the original task to make the weak reference dead
         del task
@@ -418,7 +416,7 @@ class TestCamelTaskManagement:
         # Should rebuild index and return None since task is not in tasks list
         result = get_camel_task("test_123", [])
         assert result is None
-        assert "test_123" not in task_index
+        assert "test_123" not in task_tree
 
     def test_get_camel_task_rebuilds_index(self):
         """Test that get_camel_task rebuilds the index."""
@@ -427,14 +425,41 @@ class TestCamelTaskManagement:
         tasks = [task1, task2]
 
         # Index should be empty initially
-        assert len(task_index) == 0
+        assert len(task_tree) == 0
 
         # Getting a task should rebuild the index
         result = get_camel_task("task_2", tasks)
         assert result is task2
-        assert len(task_index) == 2
-        assert "task_1" in task_index
-        assert "task_2" in task_index
+        assert len(task_tree) == 2
+        assert "task_1" in task_tree
+        assert "task_2" in task_tree
+
+    def test_task_tree_tracks_parents_and_child_order(self):
+        """Test TaskTree parent pointers, child order and discard."""
+        root = Task(content="Root", id="root")
+        children = [Task(content=f"Child {i}", id=f"root.{i}") for i in (1, 2)]
+        for child in children:
+            root.add_subtask(child)
+        grandchild = Task(content="Grandchild", id="root.1.1")
+        children[0].add_subtask(grandchild)
+        task_tree.index([root])
+
+        assert task_tree.parent("root.1.1") is children[0]
+        assert task_tree.child("root", "root.2") is children[1]
+        assert task_tree.children("root") == children
+
+        added = Task(content="Child 3", id="root.3")
+        task_tree.add(added, root)
+        assert root.subtasks[-1] is added
+        assert task_tree.children("root")[-1] is added
+
+        task_tree.discard("root.1")
+        assert "root.1" not in task_tree
+        assert "root.1.1" not in task_tree
+        assert [t.id for t in task_tree.children("root")] == [
+            "root.2",
+            "root.3",
+        ]
 
 
 @pytest.mark.unit
@@ -552,7 +577,7 @@ class TestTaskServiceIntegration:
     def setup_method(self):
         """Clean up before each test."""
         task_locks.clear()
-        task_index.clear()
+        task_tree.clear()
 
     @pytest.mark.asyncio
     async def test_full_task_lifecycle(self):
@@ -0,0 +1,93 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+"""Tests for fine-grained spans and the local span exporters."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+import app.utils.telemetry.workforce_metrics as wm_module
+from app.utils.telemetry.spans import (
+    ATTR_TOKENS_TOTAL,
+    SPAN_AGENT_STEP,
+    SPAN_LLM_CALL,
+    set_token_usage,
+    span,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_global_tracer_provider():
+    """Reset global tracer provider between tests for isolation."""
+    yield
+    if wm_module._GLOBAL_TRACER_PROVIDER is not None:
+        wm_module._GLOBAL_TRACER_PROVIDER.shutdown()
+    wm_module._GLOBAL_TRACER_PROVIDER = None
+    wm_module._TRACE_BUFFER = None
+
+
+def _initialize(**envs):
+    with patch.dict("os.environ", envs, clear=True):
+        wm_module.initialize_tracer_provider()
+    return wm_module.get_tracer_provider()
+
+
+def test_spans_are_noops_without_exporters():
+    """Test spans cost nothing and record nothing when tracing is off."""
+    _initialize()
+
+    with span(SPAN_AGENT_STEP) as current:
+        set_token_usage(current, {"total_tokens": 10})
+
+    assert not current.is_recording()
+    assert wm_module.get_trace_buffer() is None
+
+
+def test_ring_buffer_keeps_nested_spans():
+    """Test child spans reach the in-memory buffer under their parent."""
+    provider = _initialize(EIGENT_TRACE_BUFFER_SIZE="2")
+
+    with span(SPAN_AGENT_STEP, {"eigent.agent.name": "dev"}) as step:
+        with span(SPAN_LLM_CALL) as call:
+            set_token_usage(call, {"total_tokens": 42})
+    with span("extra"):
+        pass
+    provider.force_flush()
+
+    buffer = wm_module.get_trace_buffer()
+    spans = buffer.spans()
+    assert [s["name"] for s in spans] == [SPAN_AGENT_STEP, "extra"]
+    step_id = f"0x{step.get_span_context().span_id:016x}"
+    trace_id = f"{step.get_span_context().trace_id:032x}"
+    assert [s["name"] for s in buffer.spans(trace_id)] == [SPAN_AGENT_STEP]
+    assert spans[0]["attributes"]["eigent.agent.name"] == "dev"
+    assert call.attributes[ATTR_TOKENS_TOTAL] == 42
+    assert call.parent.span_id == int(step_id, 16)
+
+
+def test_jsonl_file_exporter(tmp_path):
+    """Test spans are appended to the trace file one per line."""
+    path = tmp_path / "traces" / "spans.jsonl"
+    provider = _initialize(EIGENT_TRACE_FILE=str(path))
+
+    with span(SPAN_AGENT_STEP):
+        pass
+    with pytest.raises(ValueError), span(SPAN_LLM_CALL):
+        raise ValueError("boom")
+    provider.force_flush()
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [r["name"] for r in records] == [SPAN_AGENT_STEP, SPAN_LLM_CALL]
+    assert records[1]["status"]["status_code"] == "ERROR"
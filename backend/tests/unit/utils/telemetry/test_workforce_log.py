@@ -0,0 +1,76 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+"""Tests for the indexed workforce event log."""
+
+from camel.societies.workforce.events import (
+    TaskCompletedEvent,
+    TaskFailedEvent,
+    WorkerCreatedEvent,
+)
+
+from app.utils.telemetry.workforce_log import IndexedWorkforceLogger
+
+
+def _fail(task_log: IndexedWorkforceLogger, task_id: str, error: str):
+    task_log.log_task_failed(
+        TaskFailedEvent(task_id=task_id, error_message=error)
+    )
+
+
+def test_latest_entry_by_task_and_event_type():
+    """Test the latest entry of a type is found per task."""
+    task_log = IndexedWorkforceLogger("wf")
+    _fail(task_log, "t1", "first")
+    _fail(task_log, "t1", "second")
+    _fail(task_log, "t2", "other")
+    task_log.log_task_completed(
+        TaskCompletedEvent(task_id="t1", worker_id="w1")
+    )
+
+    assert task_log.latest("t1", "task_failed")["error_message"] == "second"
+    assert task_log.latest("t1", "task_completed")["worker_id"] == "w1"
+    assert task_log.latest("t2", "task_failed")["error_message"] == "other"
+    assert task_log.latest("t3", "task_failed") is None
+
+
+def test_log_and_index_are_bounded():
+    """Test old entries are dropped once the retention is exceeded."""
+    task_log = IndexedWorkforceLogger("wf", max_entries=8)
+    for i in range(100):
+        _fail(task_log, f"t{i}", f"error {i}")
+
+    assert len(task_log.log_entries) <= 10
+    assert task_log.log_entries[-1]["task_id"] == "t99"
+    assert len(task_log._latest) == 8
+    assert task_log.latest("t0", "task_failed") is None
+    assert task_log.latest("t99", "task_failed")["error_message"] == "error 99"
+    assert task_log.get_kpis()["total_tasks_failed"] > 0
+
+
+def test_reset_keeps_workers_and_clears_index():
+    """Test a reset keeps worker entries but forgets task entries."""
+    task_log = IndexedWorkforceLogger("wf")
+    task_log.log_worker_created(
+        WorkerCreatedEvent(
+            worker_id="w1", worker_type="SingleAgentWorker", role="dev"
+        )
+    )
+    _fail(task_log, "t1", "error")
+
+    task_log.reset_task_data()
+
+    assert task_log.latest("t1", "task_failed") is None
+    assert [entry["event_type"] for entry in task_log.log_entries] == [
+        "worker_created"
+    ]
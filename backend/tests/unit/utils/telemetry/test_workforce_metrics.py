@@ -268,16 +268,10 @@ def test_log_message_error(metrics_callback):
     assert mock_span.set_attribute.called
 
 
-def test_log_message_quality_score(metrics_callback):
-    """Test log_message function parsing quality score."""
-    event = LogEvent(
-        level="info",
-        message="Task task_1 completed successfully (quality score: 85).",
-    )
-
-    metrics_callback.log_message(event)
+def test_record_quality_score(metrics_callback):
+    """Test quality scores recorded by the workforce are kept per task."""
+    metrics_callback.record_quality_score("task_1", 85)
 
-    # Verify quality score was parsed and stored
     assert "task_1" in metrics_callback.task_quality_scores
     assert metrics_callback.task_quality_scores["task_1"] == 85
 
@@ -0,0 +1,179 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import pytest
+from camel.tasks import Task
+
+from app.utils.assignment_rules import (
+    AssignmentRuleConfig,
+    embedding_similarity,
+    match_worker,
+    read_annotation,
+    strip_annotations,
+    worker_role,
+)
+
+WORKERS = {
+    "dev": "Developer Agent: A master-level coding assistant with a "
+    "powerful terminal.",
+    "web": "Browser Agent: Can search the web and extract webpage content.",
+    "doc": "Document Agent: Creates and modifies reports and files.",
+    "media": "Multi-Modal Agent: Analyzes images and audio.",
+}
+
+
+@pytest.mark.unit
+def test_worker_role_reads_description_title():
+    """Test built-in roles are taken from the description title."""
+    assert worker_role(WORKERS["dev"]) == "developer"
+    assert worker_role(WORKERS["media"]) == "multi_modal"
+    assert worker_role("Travel Planner: Books flights.") is None
+
+
+@pytest.mark.unit
+def test_match_worker_assigns_obvious_subtasks():
+    """Test clear keyword matches pick the worker without the LLM."""
+    config = AssignmentRuleConfig()
+    task = Task(
+        content="Search the web for the latest news on the EU AI act",
+        id="task_1",
+    )
+    assert match_worker(task, WORKERS, config) == "web"
+
+    task = Task(content="Write a python script and debug it", id="task_2")
+    assert match_worker(task, WORKERS, config) == "dev"
+
+
+@pytest.mark.unit
+def test_match_worker_defers_ambiguous_subtasks():
+    """Test weak or tied matches are left to the coordinator."""
+    config = AssignmentRuleConfig()
+    task = Task(content="Think about the plan", id="task_1")
+    assert match_worker(task, WORKERS, config) is None
+
+    task = Task(content="Search the web and write a python script", id="t2")
+    assert match_worker(task, WORKERS, config) is None
+
+
+@pytest.mark.unit
+def test_match_worker_role_hint():
+    """Test a role hint naming one worker wins outright."""
+    config = AssignmentRuleConfig()
+    task = Task(
+        content="Think about the plan",
+        id="task_1",
+        additional_info={"role_hint": "Document"},
+    )
+    assert match_worker(task, WORKERS, config) == "doc"
+
+    task.additional_info = {"role_hint": "agent"}
+    assert match_worker(task, WORKERS, config) is None
+
+
+@pytest.mark.unit
+def test_match_worker_similarity_adds_to_score():
+    """Test the optional similarity decides when keywords do not."""
+    config = AssignmentRuleConfig()
+    task = Task(content="Think about the plan", id="task_1")
+
+    assignee = match_worker(
+        task,
+        WORKERS,
+        config,
+        similarity=lambda content, desc: 1.0 if "Multi" in desc else 0,
+    )
+
+    assert assignee == "media"
+
+
+class FakeEmbedding:
+    def __init__(self):
+        self.calls = 0
+
+    def embed(self, text):
+        self.calls += 1
+        return [1.0, 0.0] if "image" in text.lower() else [0.0, 1.0]
+
+
+@pytest.mark.unit
+def test_embedding_similarity_embeds_each_text_once():
+    """Test the embedding is created lazily and texts are cached."""
+    embedding = FakeEmbedding()
+    created = []
+    similarity = embedding_similarity(lambda: created.append(1) or embedding)
+    assert created == []
+
+    assert similarity("Describe the image", WORKERS["media"]) == 1.0
+    assert similarity("Describe the image", WORKERS["dev"]) == 0.0
+    assert created == [1]
+    assert embedding.calls == 3
+
+
+@pytest.mark.unit
+def test_embedding_similarity_without_model():
+    """Test a model that cannot be loaded scores zero."""
+
+    def create():
+        raise ImportError("No module named 'sentence_transformers'")
+
+    similarity = embedding_similarity(create)
+
+    assert similarity("Describe the image", WORKERS["media"]) == 0.0
+
+
+@pytest.mark.unit
+def test_read_annotation_moves_plan_details_to_additional_info():
+    """Test the decomposition annotation becomes a hint and dependencies."""
+    task = Task(
+        content="Compile the summaries into a report.\n"
+        "[worker: Document; after: 1, 3]",
+        id="main.4",
+    )
+    read_annotation(task, "main")
+    assert task.content == "Compile the summaries into a report."
+    assert task.additional_info == {
+        "role_hint": "Document",
+        "dependencies": ["main.1", "main.3"],
+    }
+
+    task = Task(content="Search the web [worker: none; after: none]", id="t")
+    read_annotation(task, "main")
+    assert task.content == "Search the web"
+    assert task.additional_info == {"dependencies": []}
+
+    task = Task(content="Search the web", id="t2")
+    read_annotation(task, "main")
+    assert task.content == "Search the web"
+    assert not task.additional_info
+
+
+@pytest.mark.unit
+def test_strip_annotations_from_streamed_text():
+    """Test annotations never reach the streamed text, even partially."""
+    text = (
+        "<tasks>\n<task>Search the web.\n[worker: browser; after: none]"
+        "</task>\n<task>See [1] and write a report.\n"
+        "[Worker: document; after: 1]</task>\n</tasks>"
+    )
+    streamed = [strip_annotations(text[:end]) for end in range(len(text))]
+
+    assert strip_annotations(text) == (
+        "<tasks>\n<task>Search the web.\n</task>\n"
+        "<task>See [1] and write a report.\n</task>\n</tasks>"
+    )
+    assert all("worker" not in part.lower() for part in streamed)
+    assert all(
+        later.startswith(earlier)
+        for earlier, later in zip(streamed, streamed[1:])
+    )
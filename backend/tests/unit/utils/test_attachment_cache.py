@@ -0,0 +1,140 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import threading
+
+import pytest
+
+from app.utils import attachment_cache as module
+from app.utils.attachment_cache import MARKDOWN, AttachmentCache
+
+
+@pytest.fixture
+def conversions(monkeypatch):
+    """Replace the Markdown converter with one recording its calls."""
+    calls: list[str] = []
+
+    def convert(path: str) -> str:
+        calls.append(path)
+        with open(path) as f:
+            return f"converted: {f.read()}"
+
+    monkeypatch.setitem(
+        module.CONVERTERS, MARKDOWN, (frozenset({".txt"}), convert)
+    )
+    return calls, convert
+
+
+@pytest.mark.unit
+def test_read_reuses_prefetched_conversion(tmp_path, conversions):
+    """Test a prefetched file is converted once and reread from cache."""
+    calls, convert = conversions
+    path = tmp_path / "notes.txt"
+    path.write_text("hello")
+    copy = tmp_path / "copy.txt"
+    copy.write_text("hello")
+    cache = AttachmentCache()
+
+    assert (
+        cache.prefetch([str(path), str(copy), str(tmp_path / "image.png")])
+        == 1
+    )
+    assert cache.read(str(path), MARKDOWN, convert) == "converted: hello"
+    assert cache.read(str(copy), MARKDOWN, convert) == "converted: hello"
+    assert calls == [str(path)]
+
+
+@pytest.mark.unit
+def test_changed_file_is_converted_again(tmp_path, conversions):
+    """Test the cache is keyed by content, not by path."""
+    calls, convert = conversions
+    path = tmp_path / "notes.txt"
+    path.write_text("first")
+    cache = AttachmentCache()
+    cache.prefetch([str(path)])
+    cache.read(str(path), MARKDOWN, convert)
+
+    path.write_text("second version")
+
+    assert cache.read(str(path), MARKDOWN, convert) == (
+        "converted: second version"
+    )
+    assert len(calls) == 2
+
+
+@pytest.mark.unit
+def test_reader_waits_for_running_conversion(tmp_path, monkeypatch):
+    """Test a read during a background conversion does not start another."""
+    started = threading.Event()
+    release = threading.Event()
+    calls: list[str] = []
+
+    def slow_convert(path: str) -> str:
+        calls.append(path)
+        started.set()
+        release.wait(5)
+        return "slow"
+
+    monkeypatch.setitem(
+        module.CONVERTERS, MARKDOWN, (frozenset({".txt"}), slow_convert)
+    )
+    path = tmp_path / "big.txt"
+    path.write_text("data")
+    cache = AttachmentCache()
+    cache.prefetch([str(path)])
+    assert started.wait(5)
+
+    threading.Timer(0.05, release.set).start()
+
+    assert cache.read(str(path), MARKDOWN, slow_convert) == "slow"
+    assert calls == [str(path)]
+
+
+@pytest.mark.unit
+def test_failed_prefetch_is_retried_by_reader(tmp_path, monkeypatch):
+    """Test a background failure is not cached."""
+
+    def broken(path: str) -> str:
+        raise ValueError("corrupt")
+
+    monkeypatch.setitem(
+        module.CONVERTERS, MARKDOWN, (frozenset({".txt"}), broken)
+    )
+    path = tmp_path / "notes.txt"
+    path.write_text("hello")
+    cache = AttachmentCache()
+    cache.prefetch([str(path)])
+
+    assert cache.read(str(path), MARKDOWN, lambda p: "ok") == "ok"
+
+
+@pytest.mark.unit
+def test_only_prefetched_files_use_the_cache(tmp_path, conversions):
+    """Test other files are converted directly and hashes stay bounded."""
+    calls, convert = conversions
+    cache = AttachmentCache(max_entries=2)
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"notes{i}.txt"
+        path.write_text(f"note {i}")
+        paths.append(str(path))
+
+    assert cache.read(paths[0], MARKDOWN, convert) == "converted: note 0"
+    assert cache.read(paths[0], MARKDOWN, convert) == "converted: note 0"
+    assert calls == [paths[0], paths[0]]
+    assert not cache._digests
+
+    cache.prefetch(paths)
+    assert len(cache._digests) == 2
+    assert paths[0] not in cache._digests
@@ -0,0 +1,112 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import asyncio
+
+import pytest
+
+from app.service.task import TaskLock
+from app.utils.cancellation import (
+    CancellationToken,
+    TaskCancelledError,
+    use_token,
+)
+
+
+@pytest.mark.unit
+def test_cancel_runs_callbacks_once_and_propagates_to_children():
+    """Test callbacks fire once and child tokens follow their parent."""
+    parent = CancellationToken()
+    child = parent.child()
+    calls = []
+    parent.add_callback(lambda: calls.append("parent"))
+    remove = child.add_callback(lambda: calls.append("removed"))
+    remove()
+
+    parent.cancel("stop")
+    parent.cancel("again")
+
+    assert calls == ["parent"]
+    assert child.cancelled
+    assert child.reason == "stop"
+    with pytest.raises(TaskCancelledError):
+        child.raise_if_cancelled()
+
+    late = []
+    parent.add_callback(lambda: late.append(True))
+    assert late == [True]
+
+
+@pytest.mark.unit
+def test_closed_child_is_not_cancelled_with_parent():
+    """Test a closed child token no longer follows its parent."""
+    parent = CancellationToken()
+    child = parent.child()
+    child.close()
+
+    parent.cancel("stop")
+
+    assert not child.cancelled
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_interrupts_awaited_coroutine():
+    """Test cancelling a token interrupts the coroutine it is running."""
+    token = CancellationToken()
+    loop = asyncio.get_running_loop()
+    loop.call_later(0.05, token.cancel, "stop")
+
+    with pytest.raises(TaskCancelledError, match="stop"):
+        await asyncio.wait_for(token.run(asyncio.sleep(10)), timeout=1)
+
+    with pytest.raises(TaskCancelledError):
+        await token.run(asyncio.sleep(0))
+
+
+@pytest.mark.unit
+def test_task_lock_cancel_running_work_replaces_token():
+    """Test stopping a project cancels its subtasks but not later work."""
+    task_lock = TaskLock("test_123", asyncio.Queue(), {})
+    old_token = task_lock.cancel_token
+    subtask = task_lock.subtask_token("sub_1")
+
+    assert task_lock.work_token() is old_token
+    with use_token(subtask):
+        assert task_lock.work_token() is subtask
+
+    task_lock.cancel_running_work("stop")
+
+    assert subtask.cancelled
+    assert old_token.cancelled
+    assert not task_lock.cancel_token.cancelled
+    assert not task_lock.cancel_subtask("sub_1", "removed")
+
+
+@pytest.mark.unit
+def test_work_token_stays_cancelled_after_release():
+    """Test work keeps its cancelled token after the project token is
+    replaced and the subtask token released."""
+    task_lock = TaskLock("test_123", asyncio.Queue(), {})
+    subtask = task_lock.subtask_token("sub_1")
+
+    with use_token(subtask):
+        token = task_lock.work_token()
+        task_lock.cancel_running_work("stop")
+        task_lock.release_subtask_token("sub_1")
+
+        assert task_lock.work_token() is token
+        with pytest.raises(TaskCancelledError, match="stop"):
+            task_lock.work_token().raise_if_cancelled()
+    assert not task_lock.work_token().cancelled
@@ -0,0 +1,65 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import pytest
+from camel.tasks import Task
+from camel.tasks.task import TaskState
+
+from app.utils.checkpoint import CheckpointStore, task_from_dict, task_to_dict
+
+
+@pytest.mark.unit
+def test_task_dict_round_trip():
+    """Test a task tree survives serialization with state and results."""
+    root = Task(content="Main task", id="main")
+    done = Task(content="Done", id="main.1")
+    done.state = TaskState.DONE
+    done.result = "finished"
+    root.add_subtask(done)
+    root.add_subtask(Task(content="Open", id="main.2"))
+
+    restored = task_from_dict(task_to_dict(root))
+
+    assert [sub.id for sub in restored.subtasks] == ["main.1", "main.2"]
+    assert restored.subtasks[0].state == TaskState.DONE
+    assert restored.subtasks[0].result == "finished"
+    assert restored.subtasks[0].parent is restored
+
+
+@pytest.mark.unit
+def test_checkpoint_store_keeps_latest_per_project(tmp_path):
+    """Test saving replaces the project's previous checkpoint."""
+    store = CheckpointStore(tmp_path / "nested" / "checkpoints.db")
+
+    assert store.load("project") is None
+    store.save("project", "task_1", {"step": 1})
+    store.save("project", "task_1", {"step": 2})
+    store.save("other", "task_2", {"step": 9})
+
+    assert store.load("project") == {"step": 2}
+    assert CheckpointStore(store.path).load("other") == {"step": 9}
+
+
+@pytest.mark.unit
+def test_checkpoint_store_delete(tmp_path):
+    """Test deleting drops only the given project's checkpoint."""
+    store = CheckpointStore(tmp_path / "checkpoints.db")
+    store.delete("project")
+    store.save("project", "task_1", {"step": 1})
+    store.save("other", "task_2", {"step": 9})
+
+    store.delete("project")
+
+    assert store.load("project") is None
+    assert store.load("other") == {"step": 9}
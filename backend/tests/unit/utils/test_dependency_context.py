@@ -0,0 +1,158 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from camel.societies.workforce.worker import Worker
+from camel.tasks import Task
+
+from app.utils.dependency_context import (
+    DependencyContextConfig,
+    agent_summarizer,
+    build_dependency_info,
+    estimate_tokens,
+    reference_files,
+)
+
+
+def _task(id: str, result: str) -> Task:
+    task = Task(content=f"Subtask {id}", id=id)
+    task.result = result
+    return task
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_small_results_are_inlined_unchanged():
+    """Test results within budget match the workforce's own format."""
+    dependencies = [_task("1", "first"), _task("2", "second")]
+
+    info = await build_dependency_info(dependencies, DependencyContextConfig())
+
+    assert info == Worker._get_dep_tasks_info(dependencies)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_large_result_is_summarized_once():
+    """Test an oversized result is summarized and the summary reused."""
+    calls = []
+
+    async def summarize(content: str, result: str) -> str:
+        calls.append(content)
+        return "short summary"
+
+    config = DependencyContextConfig(token_budget=200, max_result_tokens=100)
+    dependencies = [_task("1", "x" * 2000), _task("2", "recent result")]
+
+    first = await build_dependency_info(dependencies, config, summarize)
+    second = await build_dependency_info(dependencies, config, summarize)
+
+    assert first == second
+    assert "result: short summary." in first
+    assert "result: recent result." in first
+    assert calls == ["Subtask 1"]
+    assert dependencies[0].additional_info["result_summary"]["summary"] == (
+        "short summary"
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_results_are_truncated_without_summarizer():
+    """Test results are cut to the budget when they cannot be summarized."""
+    config = DependencyContextConfig(
+        token_budget=300, max_result_tokens=200, min_result_tokens=50
+    )
+    dependencies = [_task(str(i), "y" * 4000) for i in range(3)]
+
+    info = await build_dependency_info(dependencies, config)
+
+    assert "characters omitted" in info
+    assert estimate_tokens(info) < 300 + 50 + 100
+
+
+@pytest.mark.unit
+def test_long_code_blocks_reference_written_files(tmp_path):
+    """Test long code blocks point at the file holding the code, and are
+    kept when no mentioned file does."""
+    code = "\n".join(f"line {i}" for i in range(100))
+    script = tmp_path / "script.py"
+    script.write_text(f"{code}\n")
+    other = tmp_path / "notes.md"
+    other.write_text("notes\n")
+    result = f"Wrote {other} and {script}:\n```python\n{code}\n```\nDone."
+    config = DependencyContextConfig(max_code_block_chars=100)
+
+    trimmed = reference_files(result, config)
+
+    assert "line 50" not in trimmed
+    assert f"[100 lines omitted, see {script}]" in trimmed
+    assert trimmed.endswith("Done.")
+
+    script.write_text("print('hi')\n")
+    assert reference_files(result, config) == result
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_long_code_block_within_budget_is_inlined(tmp_path):
+    """Test a result fitting its limit keeps its code blocks."""
+    code = "\n".join(f"line {i}" for i in range(100))
+    script = tmp_path / "script.py"
+    script.write_text(f"{code}\n")
+    dependencies = [
+        _task("1", f"Wrote {script}:\n```python\n{code}\n```\nDone.")
+    ]
+
+    info = await build_dependency_info(
+        dependencies, DependencyContextConfig(max_code_block_chars=100)
+    )
+
+    assert info == Worker._get_dep_tasks_info(dependencies)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_agent_summarizer_runs_summaries_concurrently():
+    """Test summaries run on separate pooled agents at the same time."""
+    started = asyncio.Event()
+    running = 0
+    created = []
+
+    def create_agent():
+        agent = MagicMock()
+
+        async def astep(prompt):
+            nonlocal running
+            running += 1
+            if running == 2:
+                started.set()
+            await asyncio.wait_for(started.wait(), timeout=1)
+            running -= 1
+            return MagicMock(msgs=[MagicMock(content="summary")])
+
+        agent.astep = astep
+        created.append(agent)
+        return agent
+
+    summarize = agent_summarizer(create_agent, max_agents=2)
+    summaries = await asyncio.gather(
+        summarize("a", "result a"), summarize("b", "result b")
+    )
+    assert summaries == ["summary", "summary"]
+    assert await summarize("c", "result c") == "summary"
+    assert len(created) == 2
@@ -0,0 +1,110 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import asyncio
+import sys
+import time
+
+import pytest
+
+from app.utils.loop_watchdog import (
+    BlockingCallError,
+    LoopWatchdog,
+    frame_project_id,
+)
+from app.utils.metrics import loop_blocks
+
+
+def _blocking_step(project_id: str) -> None:
+    time.sleep(0.3)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.allow_loop_blocking
+async def test_blocking_call_is_recorded_with_stack_and_project():
+    """Test a sync sleep on the loop is logged with its stack and project."""
+    watchdog = LoopWatchdog(threshold=0.1, interval=0.02)
+    blocks_before = loop_blocks.value()
+    watchdog.start()
+    try:
+        await asyncio.sleep(0.05)
+        _blocking_step("project-1")
+        await asyncio.sleep(0.1)
+    finally:
+        watchdog.stop()
+
+    assert len(watchdog.blocks) == 1
+    block = watchdog.blocks[0]
+    assert 0.15 < block.seconds < 1
+    assert block.project_id == "project-1"
+    assert "_blocking_step" in block.stack
+    assert loop_blocks.value() == blocks_before + 1
+    with pytest.raises(BlockingCallError, match="_blocking_step"):
+        watchdog.raise_if_blocked()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_awaiting_does_not_count_as_blocking():
+    """Test a loop that keeps yielding records no blocks."""
+    watchdog = LoopWatchdog(threshold=0.1, interval=0.02)
+    watchdog.start()
+    try:
+        for _ in range(10):
+            await asyncio.sleep(0.02)
+    finally:
+        watchdog.stop()
+
+    assert not watchdog.running
+    assert not watchdog.blocks
+    watchdog.raise_if_blocked()
+
+
+@pytest.mark.unit
+def test_stopped_loop_does_not_count_as_blocking():
+    """Test time between runs of the loop, e.g. pytest formatting a failure
+    before fixture teardown, records no blocks."""
+    loop = asyncio.new_event_loop()
+    watchdog = LoopWatchdog(threshold=0.05, interval=0.01)
+
+    async def start() -> None:
+        watchdog.start()
+        await asyncio.sleep(0.03)
+
+    try:
+        loop.run_until_complete(start())
+        time.sleep(0.2)
+        loop.run_until_complete(asyncio.sleep(0.05))
+        watchdog.stop()
+        loop.run_until_complete(asyncio.sleep(0))
+    finally:
+        watchdog.stop()
+        loop.close()
+
+    assert not watchdog.blocks
+
+
+@pytest.mark.unit
+def test_frame_project_id_from_agent():
+    """Test the project is read from an agent's api_task_id."""
+
+    class Agent:
+        api_task_id = "project-2"
+
+        def step(self):
+            return sys._getframe()
+
+    assert frame_project_id(Agent().step()) == "project-2"
+    assert frame_project_id(None) is None
@@ -0,0 +1,59 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import pytest
+
+from app.utils.metrics import MetricsRegistry
+
+
+@pytest.mark.unit
+def test_counter_and_gauge_exposition():
+    """Test counters and gauges render in the text exposition format."""
+    registry = MetricsRegistry()
+    events = registry.counter("events_total", "Events sent")
+    registry.gauge("queue_depth", "Queued", lambda: [({"project": "p"}, 3)])
+
+    events.inc(step="to_sub_tasks")
+    events.inc(2, step="to_sub_tasks")
+    events.inc(step='say "hi"')
+
+    assert registry.render().splitlines() == [
+        "# HELP events_total Events sent",
+        "# TYPE events_total counter",
+        'events_total{step="say \\"hi\\""} 1',
+        'events_total{step="to_sub_tasks"} 3',
+        "# HELP queue_depth Queued",
+        "# TYPE queue_depth gauge",
+        'queue_depth{project="p"} 3',
+    ]
+
+
+@pytest.mark.unit
+def test_histogram_buckets_are_cumulative():
+    """Test histogram buckets count every observation at or below them."""
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency", (1.0, 5.0))
+
+    for value in (0.5, 1.0, 3.0, 10.0):
+        latency.observe(value, model="gpt")
+
+    lines = registry.render().splitlines()
+
+    assert lines[2:] == [
+        'latency_seconds_bucket{model="gpt",le="1"} 2',
+        'latency_seconds_bucket{model="gpt",le="5"} 3',
+        'latency_seconds_bucket{model="gpt",le="+Inf"} 4',
+        'latency_seconds_sum{model="gpt"} 14.5',
+        'latency_seconds_count{model="gpt"} 4',
+    ]
@@ -0,0 +1,87 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import pytest
+
+from app.utils.model_usage import (
+    ModelUsageTracker,
+    cached_prompt_tokens,
+    model_price,
+)
+
+
+@pytest.mark.unit
+def test_model_price_matches_longest_prefix():
+    """Test dated model names are priced by their family."""
+    assert model_price("gpt-4o-mini-2024-07-18") == (0.15, 0.6)
+    assert model_price("gpt-4o-2024-08-06") == (2.5, 10.0)
+    assert model_price("my-local-model") is None
+
+
+@pytest.mark.unit
+def test_usage_report_per_role():
+    """Test calls are summed per role with latency and cost."""
+    tracker = ModelUsageTracker()
+    usage = {"prompt_tokens": 1_000_000, "completion_tokens": 100_000}
+    tracker.record("coordinator_agent", "gpt-4o-mini", 0.5, usage)
+    tracker.record("coordinator_agent", "gpt-4o-mini", 1.5, usage)
+    tracker.record("developer_agent", "local", 4.0)
+
+    report = tracker.report()
+
+    assert list(report) == ["developer_agent", "coordinator_agent"]
+    assert report["coordinator_agent"]["calls"] == 2
+    assert report["coordinator_agent"]["avg_seconds"] == 1.0
+    assert report["coordinator_agent"]["cost_usd"] == pytest.approx(0.42)
+    assert report["developer_agent"]["cost_usd"] is None
+
+
+@pytest.mark.unit
+def test_cached_prompt_tokens_provider_shapes():
+    """Test cache hits are read from OpenAI and Anthropic usage."""
+    openai = {"prompt_tokens_details": {"cached_tokens": 1024}}
+    anthropic = {"cache_read_input_tokens": 2048}
+
+    assert cached_prompt_tokens(openai) == 1024
+    assert cached_prompt_tokens(anthropic) == 2048
+    assert cached_prompt_tokens({"prompt_tokens": 10}) == 0
+
+
+@pytest.mark.unit
+def test_usage_report_cache_hit_rate():
+    """Test the report shows the share of prompt tokens served from cache."""
+    tracker = ModelUsageTracker()
+    tracker.record("developer_agent", "gpt-4o", 1.0, {"prompt_tokens": 4000})
+    tracker.record_cache_hit("developer_agent", "gpt-4o", 3000)
+    tracker.record("browser_agent", "gpt-4o", 1.0)
+
+    report = tracker.report()
+
+    assert report["developer_agent"]["cached_prompt_tokens"] == 3000
+    assert report["developer_agent"]["cache_hit_rate"] == 0.75
+    assert report["browser_agent"]["cache_hit_rate"] is None
+
+
+@pytest.mark.unit
+def test_usage_report_role_with_only_cache_hits():
+    """Test a role with cache hits but no finished call is reported."""
+    tracker = ModelUsageTracker()
+    tracker.record_cache_hit("developer_agent", "gpt-4o", 3000)
+
+    report = tracker.report()
+
+    assert report["developer_agent"]["calls"] == 0
+    assert report["developer_agent"]["avg_seconds"] is None
+    assert report["developer_agent"]["cached_prompt_tokens"] == 3000
+    assert report["developer_agent"]["cache_hit_rate"] is None
@@ -0,0 +1,72 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import pytest
+from camel.tasks import Task
+
+from app.utils.quality_precheck import (
+    QualityPreCheckConfig,
+    expected_files_written,
+    non_empty_result,
+)
+
+
+@pytest.mark.unit
+def test_non_empty_result_respects_min_length():
+    """Test short or placeholder results are left to the LLM."""
+    config = QualityPreCheckConfig(min_result_length=10)
+    task = Task(content="Research topic Y", id="task_1")
+
+    task.result = "Too short"
+    assert not non_empty_result(task, config)
+    task.result = "Topic Y has three well documented open problems."
+    assert non_empty_result(task, config)
+
+
+@pytest.mark.unit
+def test_expected_files_written(tmp_path):
+    """Test files named in the subtask must exist in the working dir."""
+    config = QualityPreCheckConfig(working_directory=str(tmp_path))
+    task = Task(content="Write report.md based on example.com", id="t")
+
+    assert not expected_files_written(task, config)
+    (tmp_path / "out").mkdir()
+    (tmp_path / "out" / "report.md").write_text("# Report")
+    assert expected_files_written(task, config)
+    assert expected_files_written(
+        Task(content="Research topic Y", id="t2"), config
+    )
+    assert not expected_files_written(task, QualityPreCheckConfig())
+
+
+@pytest.mark.unit
+def test_expected_files_written_bounds_search(tmp_path):
+    """Test files nested past the search depth are not looked for."""
+    task = Task(content="Write report.md", id="t")
+    nested = tmp_path / "a" / "b" / "c"
+    nested.mkdir(parents=True)
+    (nested / "report.md").write_text("# Report")
+
+    assert not expected_files_written(
+        task,
+        QualityPreCheckConfig(
+            working_directory=str(tmp_path), max_file_search_depth=2
+        ),
+    )
+    assert expected_files_written(
+        task,
+        QualityPreCheckConfig(
+            working_directory=str(tmp_path), max_file_search_depth=3
+        ),
+    )
@@ -0,0 +1,77 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import threading
+import time
+
+import pytest
+
+from app.utils.sampling_profiler import TRUNCATED, SamplingProfiler
+
+
+def _busy_until(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+@pytest.mark.unit
+def test_samples_busy_thread_as_folded_stacks():
+    """Test a busy thread shows up under its name in folded stacks."""
+    stop = threading.Event()
+    worker = threading.Thread(
+        target=_busy_until, args=(stop,), name="busy-worker"
+    )
+    worker.start()
+    profiler = SamplingProfiler(interval=0.005)
+    profiler.start()
+    time.sleep(0.2)
+    profiler.stop()
+    stop.set()
+    worker.join()
+
+    assert not profiler.running
+    assert profiler.samples > 0
+    lines = profiler.folded().splitlines()
+    busy = [line for line in lines if line.startswith("busy-worker;")]
+    assert busy
+    stack, count = busy[0].rsplit(" ", 1)
+    assert int(count) > 0
+    assert "_busy_until (test_sampling_profiler.py:" in stack
+    assert not any("sampling-profiler" in line for line in lines)
+
+
+@pytest.mark.unit
+def test_distinct_stacks_are_capped():
+    """Test samples beyond max_stacks are counted as truncated."""
+    profiler = SamplingProfiler(max_stacks=1, include_idle=True)
+    profiler._stacks["a;b"] = 3
+
+    # Sample from a helper thread so the test thread itself is sampled
+    sampler = threading.Thread(target=profiler._sample, args=(-1,))
+    sampler.start()
+    sampler.join()
+
+    assert set(profiler._stacks) == {"a;b", TRUNCATED}
+
+
+@pytest.mark.unit
+def test_start_twice_is_rejected():
+    """Test a profiler instance profiles only once."""
+    profiler = SamplingProfiler()
+    profiler.start()
+    try:
+        with pytest.raises(RuntimeError):
+            profiler.start()
+    finally:
+        profiler.stop()
@@ -468,6 +468,107 @@ class TestSingleAgentWorker:
             assert result == TaskState.FAILED
             mock_return_agent.assert_called_once_with(mock_worker_agent)
 
+    @pytest.mark.asyncio
+    async def test_process_task_memo_round_trip(self, tmp_path):
+        """Test a memoized result is reused for an identical subtask."""
+        from app.utils.subtask_memo import SubtaskMemoStore
+
+        mock_worker = MagicMock(spec=ListenChatAgent)
+        mock_worker.role_name = "test_worker"
+        mock_worker.agent_id = "worker_123"
+        mock_worker.agent_name = "test_worker"
+        mock_worker.api_task_id = "test_api_task"
+        mock_worker.model_backend = MagicMock(model_type="gpt-4o")
+
+        worker = SingleAgentWorker(
+            description="Test worker",
+            worker=mock_worker,
+            use_structured_output_handler=True,
+            memo_store=SubtaskMemoStore(tmp_path / "memo.db"),
+            working_directory=str(tmp_path),
+        )
+        worker.structured_handler = MagicMock()
+        worker.structured_handler.parse_structured_response.return_value = (
+            TaskResult(content="Summary of document X", failed=False)
+        )
+
+        mock_worker_agent = AsyncMock()
+        mock_worker_agent.agent_id = "pooled_worker_123"
+        mock_response = MagicMock()
+        mock_response.msg.content = "Summary of document X"
+        mock_response.info = {"usage": {"total_tokens": 100}}
+        mock_worker_agent.astep.return_value = mock_response
+
+        with (
+            patch.object(
+                worker, "_get_worker_agent", return_value=mock_worker_agent
+            ) as mock_get_agent,
+            patch.object(worker, "_return_worker_agent"),
+            patch.object(
+                worker, "_get_dep_tasks_info", return_value="No dependencies"
+            ),
+        ):
+            first = Task(content="Summarise document X", id="run1.1")
+            assert await worker._process_task(first, []) == TaskState.DONE
+
+            second = Task(content="  Summarise   document X ", id="run2.1")
+            assert await worker._process_task(second, []) == TaskState.DONE
+
+        mock_get_agent.assert_called_once()
+        assert second.result == "Summary of document X"
+        assert second.additional_info["memo_hit"] is True
+        assert "memo_hit" not in first.additional_info
+
+    @pytest.mark.asyncio
+    async def test_process_task_cancelled_while_running(self):
+        """Test cancelling a subtask interrupts its in-flight model call."""
+        import asyncio
+
+        from app.service.task import TaskLock
+
+        mock_worker = MagicMock(spec=ListenChatAgent)
+        mock_worker.role_name = "test_worker"
+        mock_worker.agent_id = "worker_123"
+        mock_worker.agent_name = "test_worker"
+        mock_worker.api_task_id = "test_api_task"
+
+        worker = SingleAgentWorker(
+            description="Test worker", worker=mock_worker
+        )
+        task_lock = TaskLock("test_api_task", asyncio.Queue(), {})
+
+        async def slow_astep(*args, **kwargs):
+            await asyncio.sleep(10)
+
+        mock_worker_agent = AsyncMock()
+        mock_worker_agent.astep.side_effect = slow_astep
+        task = Task(content="Long running task", id="task_123")
+        asyncio.get_running_loop().call_later(
+            0.05, task_lock.cancel_subtask, "task_123", "removed"
+        )
+
+        with (
+            patch(
+                "app.utils.single_agent_worker.get_task_lock_if_exists",
+                return_value=task_lock,
+            ),
+            patch.object(
+                worker, "_get_worker_agent", return_value=mock_worker_agent
+            ),
+            patch.object(worker, "_return_worker_agent"),
+            patch.object(
+                worker, "_get_dep_tasks_info", return_value="No dependencies"
+            ),
+        ):
+            result = await asyncio.wait_for(
+                worker._process_task(task, []), timeout=1
+            )
+
+        assert result == TaskState.FAILED
+        assert task.result == "Task cancelled: removed"
+        assert task.additional_info["cancelled"] is True
+        assert "task_123" not in task_lock.subtask_tokens
+
     def test_worker_inherits_from_base_class(self):
         """Test that SingleAgentWorker inherits from BaseSingleAgentWorker."""
         from camel.societies.workforce.single_agent_worker import (
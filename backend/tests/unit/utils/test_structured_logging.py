@@ -0,0 +1,132 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import atexit
+import json
+import logging
+
+import pytest
+
+from app.utils.structured_logging import (
+    JsonFormatter,
+    RateLimitFilter,
+    SamplingFilter,
+    parse_sampling,
+    setup_logging,
+)
+
+
+def _record(
+    name: str = "task_service",
+    level: int = logging.DEBUG,
+    lineno: int = 1,
+    **extra,
+) -> logging.LogRecord:
+    record = logging.LogRecord(
+        name, level, "task.py", lineno, "Adding %s", ("item",), None
+    )
+    record.__dict__.update(extra)
+    return record
+
+
+@pytest.mark.unit
+def test_json_formatter_includes_extra_fields():
+    """Test records render as JSON with their extra fields."""
+    entry = json.loads(JsonFormatter().format(_record(task_id="t1")))
+
+    assert entry["message"] == "Adding item"
+    assert entry["logger"] == "task_service"
+    assert entry["level"] == "DEBUG"
+    assert entry["task_id"] == "t1"
+    assert "lineno" not in entry
+
+
+@pytest.mark.unit
+def test_sampling_keeps_one_in_n_below_warning():
+    """Test sampled loggers and their children keep one in N records."""
+    sampling = SamplingFilter({"task_service": 10})
+
+    kept = [sampling.filter(_record()) for _ in range(30)]
+    child = [sampling.filter(_record("task_service.queue")) for _ in range(5)]
+
+    assert sum(kept) == 3
+    assert sum(child) == 1
+    assert all(
+        sampling.filter(_record(level=logging.WARNING)) for _ in range(5)
+    )
+    assert all(sampling.filter(_record("other")) for _ in range(5))
+
+
+@pytest.mark.unit
+def test_rate_limit_per_call_site(monkeypatch):
+    """Test a call site is limited per window and reports drops."""
+    now = [0.0]
+    monkeypatch.setattr(
+        "app.utils.structured_logging.time.monotonic", lambda: now[0]
+    )
+    limit = RateLimitFilter(burst=3, window=10)
+
+    first = [limit.filter(_record()) for _ in range(5)]
+    other_site = limit.filter(_record(lineno=2))
+    now[0] = 10.0
+    resumed = _record()
+
+    assert first == [True, True, True, False, False]
+    assert other_site
+    assert limit.filter(resumed)
+    assert resumed.suppressed == 2
+
+
+@pytest.mark.unit
+def test_rate_limit_passes_warnings():
+    """Test warnings and errors are never rate limited."""
+    limit = RateLimitFilter(burst=1, window=10)
+
+    assert limit.filter(_record())
+    assert not limit.filter(_record())
+    assert all(limit.filter(_record(level=logging.WARNING)) for _ in range(5))
+    assert limit.filter(_record(level=logging.ERROR))
+
+
+@pytest.mark.unit
+def test_parse_sampling_skips_invalid_entries():
+    """Test sampling config parsing ignores malformed entries."""
+    assert parse_sampling("task_service=10, toolkit_listen=5,bad,x=y") == {
+        "task_service": 10,
+        "toolkit_listen": 5,
+    }
+    assert parse_sampling(None) == {}
+
+
+@pytest.mark.unit
+def test_setup_logging_writes_from_listener_thread(capsys):
+    """Test records reach the output through the queue listener."""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    listener = setup_logging(level="INFO", log_format="json", sampling={})
+    try:
+        logging.getLogger("pipeline_test").info(
+            "hello %s", "world", extra={"project_id": "p1"}
+        )
+        logging.getLogger("pipeline_test").debug("hidden")
+    finally:
+        listener.stop()
+        atexit.unregister(listener.stop)
+        root.handlers[:] = handlers
+        root.setLevel(level)
+
+    lines = capsys.readouterr().err.strip().splitlines()
+    entries = [json.loads(line) for line in lines]
+    assert [entry["message"] for entry in entries] == ["hello world"]
+    assert entries[0]["project_id"] == "p1"
@@ -0,0 +1,60 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+from unittest.mock import patch
+
+import pytest
+
+from app.utils.subtask_memo import SubtaskMemoStore, memo_key
+
+
+@pytest.mark.unit
+def test_memo_key_normalizes_content_and_dependency_order():
+    """Test whitespace and dependency order do not change the key."""
+    args = ("Browser", "gpt-4o", "/work/a")
+    key = memo_key("Research  topic Y", ["a", "b"], *args)
+
+    assert key == memo_key(" Research topic Y\n", ["b", "a"], *args)
+    assert key != memo_key("Research topic Y", ["a", "c"], *args)
+    assert key != memo_key(
+        "Research topic Y", ["a", "b"], "Developer", "gpt-4o", "/work/a"
+    )
+    assert key != memo_key(
+        "Research topic Y", ["a", "b"], "Browser", "gpt-5", "/work/a"
+    )
+
+
+@pytest.mark.unit
+def test_memo_key_is_scoped_to_working_directory():
+    """Test a result is not shared with another project's workspace."""
+    key = memo_key("Write report.md", [], "Document", "gpt-4o", "/work/a")
+
+    assert key != memo_key(
+        "Write report.md", [], "Document", "gpt-4o", "/work/b"
+    )
+
+
+@pytest.mark.unit
+def test_memo_store_expires_entries(tmp_path):
+    """Test cached results are dropped once their TTL elapses."""
+    store = SubtaskMemoStore(tmp_path / "memo.db", ttl_seconds=60)
+
+    assert store.get("key") is None
+    with patch("app.utils.subtask_memo.time.time", return_value=1000.0):
+        store.put("key", "result")
+    with patch("app.utils.subtask_memo.time.time", return_value=1059.0):
+        assert store.get("key") == "result"
+    with patch("app.utils.subtask_memo.time.time", return_value=1060.0):
+        assert store.get("key") is None
+    assert store.get("key") is None
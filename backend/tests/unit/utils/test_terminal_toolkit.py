@@ -19,7 +19,10 @@ import time
 import pytest
 
 from app.service.task import TaskLock, task_locks
-from app.utils.toolkit.terminal_toolkit import TerminalToolkit
+from app.utils.toolkit.terminal_toolkit import (
+    TerminalToolkit,
+    _kill_process_tree,
+)
 
 
 @pytest.mark.unit
@@ -125,3 +128,81 @@ class TestTerminalToolkit:
                 )
             else:
                 raise
+
+    def test_shell_exec_returns_output(self, tmp_path):
+        """Test blocking commands still return their output."""
+        test_api_task_id = "test_api_task_cancel"
+        task_locks[test_api_task_id] = TaskLock(
+            id=test_api_task_id, queue=asyncio.Queue(), human_input={}
+        )
+        try:
+            toolkit = TerminalToolkit(
+                test_api_task_id, working_directory=str(tmp_path)
+            )
+            assert toolkit.shell_exec("echo hello").strip() == "hello"
+            assert toolkit.shell_exec("true") == (
+                "Command executed successfully (no output)."
+            )
+        finally:
+            task_locks.pop(test_api_task_id, None)
+
+    def test_shell_exec_killed_on_cancel(self, tmp_path):
+        """Test cancelling the project kills a running blocking command."""
+        test_api_task_id = "test_api_task_cancel"
+        task_lock = TaskLock(
+            id=test_api_task_id, queue=asyncio.Queue(), human_input={}
+        )
+        task_locks[test_api_task_id] = task_lock
+        try:
+            toolkit = TerminalToolkit(
+                test_api_task_id, working_directory=str(tmp_path)
+            )
+            timer = threading.Timer(
+                0.3, task_lock.cancel_running_work, args=("stop",)
+            )
+            timer.start()
+            start = time.monotonic()
+            result = toolkit.shell_exec("sleep 20; echo done", timeout=20)
+
+            assert result == "Command cancelled: stop"
+            assert time.monotonic() - start < 2
+            assert toolkit.shell_sessions == {}
+        finally:
+            task_locks.pop(test_api_task_id, None)
+
+    def test_shell_exec_returns_long_output(self, tmp_path):
+        """Test blocking commands return all of a long output."""
+        test_api_task_id = "test_api_task_cancel"
+        task_locks[test_api_task_id] = TaskLock(
+            id=test_api_task_id, queue=asyncio.Queue(), human_input={}
+        )
+        try:
+            toolkit = TerminalToolkit(
+                test_api_task_id, working_directory=str(tmp_path)
+            )
+            lines = toolkit.shell_exec("seq 1 20000").split()
+
+            assert len(lines) == 20000
+            assert lines[-1] == "20000"
+            assert toolkit.shell_sessions == {}
+        finally:
+            task_locks.pop(test_api_task_id, None)
+
+    def test_shell_exec_timeout_becomes_session(self, tmp_path):
+        """Test a blocking command that times out keeps running as a
+        session."""
+        test_api_task_id = "test_api_task_cancel"
+        task_locks[test_api_task_id] = TaskLock(
+            id=test_api_task_id, queue=asyncio.Queue(), human_input={}
+        )
+        try:
+            toolkit = TerminalToolkit(
+                test_api_task_id, working_directory=str(tmp_path)
+            )
+            result = toolkit.shell_exec("sleep 20", id="slow", timeout=0.2)
+
+            assert "session 'slow'" in result
+            assert toolkit.shell_sessions["slow"]["timeout_converted"]
+            _kill_process_tree(toolkit.shell_sessions["slow"]["process"])
+        finally:
+            task_locks.pop(test_api_task_id, None)
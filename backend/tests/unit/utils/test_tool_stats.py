@@ -0,0 +1,48 @@
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import pytest
+
+from app.utils.tool_stats import ToolStatsTracker, payload_size
+
+
+@pytest.mark.unit
+def test_payload_size():
+    """Test sizes are estimated without serializing the values."""
+    assert payload_size(None) == 0
+    assert payload_size("héllo") == 5
+    assert payload_size(b"\x00\x01") == 2
+    assert payload_size({"a": 1, "b": [True, "xy"]}) == 1 + 1 + 1 + 4 + 2
+    assert payload_size([[[["deep"]]]]) == 8
+    assert payload_size(object()) == 8
+
+
+@pytest.mark.unit
+def test_report_percentiles_slowest_tool_first():
+    """Test tools are ranked by total time with latency percentiles."""
+    tracker = ToolStatsTracker()
+    for seconds in range(1, 101):
+        tracker.record("Terminal Toolkit", "shell_exec", "dev", seconds / 100)
+    tracker.record("Search Toolkit", "search_google", "browser", 0.1)
+
+    report = tracker.report()
+
+    assert [row["method"] for row in report] == [
+        "shell_exec",
+        "search_google",
+    ]
+    assert report[0]["p50_seconds"] == 0.5
+    assert report[0]["p95_seconds"] == 0.95
+    assert report[0]["p99_seconds"] == 0.99
+    assert report[1]["calls"] == 1
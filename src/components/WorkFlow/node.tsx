@@ -767,6 +767,11 @@ export function Node({ id, data }: NodeProps) {
                               </div>
                             )
                           )}
+                          {task.cached && (
+                            <div className="rounded-lg bg-tag-surface-hover px-1 py-0.5 text-xs font-bold leading-none text-text-label">
+                              Cached
+                            </div>
+                          )}
                         </div>
                         <div>{task.content}</div>
                       </div>
@@ -0,0 +1,97 @@
+// ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+// ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+export type JsonPatchOperation =
+  | { op: 'add' | 'replace'; path: string; value: unknown }
+  | { op: 'remove'; path: string }
+  | { op: 'move'; from: string; path: string };
+
+function parsePointer(pointer: string): string[] {
+  return pointer
+    .split('/')
+    .slice(1)
+    .map((token) => token.replace(/~1/g, '/').replace(/~0/g, '~'));
+}
+
+// Copy every container on the way down so the input is never mutated and
+// untouched branches keep their identity.
+function resolveParent(root: any, tokens: string[]): any {
+  let node = root;
+  for (const token of tokens.slice(0, -1)) {
+    const key = Array.isArray(node) ? Number(token) : token;
+    const child = node[key];
+    node[key] = Array.isArray(child) ? [...child] : { ...child };
+    node = node[key];
+  }
+  return node;
+}
+
+function removeAt(root: any, pointer: string): unknown {
+  const tokens = parsePointer(pointer);
+  const parent = resolveParent(root, tokens);
+  const key = tokens[tokens.length - 1];
+  if (Array.isArray(parent)) {
+    return parent.splice(Number(key), 1)[0];
+  }
+  const value = parent[key];
+  delete parent[key];
+  return value;
+}
+
+function insertAt(
+  root: any,
+  pointer: string,
+  value: unknown,
+  replace: boolean
+): void {
+  const tokens = parsePointer(pointer);
+  const parent = resolveParent(root, tokens);
+  const key = tokens[tokens.length - 1];
+  if (Array.isArray(parent)) {
+    const index = key === '-' ? parent.length : Number(key);
+    parent.splice(index, replace ? 1 : 0, value);
+  } else {
+    parent[key] = value;
+  }
+}
+
+/**
+ * Apply a JSON Patch (RFC 6902) without mutating `document`.
+ * Used for `sub_tasks_patch` SSE events, which carry only the changes to
+ * the subtask tree instead of the whole tree.
+ */
+export function applyJsonPatch<T>(
+  document: T,
+  operations: JsonPatchOperation[]
+): T {
+  const root = { value: document };
+  for (const operation of operations) {
+    const path = `/value${operation.path}`;
+    switch (operation.op) {
+      case 'add':
+        insertAt(root, path, operation.value, false);
+        break;
+      case 'replace':
+        insertAt(root, path, operation.value, true);
+        break;
+      case 'remove':
+        removeAt(root, path);
+        break;
+      case 'move':
+        insertAt(root, path, removeAt(root, `/value${operation.from}`), false);
+        break;
+    }
+  }
+  return root.value;
+}
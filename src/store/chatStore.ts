@@ -26,6 +26,7 @@ import {
 import { showCreditsToast } from '@/components/Toast/creditsToast';
 import { showStorageToast } from '@/components/Toast/storageToast';
 import { generateUniqueId, uploadLog } from '@/lib';
+import { applyJsonPatch } from '@/lib/jsonPatch';
 import {
   AgentMessageStatus,
   AgentStatusValue,
@@ -1144,6 +1145,20 @@ const chatStore = (initial?: Partial<ChatStore>) =>
             );
             return;
           }
+          if (agentMessages.step === AgentStep.SUB_TASKS_PATCH) {
+            const patch = agentMessages.data.patch;
+            if (!patch?.length) return;
+            // The patch is relative to the list this client sent on confirm
+            setTaskInfo(
+              currentTaskId,
+              applyJsonPatch(tasks[currentTaskId].taskInfo, patch)
+            );
+            setTaskRunning(
+              currentTaskId,
+              applyJsonPatch(tasks[currentTaskId].taskRunning, patch)
+            );
+            return;
+          }
           // Create agent
           if (agentMessages.step === AgentStep.CREATE_AGENT) {
             const { agent_name, agent_id } = agentMessages.data;
@@ -1241,7 +1256,7 @@ const chatStore = (initial?: Partial<ChatStore>) =>
           }
           // Task State
           if (agentMessages.step === AgentStep.TASK_STATE) {
-            const { state, task_id, result, failure_count } =
+            const { state, task_id, result, failure_count, cached } =
               agentMessages.data;
             if (!state && !task_id) return;
 
@@ -1264,6 +1279,8 @@ const chatStore = (initial?: Partial<ChatStore>) =>
               taskAssigning[targetTaskAssigningIndex].tasks[
                 taskIndex
               ].failure_count = failure_count || 0;
+              taskAssigning[targetTaskAssigningIndex].tasks[taskIndex].cached =
+                !!cached;
 
               // destroy webview
               tasks[currentTaskId].taskAssigning = tasks[
@@ -1310,6 +1327,7 @@ const chatStore = (initial?: Partial<ChatStore>) =>
               console.log('targetTaskIndex', targetTaskIndex, state);
               taskRunning[targetTaskIndex].status =
                 state === 'DONE' ? TaskStatus.COMPLETED : TaskStatus.FAILED;
+              taskRunning[targetTaskIndex].cached = !!cached;
             }
             setTaskRunning(currentTaskId, taskRunning);
             setTaskAssigning(currentTaskId, taskAssigning);
@@ -2276,6 +2294,8 @@ const chatStore = (initial?: Partial<ChatStore>) =>
             return;
           }
           if (agentMessages.step === AgentStep.SYNC) return;
+          // Per-tool summary for diagnostics, also served by /tool-stats
+          if (agentMessages.step === AgentStep.TOOL_STATS) return;
           if (agentMessages.step === AgentStep.ASK) {
             if (tasks[currentTaskId].activeAsk != '') {
               const newMessage: Message = {
@@ -13,6 +13,7 @@
 // ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
 
 import type { AgentStepType, AgentMessageStatusType, TaskStatusType, ChatTaskStatusType, AgentStatusType } from './constants';
+import type { JsonPatchOperation } from '@/lib/jsonPatch';
 
 // Global type definitions for ChatBox component
 
@@ -55,6 +56,7 @@ declare global {
     }[];
     failure_count?: number;
     reAssignTo?: string;
+    cached?: boolean;
   }
 
   interface File {
@@ -116,8 +118,10 @@ declare global {
     data: {
       project_id?: string;
       failure_count?: number;
+      cached?: boolean;
       tokens?: number;
       sub_tasks?: TaskInfo[];
+      patch?: JsonPatchOperation[];
       summary_task?: string;
       content?: string;
       notice?: string;
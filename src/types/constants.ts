@@ -22,6 +22,7 @@ export const AgentStep = {
 	WAIT_CONFIRM: 'wait_confirm',
 	DECOMPOSE_TEXT: 'decompose_text',
 	TO_SUB_TASKS: 'to_sub_tasks',
+	SUB_TASKS_PATCH: 'sub_tasks_patch',
 	CREATE_AGENT: 'create_agent',
 	TASK_STATE: 'task_state',
 	ACTIVATE_AGENT: 'activate_agent',
@@ -39,6 +40,7 @@ export const AgentStep = {
 	NOTICE: 'notice',
 	ASK: 'ask',
 	SYNC: 'sync',
+	TOOL_STATS: 'tool_stats',
 	NOTICE_CARD: 'notice_card',
 	FAILED: 'failed',
 	AGENT_SUMMARY_END: 'agent_summary_end',
@@ -0,0 +1,44 @@
+// ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+// ========= Copyright 2025-2026 @ Eigent.ai All Rights Reserved. =========
+
+import { applyJsonPatch } from '@/lib/jsonPatch';
+import { describe, expect, it } from 'vitest';
+
+describe('applyJsonPatch', () => {
+  const tasks = [
+    { id: '1.1', content: 'first' },
+    { id: '', content: 'new' },
+    { id: '1.2', content: 'second' },
+  ];
+
+  it('applies remove, add, move and replace in order', () => {
+    const result = applyJsonPatch(tasks, [
+      { op: 'remove', path: '/1' },
+      { op: 'move', from: '/1', path: '/0' },
+      { op: 'replace', path: '/1/content', value: 'edited' },
+      { op: 'add', path: '/2', value: { id: '1.3', content: 'new' } },
+    ]);
+
+    expect(result).toEqual([
+      { id: '1.2', content: 'second' },
+      { id: '1.1', content: 'edited' },
+      { id: '1.3', content: 'new' },
+    ]);
+  });
+
+  it('does not mutate the input document', () => {
+    applyJsonPatch(tasks, [{ op: 'remove', path: '/0' }]);
+    expect(tasks).toHaveLength(3);
+  });
+});